@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+SSL Certificate Checker 벤치마크
+cryptography 빌더 API로 합성 인증서 코퍼스를 오프라인 생성하고
+분석 엔진(CertificateAnalyzer)의 처리량과 메모리 사용량을 측정합니다.
+
+사용법:
+python benchmarks/bench_ssl_checker.py                       # 측정 후 결과 출력
+python benchmarks/bench_ssl_checker.py --save-baseline       # 기준값 저장 (커밋된 baselines/baseline.json 재생성은 --repeat 5)
+python benchmarks/bench_ssl_checker.py --compare             # 기준값과 비교 (회귀 시 종료코드 1)
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cryptography
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+
+from ssl_checker_v3 import CertificateAnalyzer, split_pem_blocks
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baselines', 'baseline.json')
+PFX_PASSWORD = 'bench-password'
+
+
+# ===== 코퍼스 생성 =====
+
+class CorpusBuilder:
+    """합성 인증서 코퍼스 생성기 (네트워크/OpenSSL 불필요)"""
+
+    def __init__(self, seed=0, key_pool_size=4):
+        self.random = random.Random(seed)
+        self.now = datetime.now(timezone.utc)
+        # RSA 키 생성이 가장 비싸므로 소수의 키를 재사용
+        self.rsa_keys = [rsa.generate_private_key(public_exponent=65537, key_size=2048)
+                         for _ in range(key_pool_size)]
+        self.ec_keys = [ec.generate_private_key(ec.SECP256R1()) for _ in range(key_pool_size)]
+        self.serial = 1000
+
+    def pick_key(self, kind):
+        pool = self.rsa_keys if kind == 'rsa' else self.ec_keys
+        return self.random.choice(pool)
+
+    def make_name(self, cn, org='Bench Org'):
+        return x509.Name([
+            x509.NameAttribute(NameOID.COUNTRY_NAME, 'KR'),
+            x509.NameAttribute(NameOID.ORGANIZATION_NAME, org),
+            x509.NameAttribute(NameOID.COMMON_NAME, cn),
+        ])
+
+    def make_cert(self, subject, issuer, key, issuer_key, is_ca, san=None, days=365):
+        self.serial += 1
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(issuer)
+            .public_key(key.public_key())
+            .serial_number(self.serial)
+            .not_valid_before(self.now - timedelta(days=1))
+            .not_valid_after(self.now + timedelta(days=days))
+            .add_extension(x509.BasicConstraints(ca=is_ca, path_length=None), critical=True)
+            .add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+            .add_extension(x509.AuthorityKeyIdentifier.from_issuer_public_key(issuer_key.public_key()),
+                           critical=False)
+        )
+        if is_ca:
+            builder = builder.add_extension(x509.KeyUsage(
+                digital_signature=True, content_commitment=False, key_encipherment=False,
+                data_encipherment=False, key_agreement=False, key_cert_sign=True, crl_sign=True,
+                encipher_only=False, decipher_only=False), critical=True)
+        else:
+            builder = builder.add_extension(x509.KeyUsage(
+                digital_signature=True, content_commitment=False, key_encipherment=True,
+                data_encipherment=False, key_agreement=False, key_cert_sign=False, crl_sign=False,
+                encipher_only=False, decipher_only=False), critical=True)
+            builder = builder.add_extension(
+                x509.ExtendedKeyUsage([ExtendedKeyUsageOID.SERVER_AUTH, ExtendedKeyUsageOID.CLIENT_AUTH]),
+                critical=False)
+        if san:
+            builder = builder.add_extension(
+                x509.SubjectAlternativeName([x509.DNSName(d) for d in san]), critical=False)
+        return builder.sign(issuer_key, hashes.SHA256())
+
+    def make_chain(self, depth, leaf_kind='rsa', label='bench'):
+        """leaf → 중간 CA들 → 루트 순서의 (인증서, 키) 목록 생성 (depth = 전체 단계 수)"""
+        root_key = self.pick_key('rsa')
+        root_name = self.make_name(f'{label} Root CA')
+        root = self.make_cert(root_name, root_name, root_key, root_key, True, days=3650)
+        chain = [(root, root_key)]
+        for level in range(depth - 2):
+            parent_cert, parent_key = chain[-1]
+            key = self.pick_key('rsa')
+            name = self.make_name(f'{label} Intermediate CA {level + 1}')
+            chain.append((self.make_cert(name, parent_cert.subject, key, parent_key, True, days=1825), key))
+        parent_cert, parent_key = chain[-1]
+        leaf_key = self.pick_key(leaf_kind)
+        host = f'{label}.example.com'
+        leaf = self.make_cert(self.make_name(host), parent_cert.subject, leaf_key, parent_key, False,
+                              san=[host, f'www.{host}', f'*.{host}'])
+        chain.append((leaf, leaf_key))
+        chain.reverse()
+        return chain
+
+    @staticmethod
+    def to_pem(certs):
+        return b''.join(c.public_bytes(serialization.Encoding.PEM) for c in certs)
+
+    def write_corpus(self, out_dir, leaves=20, chains_per_depth=5, ca_bundle_size=150, pfx_count=5):
+        """코퍼스를 디렉토리에 기록하고 워크로드별 파일 목록 반환"""
+        corpus = {'single': [], 'chain': [], 'shuffled': [], 'ca_bundle': [], 'pfx': [], 'der': []}
+
+        for i in range(leaves):
+            kind = 'rsa' if i % 2 == 0 else 'ec'
+            leaf_cert, _ = self.make_chain(2, kind, label=f'leaf{i}')[0]
+            path = os.path.join(out_dir, f'leaf_{kind}_{i}.pem')
+            with open(path, 'wb') as f:
+                f.write(self.to_pem([leaf_cert]))
+            corpus['single'].append(path)
+            if i < leaves // 4:
+                der_path = os.path.join(out_dir, f'leaf_{kind}_{i}.der')
+                with open(der_path, 'wb') as f:
+                    f.write(leaf_cert.public_bytes(serialization.Encoding.DER))
+                corpus['der'].append(der_path)
+
+        for depth in range(2, 6):
+            for i in range(chains_per_depth):
+                kind = 'rsa' if i % 2 == 0 else 'ec'
+                certs = [c for c, _ in self.make_chain(depth, kind, label=f'chain{depth}-{i}')]
+                path = os.path.join(out_dir, f'chain_d{depth}_{i}.pem')
+                with open(path, 'wb') as f:
+                    f.write(self.to_pem(certs))
+                corpus['chain'].append(path)
+
+                shuffled = certs[:]
+                while len(shuffled) > 1 and shuffled == certs:
+                    self.random.shuffle(shuffled)
+                path = os.path.join(out_dir, f'shuffled_d{depth}_{i}.pem')
+                with open(path, 'wb') as f:
+                    f.write(self.to_pem(shuffled))
+                corpus['shuffled'].append(path)
+
+        roots = []
+        for i in range(ca_bundle_size):
+            key = self.pick_key('rsa' if i % 3 else 'ec')
+            name = self.make_name(f'Bundle Root CA {i}', org=f'Bundle Org {i % 17}')
+            roots.append(self.make_cert(name, name, key, key, True, days=3650))
+        path = os.path.join(out_dir, 'ca_bundle.pem')
+        with open(path, 'wb') as f:
+            f.write(self.to_pem(roots))
+        corpus['ca_bundle'].append(path)
+
+        encryption = (
+            serialization.PrivateFormat.PKCS12.encryption_builder()
+            .kdf_rounds(50000)
+            .key_cert_algorithm(pkcs12.PBES.PBESv2SHA256AndAES256CBC)
+            .hmac_hash(hashes.SHA256())
+            .build(PFX_PASSWORD.encode('utf-8'))
+        )
+        for i in range(pfx_count):
+            chain = self.make_chain(3 + i % 3, 'rsa', label=f'pfx{i}')
+            leaf_cert, leaf_key = chain[0]
+            data = pkcs12.serialize_key_and_certificates(
+                f'pfx{i}'.encode('ascii'), leaf_key, leaf_cert, [c for c, _ in chain[1:]], encryption)
+            path = os.path.join(out_dir, f'bundle_{i}.pfx')
+            with open(path, 'wb') as f:
+                f.write(data)
+            corpus['pfx'].append(path)
+
+        return corpus
+
+
+# ===== 측정 =====
+
+def measure(func, items, repeat, unit_count=None):
+    """items 전체를 func로 처리하는 시간을 repeat회 측정하고 마지막에 메모리 피크 측정
+
+    unit_count: 처리량 계산 단위 수 (기본: len(items), 배치 호출은 파일 수)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    for item in items:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    count = len(items) if unit_count is None else unit_count
+    return {
+        'items': count,
+        'median_s': round(median, 6),
+        'best_s': round(min(timings), 6),
+        'items_per_sec': round(count / median, 2) if median > 0 else None,
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def read_chain_blocks(path):
+    """체인 검증 워크로드용 PEM 블록 (파일 I/O와 블록 분리를 측정에서 제외)"""
+    with open(path, 'rb') as f:
+        return [block.data for block in split_pem_blocks(f.read()) if block.kind == 'certificate']
+
+
+def run_workloads(corpus, repeat, selected=None, pfx_workers=None):
+    analyzer = CertificateAnalyzer(pfx_password=PFX_PASSWORD, pfx_workers=pfx_workers)
+    batch_files = corpus['single'] + corpus['der'] + corpus['chain'] + corpus['shuffled'] + corpus['pfx']
+    chain_blocks = [read_chain_blocks(p) for p in corpus['chain'] + corpus['shuffled']]
+
+    workloads = {
+        'single_pem': (analyzer.analyze_pem_certificate, corpus['single']),
+        'batch_mixed': (analyzer.analyze_certificate, batch_files),
+        'chain_files': (analyzer.analyze_pem_certificate, corpus['chain'] + corpus['shuffled']),
+        'chain_verify': (analyzer.verify_certificate_chain, chain_blocks),
+        'ca_bundle': (analyzer.analyze_pem_certificate, corpus['ca_bundle']),
+        # 후처리(finalize_result - 체인 유효기간 등)까지 거치는 번들 분석 경로
+        'ca_bundle_full': (analyzer.analyze_certificate, corpus['ca_bundle']),
+        'pfx': (analyzer.analyze_pkcs12_certificate, corpus['pfx']),
+        # 다중 파일 경로 (PFX는 프로세스 풀에서 복호화) - 한 번의 호출이 배치 전체
+        'batch_pool': (analyzer.analyze_batch, [batch_files]),
+    }
+
+    results = {}
+    for name, (func, items) in workloads.items():
+        if selected and name not in selected:
+            continue
+        unit_count = len(batch_files) if name == 'batch_pool' else None
+        results[name] = measure(func, items, repeat, unit_count)
+        print(f"  {name:<14} {results[name]['items_per_sec']:>10} items/s  "
+              f"median {results[name]['median_s']:.4f}s  peak {results[name]['peak_kib']} KiB")
+    analyzer.shutdown_pfx_pool()
+    return results
+
+
+# ===== 기준값 저장/비교 =====
+
+def build_report(results, args):
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'cryptography': cryptography.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'scale': args.scale,
+            'pfx_workers': args.pfx_workers,
+        },
+        'results': results,
+    }
+
+
+def compare_reports(baseline, current, tolerance):
+    """처리량 감소 또는 메모리 증가가 허용치를 넘으면 회귀 목록 반환"""
+    regressions = []
+    for name, base in baseline.get('results', {}).items():
+        cur = current['results'].get(name)
+        if not cur:
+            continue
+        base_rate, cur_rate = base.get('items_per_sec'), cur.get('items_per_sec')
+        if base_rate and cur_rate and cur_rate < base_rate * (1 - tolerance):
+            regressions.append(f"{name}: 처리량 {base_rate} → {cur_rate} items/s")
+        base_mem, cur_mem = base.get('peak_kib'), cur.get('peak_kib')
+        if base_mem and cur_mem and cur_mem > base_mem * (1 + tolerance):
+            regressions.append(f"{name}: 메모리 피크 {base_mem} → {cur_mem} KiB")
+        change = (cur_rate / base_rate - 1) * 100 if base_rate and cur_rate else 0.0
+        print(f"  {name:<14} {change:+6.1f}% 처리량")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SSL Certificate Checker 분석 엔진 벤치마크')
+    parser.add_argument('--repeat', type=int, default=3, help='워크로드별 반복 측정 횟수')
+    parser.add_argument('--scale', type=int, default=1, help='코퍼스 크기 배율')
+    parser.add_argument('--workload', action='append', help='특정 워크로드만 실행 (여러 번 지정 가능)')
+    parser.add_argument('--pfx-workers', type=int, help='PFX 복호화 프로세스 풀 크기 (0 = 풀 사용 안 함)')
+    parser.add_argument('--corpus-dir', help='코퍼스 생성 위치 (기본: 임시 디렉토리)')
+    parser.add_argument('--output', help='측정 결과 JSON 저장 경로')
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE, help='측정 결과를 기준값으로 저장')
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, help='기준값 JSON과 비교')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='회귀 판정 허용 비율 (기본 0.2 = 20%%)')
+    args = parser.parse_args()
+
+    # cryptography의 not_valid_before/after 경고는 측정과 무관 (측정 구간에서만 무시)
+    with warnings.catch_warnings(), tempfile.TemporaryDirectory() as tmp_dir:
+        warnings.simplefilter('ignore')
+        corpus_dir = args.corpus_dir or tmp_dir
+        os.makedirs(corpus_dir, exist_ok=True)
+        print(f"📦 코퍼스 생성 중... ({corpus_dir})")
+        start = time.perf_counter()
+        corpus = CorpusBuilder().write_corpus(
+            corpus_dir,
+            leaves=20 * args.scale,
+            chains_per_depth=5 * args.scale,
+            ca_bundle_size=150 * args.scale,
+            pfx_count=5 * args.scale,
+        )
+        print(f"   완료 ({time.perf_counter() - start:.1f}s, "
+              f"{sum(len(v) for v in corpus.values())}개 파일)")
+
+        print("⏱️ 측정 중...")
+        report = build_report(run_workloads(corpus, args.repeat, args.workload, args.pfx_workers), args)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 기준값 저장: {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"📊 기준값 비교: {args.compare}")
+        regressions = compare_reports(baseline, report, args.tolerance)
+        if regressions:
+            print("❌ 성능 회귀 감지:")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print("✅ 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,8 @@ pip install cryptography
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import re
+import mmap
 import threading
 from datetime import datetime, timezone
 import base64
@@ -41,6 +43,13 @@ except ImportError as e:
     exit(1)
 
 
+CERT_BLOCK_RE = re.compile(rb'-----BEGIN CERTIFICATE-----.*?-----END CERTIFICATE-----', re.DOTALL)
+# 파일 크기 상한 (메모리 보호용 안전 한도) - PEM 텍스트는 mmap으로 블록 단위 처리
+LARGE_BUNDLE_SIZE = 16 * 1024 * 1024          # 이보다 큰 PEM 묶음은 체인 검증 없이 개수만 집계
+MAX_PEM_FILE_SIZE = 4 * 1024 * 1024 * 1024    # PEM/CRT/CER
+MAX_BINARY_FILE_SIZE = 10 * 1024 * 1024       # DER/PFX (통째로 읽음)
+
+
 class PureSSLCertificateChecker:
     def __init__(self, root):
         self.root = root
@@ -185,9 +194,10 @@ class PureSSLCertificateChecker:
         if file_ext not in valid_extensions:
             return False, f"지원하지 않는 파일 형식입니다. ({', '.join(valid_extensions)})"
         
-        # 파일 크기 검증 (10MB 제한)
-        if os.path.getsize(filepath) > 10 * 1024 * 1024:
-            return False, "파일 크기가 너무 큽니다. (최대 10MB)"
+        # 파일 크기 검증 (PEM 텍스트는 mmap으로 읽으므로 안전 상한만 적용)
+        max_size = MAX_PEM_FILE_SIZE if file_ext in ['.pem', '.crt', '.cer'] else MAX_BINARY_FILE_SIZE
+        if os.path.getsize(filepath) > max_size:
+            return False, f"파일 크기가 너무 큽니다. (최대 {max_size // (1024 * 1024)}MB)"
         
         return True, "OK"
     
@@ -250,25 +260,19 @@ class PureSSLCertificateChecker:
     
     def analyze_pem_certificate(self, filepath):
         """PEM/CRT 인증서 분석"""
-        with open(filepath, 'rb') as f:
-            cert_data = f.read()
-        
-        # 여러 인증서가 있을 수 있으므로 분리
+        # 여러 인증서가 있을 수 있으므로 분리 (mmap으로 열어 블록 단위로 복사)
+        # 대용량 묶음은 첫 인증서만 보관하고 나머지는 개수만 셈
         cert_blocks = []
-        current_cert = b""
-        in_cert = False
-        
-        for line in cert_data.split(b'\n'):
-            if b'-----BEGIN CERTIFICATE-----' in line:
-                in_cert = True
-                current_cert = line + b'\n'
-            elif b'-----END CERTIFICATE-----' in line:
-                current_cert += line + b'\n'
-                cert_blocks.append(current_cert)
-                current_cert = b""
-                in_cert = False
-            elif in_cert:
-                current_cert += line + b'\n'
+        cert_count = 0
+        large_bundle = os.path.getsize(filepath) > LARGE_BUNDLE_SIZE
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("유효한 인증서를 찾을 수 없습니다.")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as cert_data:
+                for match in CERT_BLOCK_RE.finditer(cert_data):
+                    cert_count += 1
+                    if not large_bundle or not cert_blocks:
+                        cert_blocks.append(match.group(0) + b'\n')
         
         if not cert_blocks:
             raise ValueError("유효한 인증서를 찾을 수 없습니다.")
@@ -277,10 +281,13 @@ class PureSSLCertificateChecker:
         cert = x509.load_pem_x509_certificate(cert_blocks[0])
         
         result = self.extract_certificate_info(cert)
-        result['cert_count'] = len(cert_blocks)
+        result['cert_count'] = cert_count
         
         # 체인 검증 수행
-        if len(cert_blocks) > 1:
+        if large_bundle:
+            result['summary'] = (f"📚 대용량 인증서 묶음 ({cert_count:,}개) - 체인 검증 생략, 첫 인증서만 표시\n\n"
+                                 + result['summary'])
+        elif len(cert_blocks) > 1:
             chain_result = self.verify_certificate_chain(cert_blocks)
             chain_info = f"📦 인증서 체인 ({len(cert_blocks)}개) - {chain_result['status']}\n"
             if chain_result['details']:
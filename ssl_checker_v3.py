@@ -10,7 +10,29 @@ pip install cryptography
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
+import sys
+import re
 import threading
+import time
+import multiprocessing
+from multiprocessing.connection import wait as wait_connections
+import hashlib
+import ipaddress
+import json
+import struct
+import binascii
+import mmap
+import io
+import zipfile
+import tarfile
+import zlib
+import lzma
+from contextlib import contextmanager
+from array import array
+import http.client
+from urllib.parse import urlsplit
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 import tempfile
 
@@ -25,8 +47,10 @@ except ImportError:
 
 try:
     from cryptography import x509
+    from cryptography.exceptions import UnsupportedAlgorithm
     from cryptography.hazmat.primitives import hashes, serialization
     from cryptography.hazmat.primitives.serialization import pkcs12
+    from cryptography.x509 import ocsp
     from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
     # PolicyBuilder, StoreBuilder는 선택적으로 import
     try:
@@ -49,13 +73,3658 @@ except ImportError as e:
     exit(1)
 
 
-class EnhancedSSLCertificateChecker:
+class PfxPasswordCache:
+    """PFX 비밀번호 후보 목록 + 성공/실패 기록
+
+    배치 분석에서 여러 PFX가 소수의 비밀번호를 공유하는 경우를 위해
+    디렉토리별로 성공한 비밀번호를 기억해 먼저 시도하고,
+    (파일 내용, 비밀번호) 조합의 실패를 기록해 같은 키 유도를 반복하지 않습니다.
+    """
+
+    def __init__(self, passwords=None):
+        self.passwords = []          # 후보 비밀번호 (입력 순서 유지, 중복 제거)
+        self.directory_hits = {}     # 디렉토리 → 마지막으로 성공한 비밀번호
+        self.content_hits = {}       # 파일 내용 해시 → 성공한 비밀번호
+        self.failures = set()        # (파일 내용 해시, 비밀번호) 실패 기록
+        self.lock = threading.Lock()
+        for password in passwords or []:
+            self.add_password(password)
+
+    def add_password(self, password):
+        """메모리 내 후보 목록에 비밀번호 추가"""
+        if password is None:
+            return
+        with self.lock:
+            if password not in self.passwords:
+                self.passwords.append(password)
+
+    def load_file(self, filepath):
+        """비밀번호 목록 파일 로드 (한 줄에 하나, 빈 줄 무시) - 추가된 개수 반환"""
+        with open(filepath, 'r', encoding='utf-8-sig') as f:
+            lines = [line.rstrip('\r\n') for line in f]
+        before = len(self.passwords)
+        for line in lines:
+            if line:
+                self.add_password(line)
+        return len(self.passwords) - before
+
+    def has_candidates_for(self, filepath):
+        """모달 입력 없이 시도할 비밀번호가 있는지"""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        return bool(self.passwords) or directory in self.directory_hits
+
+    def candidates(self, filepath, data_key, primary=''):
+        """시도 순서: 같은 내용 성공 → 디렉토리 성공 → 입력값 → 목록 → 비밀번호 없음"""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        with self.lock:
+            ordered = [self.content_hits.get(data_key), self.directory_hits.get(directory), primary or None]
+            ordered.extend(self.passwords)
+            ordered.append('')
+
+            result = []
+            for password in ordered:
+                if password is None or password in result:
+                    continue
+                if (data_key, password) in self.failures:
+                    continue
+                result.append(password)
+            return result
+
+    def record_success(self, filepath, data_key, password):
+        directory = os.path.dirname(os.path.abspath(filepath))
+        with self.lock:
+            self.directory_hits[directory] = password
+            self.content_hits[data_key] = password
+
+    def record_failure(self, data_key, password):
+        with self.lock:
+            self.failures.add((data_key, password))
+
+
+JKS_MAGIC = 0xFEEDFEED
+JCEKS_MAGIC = 0xCECECECE
+KEYSTORE_EXTENSIONS = ['.keystore', '.jks', '.jceks']
+KEY_PAIR_EXTENSIONS = ['.pem', '.crt', '.cer', '.der', '.key']
+
+
+def _iter_jks_entries(data):
+    """JKS/JCEKS 키스토어 항목을 한 번에 순회 → (별칭, 항목 타입, [DER 인증서])
+
+    JKS는 인증서를 암호화하지 않고 저장하므로 비밀번호 없이 별칭과 체인을 읽을 수 있습니다.
+    (개인키만 암호화되어 있으며, 파일 끝 20바이트는 무결성 다이제스트)
+    파일이 잘려 있으면 그 지점에서 ValueError를 내므로, 호출 측은 앞서 받은 항목을 그대로 쓸 수 있습니다.
+    """
+    view = memoryview(data)
+    offset = 0
+    
+    def unpack(fmt):
+        nonlocal offset
+        try:
+            values = struct.unpack_from(fmt, view, offset)
+        except struct.error:
+            raise ValueError("키스토어 파일이 잘렸습니다. (truncated keystore)") from None
+        offset += struct.calcsize(fmt)
+        return values
+    
+    magic, version, count = unpack('>III')
+    if magic not in (JKS_MAGIC, JCEKS_MAGIC):
+        raise ValueError("JKS/JCEKS 키스토어 형식이 아닙니다.")
+    
+    def read_u4():
+        return unpack('>I')[0]
+    
+    def read_bytes(length):
+        nonlocal offset
+        if offset + length > len(view):
+            raise ValueError("키스토어 파일이 잘렸습니다. (truncated keystore)")
+        chunk = view[offset:offset + length]
+        offset += length
+        return chunk
+    
+    def read_utf():
+        return bytes(read_bytes(unpack('>H')[0])).decode('utf-8', errors='replace')
+    
+    def read_certificate():
+        if version == 2:
+            read_utf()  # 인증서 타입 ("X.509")
+        return bytes(read_bytes(read_u4()))
+    
+    for _ in range(count):
+        tag = read_u4()
+        alias = read_utf()
+        unpack('>Q')  # 생성 시각 (ms)
+        
+        if tag == 1:
+            read_bytes(read_u4())  # 암호화된 개인키 (EncryptedPrivateKeyInfo)
+            chain = [read_certificate() for _ in range(read_u4())]
+            yield alias, 'PrivateKeyEntry', chain
+        elif tag == 2:
+            yield alias, 'trustedCertEntry', [read_certificate()]
+        else:
+            # JCEKS SecretKeyEntry는 Java 직렬화 객체라 길이를 알 수 없어 이후 항목을 읽을 수 없음
+            raise ValueError(f"지원하지 않는 키스토어 항목입니다. (별칭: {alias}, 태그: {tag})")
+
+
+def _verify_jks_password(data, password):
+    """JKS 무결성 다이제스트로 키스토어 비밀번호 확인"""
+    digest = hashlib.sha1(password.encode('utf-16-be') + b'Mighty Aphrodite' + data[:-20]).digest()
+    return digest == data[-20:]
+
+
+def _try_pkcs12_passwords(p12_data, candidates, with_names=False):
+    """후보 비밀번호를 순서대로 시도 → (성공 인덱스, 실패 인덱스 목록, 로드 결과, 마지막 오류)
+
+    with_names=True이면 별칭(friendly name)을 포함하는 load_pkcs12 결과를 반환합니다.
+    """
+    failed = []
+    last_error = None
+    for index, password_text in enumerate(candidates):
+        password = password_text.encode('utf-8') if password_text else None
+        try:
+            if with_names:
+                loaded = pkcs12.load_pkcs12(p12_data, password)
+            else:
+                loaded = pkcs12.load_key_and_certificates(p12_data, password)
+        except ValueError as e:
+            failed.append(index)
+            last_error = str(e)
+            continue
+        return index, failed, loaded, None
+    return None, failed, None, last_error
+
+
+def _decode_pkcs12_worker(p12_data, candidates):
+    """PFX 프로세스 풀 작업 - 인증서는 DER로 직렬화해 반환 (개인키는 프로세스 밖으로 보내지 않음)"""
+    index, failed, loaded, error = _try_pkcs12_passwords(p12_data, candidates)
+    if loaded is None:
+        return index, failed, None, error
+    
+    private_key, certificate, additional_certificates = loaded
+    der = serialization.Encoding.DER
+    decoded = (
+        private_key is not None,
+        certificate.public_bytes(der) if certificate is not None else None,
+        [cert.public_bytes(der) for cert in additional_certificates or []],
+    )
+    return index, failed, decoded, None
+
+
+# PEM 블록 라벨 → 종류
+PEM_BLOCK_KINDS = {
+    b'CERTIFICATE': 'certificate',
+    b'PRIVATE KEY': 'private_key',
+    b'RSA PRIVATE KEY': 'private_key',
+    b'EC PRIVATE KEY': 'private_key',
+    b'DSA PRIVATE KEY': 'private_key',
+    b'ENCRYPTED PRIVATE KEY': 'private_key',
+    b'CERTIFICATE REQUEST': 'csr',
+    b'NEW CERTIFICATE REQUEST': 'csr',
+    b'X509 CRL': 'crl',
+}
+PEM_BLOCK_RE = re.compile(rb'-----BEGIN ([A-Z0-9 ]+)-----.*?-----END \1-----', re.DOTALL)
+
+
+class PemBlock:
+    """PEM 블록 하나 (라벨로 분류만 하고 파싱은 요청 시 한 번만 수행)"""
+
+    __slots__ = ('label', 'kind', 'data', 'offset', '_parsed')
+
+    def __init__(self, label, data, offset):
+        self.label = label.decode('ascii')
+        self.kind = PEM_BLOCK_KINDS.get(label, 'other')
+        self.data = data
+        self.offset = offset
+        self._parsed = None
+
+    def parse(self, password=None):
+        """블록 파싱 (결과 캐시) - 인증서/개인키/CSR/CRL 객체 반환"""
+        if self._parsed is None:
+            if self.kind == 'certificate':
+                self._parsed = x509.load_pem_x509_certificate(self.data)
+            elif self.kind == 'private_key':
+                self._parsed = serialization.load_pem_private_key(self.data, password)
+            elif self.kind == 'csr':
+                self._parsed = x509.load_pem_x509_csr(self.data.replace(b'NEW CERTIFICATE REQUEST', b'CERTIFICATE REQUEST'))
+            elif self.kind == 'crl':
+                self._parsed = x509.load_pem_x509_crl(self.data)
+            else:
+                raise ValueError(f"지원하지 않는 PEM 블록입니다: {self.label}")
+        return self._parsed
+
+
+def iter_pem_blocks(data):
+    """PEM 블록을 하나씩 분리해 반환 (mmap을 넘기면 블록 하나 크기만큼만 복사)"""
+    for match in PEM_BLOCK_RE.finditer(data):
+        yield PemBlock(match.group(1), match.group(0) + b'\n', match.start())
+
+
+def split_pem_blocks(data):
+    """PEM 데이터의 모든 블록을 한 번의 정규식 탐색으로 분리해 분류"""
+    return list(iter_pem_blocks(data))
+
+
+# 파일 크기 상한 (메모리 보호용 안전 한도) - PEM 텍스트는 mmap으로 블록 단위 처리하므로 크게 허용
+LARGE_BUNDLE_SIZE = 16 * 1024 * 1024          # 이보다 큰 PEM 파일은 대용량 묶음으로 스트리밍 분석
+MAX_PEM_FILE_SIZE = 4 * 1024 * 1024 * 1024    # PEM/CRT/CER
+MAX_BINARY_FILE_SIZE = 50 * 1024 * 1024       # DER/PFX/키스토어 (통째로 읽음)
+BUNDLE_DETAIL_LIMIT = 1000                    # 대용량 묶음에서 상세 정보를 보관할 인증서 수
+
+
+@contextmanager
+def mapped_file(filepath):
+    """파일을 읽기 전용 mmap으로 열기 (빈 파일은 b'') - 실제로 읽은 페이지만 메모리에 올라옴"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+BASE64_TEXT_RE = re.compile(rb'[A-Za-z0-9+/=\s]+')
+
+
+def decode_base64_text(data):
+    """헤더 없는 base64 텍스트(붙여넣은 인증서 등)를 DER 바이트로 디코딩 - base64가 아니면 None"""
+    if not BASE64_TEXT_RE.fullmatch(data):
+        return None
+    try:
+        return binascii.a2b_base64(bytes(data))
+    except binascii.Error:
+        return None
+
+
+def sniff_der_kind(data):
+    """DER 데이터 종류 판별 - 'certificate'(v3 인증서), 'pkcs12'(PFX v3) 또는 None (개인키/CSR 등)"""
+    try:
+        if data[0] != 0x30:
+            return None
+        # Certificate ::= SEQUENCE { tbsCertificate SEQUENCE { [0] version, ... }, ... }
+        # PFX ::= SEQUENCE { version INTEGER (3), authSafe ContentInfo, ... }
+        inner_start, _ = _der_read(data, 0)
+        if data[inner_start] == 0x30:
+            version_start, _ = _der_read(data, inner_start)
+            return 'certificate' if data[version_start] == 0xa0 else None
+        if bytes(data[inner_start:inner_start + 3]) == b'\x02\x01\x03':
+            return 'pkcs12'
+    except IndexError:
+        pass
+    return None
+
+
+def public_keys_match(key_a, key_b):
+    """두 공개키가 같은지 비교 (RSA/EC/DSA는 공개키 수치, 그 외는 인코딩 비교)"""
+    try:
+        return key_a.public_numbers() == key_b.public_numbers()
+    except AttributeError:
+        encoding = serialization.Encoding.DER
+        key_format = serialization.PublicFormat.SubjectPublicKeyInfo
+        return key_a.public_bytes(encoding, key_format) == key_b.public_bytes(encoding, key_format)
+
+
+class CrlIndex:
+    """로컬 CRL 디렉토리 색인 - 발급자(DN DER)별 폐기 시리얼 조회
+
+    CRL은 한 번만 파싱해 발급자별 시리얼 집합(대형 CRL은 정렬 배열)으로 보관하고,
+    파일의 (수정 시각, 크기)가 바뀐 경우에만 다시 파싱합니다.
+    발급자 DN이 같아도 발급자 공개키로 서명이 확인된 CRL만 폐기 판정에 사용합니다. 발급자 인증서는
+    검사 중인 체인(또는 AIA 미러)에서 찾고, 없으면 CRL 옆에 둔 CA 인증서(.crt/.cer/.pem)를 씁니다.
+    """
+
+    CRL_EXTENSIONS = ['.crl', '.pem', '.der', '.crt', '.cer']  # CRL과 CRL 서명 확인용 CA 인증서
+    LARGE_CRL_THRESHOLD = 100000  # 이 이상은 set 대신 정렬 배열 + 이진 탐색
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.files = {}     # 경로 → (stat 키, [CRL 항목])
+        self.certificates = {}  # 경로 → [CA 인증서]
+        self.by_issuer = {}  # 발급자 DN DER → [CRL 항목]
+        self.issuer_certificates = {}  # 주체 DN DER → [디렉토리의 CA 인증서]
+        self.lock = threading.Lock()
+
+    def load_directory(self, directory):
+        """CRL 디렉토리 지정 후 색인 → (새로 파싱, 재사용, 오류 목록)"""
+        self.directory = directory
+        return self.refresh()
+
+    def refresh(self):
+        """변경된 CRL 파일만 다시 파싱"""
+        parsed, reused, errors = 0, 0, []
+        if not self.directory:
+            return parsed, reused, errors
+        
+        seen = set()
+        for dirpath, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if os.path.splitext(filename)[1].lower() not in self.CRL_EXTENSIONS:
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+                cached = self.files.get(path)
+                if cached and cached[0] == stat_key:
+                    reused += 1
+                    continue
+                try:
+                    entries, certificates = self.parse_crl_file(path)
+                except (ValueError, OSError) as e:
+                    errors.append({'path': path, 'error': str(e)})
+                    entries, certificates = [], []
+                self.files[path] = (stat_key, entries)
+                self.certificates[path] = certificates
+                if entries:
+                    parsed += 1
+        
+        with self.lock:
+            for path in list(self.files):
+                if path not in seen:
+                    del self.files[path]
+                    self.certificates.pop(path, None)
+            self.by_issuer = {}
+            for _, entries in self.files.values():
+                for entry in entries:
+                    self.by_issuer.setdefault(entry['issuer'], []).append(entry)
+            self.issuer_certificates = {}
+            for certificates in self.certificates.values():
+                for cert in certificates:
+                    self.issuer_certificates.setdefault(cert.subject.public_bytes(), []).append(cert)
+        return parsed, reused, errors
+
+    def parse_crl_file(self, path):
+        """CRL 파일 (PEM 여러 개 또는 DER) 파싱 → (색인 항목 목록, 함께 둔 CA 인증서 목록)"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        certificates = []
+        if b'-----BEGIN' in data:
+            blocks = split_pem_blocks(data)
+            crls = [block.parse() for block in blocks if block.kind == 'crl']
+            certificates = [block.parse() for block in blocks if block.kind == 'certificate']
+        else:
+            try:
+                crls = [x509.load_der_x509_crl(data)]
+            except ValueError:
+                if os.path.splitext(path)[1].lower() == '.crl':
+                    raise
+                crls, certificates = [], [x509.load_der_x509_certificate(data)]
+        
+        entries = []
+        for crl in crls:
+            serials = [revoked.serial_number for revoked in crl]
+            if len(serials) >= self.LARGE_CRL_THRESHOLD:
+                serials.sort()
+                lookup = serials
+            else:
+                lookup = frozenset(serials)
+            
+            next_update = getattr(crl, 'next_update_utc', None) or crl.next_update
+            if next_update is not None and next_update.tzinfo is None:
+                next_update = next_update.replace(tzinfo=timezone.utc)
+            entries.append({
+                'issuer': crl.issuer.public_bytes(),
+                'serials': lookup,
+                'next_update': next_update,
+                'crl': crl,
+                'path': path,
+                'verified': {}  # 발급자 인증서 지문 → 서명 확인 결과
+            })
+        return entries, certificates
+
+    @staticmethod
+    def verify_entry(entry, issuers):
+        """CRL 서명을 발급자 후보 인증서의 공개키로 확인 (발급자별 결과 캐시)"""
+        crl = entry['crl']
+        for issuer in issuers:
+            fingerprint = issuer.fingerprint(hashes.SHA256())
+            valid = entry['verified'].get(fingerprint)
+            if valid is None:
+                try:
+                    valid = issuer.subject == crl.issuer and crl.is_signature_valid(issuer.public_key())
+                except (TypeError, ValueError):
+                    valid = False  # 지원하지 않는 키 종류
+                entry['verified'][fingerprint] = valid
+            if valid:
+                return True
+        return False
+
+    def lookup(self, cert, issuers=(), now=None):
+        """인증서 폐기 여부
+
+        issuers: 검사 중인 체인에서 찾은 발급자 후보 인증서 (CRL 서명 확인용) - CRL 디렉토리의 CA 인증서도 함께 시도
+        반환 dict의 status: revoked / good / unverified(서명 미확인·발급자 없음, 적용하지 않음) / no_crl
+        stale: 사용한 CRL이 모두 nextUpdate를 지났는지
+        """
+        issuer_key = cert.issuer.public_bytes()
+        with self.lock:
+            entries = self.by_issuer.get(issuer_key)
+            directory_issuers = self.issuer_certificates.get(issuer_key, [])
+        if not entries:
+            return {'status': 'no_crl', 'stale': False}
+        
+        issuers = list(issuers) + directory_issuers
+        verified = [entry for entry in entries if self.verify_entry(entry, issuers)]
+        if not verified:
+            return {'status': 'unverified', 'stale': False, 'crl_path': entries[0]['path']}
+        
+        now = now or datetime.now(timezone.utc)
+        stale = all(entry['next_update'] is not None and entry['next_update'] < now for entry in verified)
+        serial = cert.serial_number
+        for entry in verified:
+            serials = entry['serials']
+            if isinstance(serials, list):
+                position = bisect_left(serials, serial)
+                found = position < len(serials) and serials[position] == serial
+            else:
+                found = serial in serials
+            if found:
+                revoked = entry['crl'].get_revoked_certificate_by_serial_number(serial)
+                revocation_date = getattr(revoked, 'revocation_date_utc', None) or revoked.revocation_date
+                return {
+                    'status': 'revoked',
+                    'stale': stale,
+                    'revocation_date': revocation_date,
+                    'crl_path': entry['path']
+                }
+        return {'status': 'good', 'stale': stale}
+
+
+def _der_read(data, offset):
+    """DER TLV 헤더를 읽어 (내용 시작, 끝) 오프셋 반환"""
+    length = data[offset + 1]
+    start = offset + 2
+    if length & 0x80:
+        count = length & 0x7f
+        length = int.from_bytes(data[start:start + count], 'big')
+        start += count
+    return start, start + length
+
+
+def _der_sequence(content):
+    """내용을 DER SEQUENCE로 감싸기"""
+    length = len(content)
+    if length < 0x80:
+        header = bytes([length])
+    else:
+        raw = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+        header = bytes([0x80 | len(raw)]) + raw
+    return b'\x30' + header + content
+
+
+def build_ocsp_request(request_ders):
+    """단건 OCSPRequest DER들의 Request 항목을 모아 다중 요청 OCSPRequest DER 생성
+
+    cryptography의 OCSPRequestBuilder는 인증서 하나만 담을 수 있으므로
+    단건 요청에서 CertID가 담긴 Request를 잘라 requestList 하나로 합칩니다.
+    """
+    if len(request_ders) == 1:
+        return request_ders[0]
+    items = []
+    for der in request_ders:
+        tbs_offset, _ = _der_read(der, 0)             # OCSPRequest → TBSRequest
+        list_offset, _ = _der_read(der, tbs_offset)   # TBSRequest → requestList (version 생략)
+        item_offset, _ = _der_read(der, list_offset)  # requestList → Request
+        _, item_end = _der_read(der, item_offset)
+        items.append(der[item_offset:item_end])
+    return _der_sequence(_der_sequence(_der_sequence(b''.join(items))))
+
+
+def _verify_signature(public_key, signature, data, hash_algorithm):
+    """키 종류에 맞는 방식으로 서명 검증 (실패 시 예외)"""
+    from cryptography.hazmat.primitives.asymmetric import rsa, ec, padding
+    
+    if isinstance(public_key, rsa.RSAPublicKey):
+        public_key.verify(signature, data, padding.PKCS1v15(), hash_algorithm)
+    elif isinstance(public_key, ec.EllipticCurvePublicKey):
+        public_key.verify(signature, data, ec.ECDSA(hash_algorithm))
+    else:
+        public_key.verify(signature, data)
+
+
+def _utc_attr(obj, name):
+    """cryptography 버전에 관계없이 시각 속성을 UTC aware datetime으로 읽기"""
+    if hasattr(obj, name + '_utc'):
+        return getattr(obj, name + '_utc')
+    value = getattr(obj, name)
+    if value is not None and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+KEY_USAGE_FLAGS = ('digital_signature', 'content_commitment', 'key_encipherment', 'data_encipherment',
+                   'key_agreement', 'key_cert_sign', 'crl_sign')
+
+
+class CertificateExtensions:
+    """자주 쓰는 확장 필드(KU, EKU, SAN, BasicConstraints, SKI/AKI, AIA)를 담은 타입 레코드
+
+    decode_extensions가 cert.extensions를 한 번만 훑어 채웁니다. 확장이 없으면 빈 값/None이고,
+    EKU는 프로세스 간 전송이 가능하도록 OID 점 표기 문자열로 보관합니다.
+    """
+
+    __slots__ = ('key_usage', 'extended_key_usage', 'dns_names', 'ip_addresses', 'has_san',
+                 'basic_ca', 'path_length', 'subject_key_id', 'authority_key_id',
+                 'ocsp_urls', 'ca_issuer_urls', 'error')
+
+    def __init__(self):
+        self.key_usage = frozenset()           # 설정된 KeyUsage 플래그 이름
+        self.extended_key_usage = frozenset()  # EKU OID 점 표기
+        self.dns_names = []
+        self.ip_addresses = []
+        self.has_san = False
+        self.basic_ca = None                   # BasicConstraints 없으면 None
+        self.path_length = None
+        self.subject_key_id = None
+        self.authority_key_id = None
+        self.ocsp_urls = []
+        self.ca_issuer_urls = []
+        self.error = ''                        # 확장 필드 디코딩 실패 사유
+
+    @property
+    def is_ca(self):
+        """CA 여부 - BasicConstraints의 CA 플래그가 True일 때만 (자체 서명 리프는 CA가 아님)"""
+        return self.basic_ca is True
+
+    def has_eku(self, oid):
+        return oid.dotted_string in self.extended_key_usage
+
+
+def _decode_san(record, value):
+    record.has_san = True
+    for name in value:
+        if isinstance(name, x509.DNSName):
+            record.dns_names.append(name.value)
+        elif isinstance(name, x509.IPAddress):
+            record.ip_addresses.append(name.value)
+
+
+def _decode_key_usage(record, value):
+    record.key_usage = frozenset(flag for flag in KEY_USAGE_FLAGS if getattr(value, flag))
+
+
+def _decode_extended_key_usage(record, value):
+    record.extended_key_usage = frozenset(oid.dotted_string for oid in value)
+
+
+def _decode_basic_constraints(record, value):
+    record.basic_ca = value.ca
+    record.path_length = value.path_length
+
+
+def _decode_subject_key_id(record, value):
+    record.subject_key_id = value.digest
+
+
+def _decode_authority_key_id(record, value):
+    record.authority_key_id = value.key_identifier
+
+
+def _decode_aia(record, value):
+    for description in value:
+        if not isinstance(description.access_location, x509.UniformResourceIdentifier):
+            continue
+        if description.access_method == x509.oid.AuthorityInformationAccessOID.OCSP:
+            record.ocsp_urls.append(description.access_location.value)
+        elif description.access_method == x509.oid.AuthorityInformationAccessOID.CA_ISSUERS:
+            record.ca_issuer_urls.append(description.access_location.value)
+
+
+# 확장 값 타입 → 레코드 채우기 함수 (그 밖의 확장은 건너뜀)
+EXTENSION_DECODERS = {
+    x509.SubjectAlternativeName: _decode_san,
+    x509.KeyUsage: _decode_key_usage,
+    x509.ExtendedKeyUsage: _decode_extended_key_usage,
+    x509.BasicConstraints: _decode_basic_constraints,
+    x509.SubjectKeyIdentifier: _decode_subject_key_id,
+    x509.AuthorityKeyIdentifier: _decode_authority_key_id,
+    x509.AuthorityInformationAccess: _decode_aia,
+}
+
+
+def decode_extensions(cert):
+    """인증서 확장 필드를 한 번 순회해 CertificateExtensions로 변환 (확장별 조회·예외 처리 없음)"""
+    record = CertificateExtensions()
+    try:
+        extensions = cert.extensions
+    except ValueError as e:
+        record.error = str(e)
+        extensions = ()
+    
+    for ext in extensions:
+        decoder = EXTENSION_DECODERS.get(type(ext.value))
+        if decoder is not None:
+            decoder(record, ext.value)
+    return record
+
+
+def get_aia_urls(cert, access_method, record=None):
+    """인증서 AIA 확장에서 지정한 접근 방식(OCSP/caIssuers)의 URL 목록 (record가 있으면 다시 디코딩하지 않음)"""
+    record = record or decode_extensions(cert)
+    if access_method == x509.oid.AuthorityInformationAccessOID.OCSP:
+        return record.ocsp_urls
+    if access_method == x509.oid.AuthorityInformationAccessOID.CA_ISSUERS:
+        return record.ca_issuer_urls
+    return []
+
+
+class HttpConnectionPool:
+    """호스트별 keep-alive HTTP 연결 풀 (스레드 안전)
+
+    요청이 끝난 연결은 호스트별 유휴 목록에 돌려놓고 다음 요청에서 재사용합니다.
+    """
+
+    def __init__(self, timeout=10, max_idle=4):
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.idle = {}  # (scheme, host, port) → [유휴 연결]
+        self.round_trips = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        """요청을 보내고 (HTTP 상태, 응답 본문) 반환 - 끊긴 연결은 한 번 재접속"""
+        parts = urlsplit(url)
+        conn_key = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        
+        for attempt in range(2):
+            with self.lock:
+                idle = self.idle.get(conn_key)
+                conn = idle.pop() if idle else None
+            if conn is None:
+                conn_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+                conn = conn_class(parts.hostname, parts.port, timeout=self.timeout)
+            try:
+                conn.request(method, path, body, headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            
+            with self.lock:
+                self.round_trips += 1
+                idle = self.idle.setdefault(conn_key, [])
+                if len(idle) < self.max_idle:
+                    idle.append(conn)
+                else:
+                    conn.close()
+            return response.status, data
+
+    def close(self):
+        """유휴 연결 모두 닫기"""
+        with self.lock:
+            for conns in self.idle.values():
+                for conn in conns:
+                    conn.close()
+            self.idle.clear()
+
+
+class OcspClient:
+    """OCSP 실시간 폐기 확인 - 응답자별 일괄 요청 + nextUpdate까지 응답 캐시
+
+    같은 응답자(AIA OCSP URL)로 가는 인증서는 다중 Request 한 건으로 묶어 보내고
+    호스트별 HTTP 연결을 재사용합니다. 다중 요청을 거부하는 응답자는 기억해 두고
+    이후 단건 요청으로 보냅니다. responder_url을 지정하면 모든 요청을 그 주소로 보냅니다(로컬 응답자용).
+    """
+
+    BATCH_SIZE = 100   # 요청 한 건에 담을 최대 인증서 수
+    DEFAULT_TTL = 300  # nextUpdate가 없는 응답의 캐시 시간(초)
+
+    def __init__(self, responder_url=None, timeout=10, batch_size=None):
+        self.responder_url = responder_url
+        self.timeout = timeout
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.cache = {}           # (발급자 키 해시, 시리얼) → (상태 dict, 만료 시각)
+        self.http = HttpConnectionPool(timeout)
+        self.single_only = set()  # 다중 요청을 거부한 응답자 URL
+        self.lock = threading.Lock()
+
+    @property
+    def round_trips(self):
+        return self.http.round_trips
+
+    @staticmethod
+    def get_responder_url(cert, record=None):
+        """인증서 AIA 확장의 OCSP 응답자 URL"""
+        urls = get_aia_urls(cert, x509.oid.AuthorityInformationAccessOID.OCSP, record)
+        return urls[0] if urls else None
+
+    def check(self, pairs, now=None, records=None):
+        """(인증서, 발급자) 쌍 목록의 OCSP 상태를 입력 순서대로 반환
+        
+        records는 pairs와 같은 순서의 인증서 확장 레코드(extract_certificate_info의 extension_record)로,
+        있으면 응답자 URL을 찾을 때 확장을 다시 디코딩하지 않습니다.
+
+        상태 dict의 status: good / revoked / unknown / error / no_responder
+        / unverified(서명이 확인되지 않은 응답 - good·revoked 모두 적용하지 않고, 응답 내용은 reported_status에 보관)
+        잠금은 캐시 읽기·쓰기에만 걸고 HTTP 왕복 중에는 잡지 않습니다.
+        """
+        now = now or datetime.now(timezone.utc)
+        statuses = [None] * len(pairs)
+        pending = {}  # 응답자 URL → {캐시 키: [요청 DER, 발급자, [인덱스]]}
+        
+        records = records or [None] * len(pairs)
+        for index, ((cert, issuer), record) in enumerate(zip(pairs, records)):
+            url = self.responder_url or self.get_responder_url(cert, record)
+            if not url:
+                statuses[index] = {'status': 'no_responder', 'error': 'AIA에 OCSP 응답자 URL 없음'}
+                continue
+            request = ocsp.OCSPRequestBuilder().add_certificate(cert, issuer, hashes.SHA1()).build()
+            key = (request.issuer_key_hash, request.serial_number)
+            with self.lock:
+                cached = self.cache.get(key)
+            if cached and cached[1] > now:
+                statuses[index] = cached[0]
+                continue
+            item = pending.setdefault(url, {}).setdefault(
+                key, [request.public_bytes(serialization.Encoding.DER), issuer, []])
+            item[2].append(index)
+        
+        for url, items in pending.items():
+            answered = self.query_responder(url, items, now)
+            for key, (_, _, indexes) in items.items():
+                for index in indexes:
+                    statuses[index] = answered[key]
+        return statuses
+
+    def query_responder(self, url, items, now):
+        """한 응답자에 대한 요청들을 묶음 단위로 보내고 {캐시 키: 상태} 반환"""
+        answered = {}
+        keys = list(items)
+        batch_size = 1 if url in self.single_only else self.batch_size
+        
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            try:
+                found, error = self.send_batch(url, chunk, items, now)
+            except Exception as e:
+                found, error = {}, f"응답자 연결 실패: {str(e)}"
+            answered.update(found)
+            
+            missing = [key for key in chunk if key not in answered]
+            if len(chunk) > 1 and missing and not error.startswith('응답자 연결 실패'):
+                # 다중 요청 미지원 응답자 → 이후 단건으로 전송
+                with self.lock:
+                    self.single_only.add(url)
+                batch_size = 1
+                for key in missing:
+                    try:
+                        found, error = self.send_batch(url, [key], items, now)
+                    except Exception as e:
+                        found, error = {}, f"응답자 연결 실패: {str(e)}"
+                    answered.update(found)
+            
+            for key in chunk:
+                if key not in answered:
+                    answered[key] = {'status': 'error', 'error': error or '응답에 해당 인증서 없음', 'responder': url}
+        return answered
+
+    def send_batch(self, url, keys, items, now):
+        """요청 묶음을 POST 한 번으로 보내고 ({캐시 키: 상태}, 오류 메시지) 반환"""
+        body = build_ocsp_request([items[key][0] for key in keys])
+        response = ocsp.load_der_ocsp_response(self.post(url, body))
+        if response.response_status != ocsp.OCSPResponseStatus.SUCCESSFUL:
+            return {}, f"응답자 오류: {response.response_status.name}"
+        
+        found = {}
+        verified_by_issuer = {}
+        singles = response.responses if hasattr(response, 'responses') else [response]
+        for single in singles:
+            key = (single.issuer_key_hash, single.serial_number)
+            if key not in items or key in found:
+                continue
+            issuer = items[key][1]
+            if id(issuer) not in verified_by_issuer:
+                verified_by_issuer[id(issuer)] = self.verify_response(response, issuer)
+            
+            cert_status = single.certificate_status
+            next_update = _utc_attr(single, 'next_update')
+            status = {
+                'status': cert_status.name.lower(),
+                'this_update': _utc_attr(single, 'this_update'),
+                'next_update': next_update,
+                'revocation_time': None,
+                'revocation_reason': None,
+                'verified': verified_by_issuer[id(issuer)],
+                'reported_status': cert_status.name.lower(),
+                'responder': url
+            }
+            if cert_status == ocsp.OCSPCertStatus.REVOKED:
+                status['revocation_time'] = _utc_attr(single, 'revocation_time')
+                if single.revocation_reason is not None:
+                    status['revocation_reason'] = single.revocation_reason.name
+            if not status['verified']:
+                # 서명이 확인되지 않은 응답은 good이든 revoked이든 결과에 반영하지 않음
+                status['status'] = 'unverified'
+                status['error'] = ('폐기 응답의 서명을 확인할 수 없음' if cert_status == ocsp.OCSPCertStatus.REVOKED
+                                   else f"{status['reported_status']} 응답의 서명을 확인할 수 없음")
+            found[key] = status
+            
+            # 서명이 확인된 응답만 nextUpdate(없으면 기본 TTL)까지 캐시
+            if status['verified']:
+                expires = next_update or datetime.fromtimestamp(now.timestamp() + self.DEFAULT_TTL, timezone.utc)
+                with self.lock:
+                    self.cache[key] = (status, expires)
+        return found, ''
+
+    def verify_response(self, response, issuer):
+        """응답 서명 확인 - 발급자 직접 서명 또는 발급자가 위임한 OCSP 서명 인증서"""
+        signers = [issuer]
+        for responder_cert in response.certificates:
+            if not decode_extensions(responder_cert).has_eku(ExtendedKeyUsageOID.OCSP_SIGNING):
+                continue
+            try:
+                responder_cert.verify_directly_issued_by(issuer)
+            except Exception:
+                continue
+            signers.append(responder_cert)
+        
+        for signer in signers:
+            try:
+                _verify_signature(signer.public_key(), response.signature,
+                                  response.tbs_response_bytes, response.signature_hash_algorithm)
+                return True
+            except Exception:
+                continue
+        return False
+
+    def post(self, url, body):
+        """연결 풀을 통해 OCSP 요청 POST"""
+        headers = {'Content-Type': 'application/ocsp-request', 'Accept': 'application/ocsp-response'}
+        status, data = self.http.request('POST', url, body, headers)
+        if status != 200:
+            raise ValueError(f"HTTP {status}")
+        return data
+
+    def close(self):
+        """열린 HTTP 연결 정리"""
+        self.http.close()
+
+
+class AiaMirror:
+    """AIA caIssuers 중간 인증서 로컬 미러 (내용 주소 저장소)
+
+    내려받은 인증서는 DER의 SHA-256 이름으로 objects/ 아래에 한 번만 저장하고
+    index.json에 URL → 해시, 주체 DN → 해시 색인을 둡니다. 발급자는 먼저 미러에서 찾고,
+    없을 때만(allow_fetch) caIssuers URL에서 연결 풀로 내려받으므로 이후 실행은 네트워크가 필요 없습니다.
+    """
+
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.ssl_checker', 'aia_mirror')
+    MAX_CHAIN_DEPTH = 8
+    FETCH_WORKERS = 4
+
+    def __init__(self, directory=None, allow_fetch=True, timeout=10):
+        self.directory = directory or self.DEFAULT_DIRECTORY
+        self.allow_fetch = allow_fetch
+        self.http = HttpConnectionPool(timeout)
+        self.failed_urls = {}  # 이번 실행에서 실패한 URL → 오류 (반복 요청 방지)
+        self.loaded = {}       # 해시 → Certificate
+        self.lock = threading.Lock()
+        self.index = self.load_index()
+
+    @staticmethod
+    def name_key(name):
+        """DN 색인 키 (DN DER의 SHA-256)"""
+        return hashlib.sha256(name.public_bytes()).hexdigest()
+
+    def load_index(self):
+        """index.json 읽기 (없거나 손상되었으면 빈 색인)"""
+        try:
+            with open(os.path.join(self.directory, 'index.json'), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return {'urls': dict(index.get('urls', {})), 'subjects': dict(index.get('subjects', {}))}
+        except (OSError, ValueError):
+            return {'urls': {}, 'subjects': {}}
+
+    def save_index(self):
+        """index.json 원자적 저장 (임시 파일 → 교체)"""
+        path = os.path.join(self.directory, 'index.json')
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, path)
+
+    def object_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], digest + '.der')
+
+    def store(self, certificates, url=None):
+        """인증서들을 미러에 저장하고 색인 갱신 (이미 있는 객체는 다시 쓰지 않음)"""
+        with self.lock:
+            digests = []
+            for cert in certificates:
+                der = cert.public_bytes(serialization.Encoding.DER)
+                digest = hashlib.sha256(der).hexdigest()
+                path = self.object_path(digest)
+                if not os.path.exists(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(der)
+                    os.replace(temp_path, path)
+                self.loaded[digest] = cert
+                subject_digests = self.index['subjects'].setdefault(self.name_key(cert.subject), [])
+                if digest not in subject_digests:
+                    subject_digests.append(digest)
+                digests.append(digest)
+            if url is not None:
+                self.index['urls'][url] = digests
+            self.save_index()
+            return digests
+
+    def load(self, digest):
+        """해시로 미러 객체 읽기 (한 번 읽은 인증서는 메모리에 유지)"""
+        cert = self.loaded.get(digest)
+        if cert is None:
+            with open(self.object_path(digest), 'rb') as f:
+                cert = x509.load_der_x509_certificate(f.read())
+            self.loaded[digest] = cert
+        return cert
+
+    def find_issuers(self, cert):
+        """미러에서 cert를 실제로 서명한 발급자 인증서 찾기 (자체 서명 루트 우선)"""
+        issuers = []
+        for digest in list(self.index['subjects'].get(self.name_key(cert.issuer), [])):
+            try:
+                candidate = self.load(digest)
+                if candidate == cert:
+                    continue
+                cert.verify_directly_issued_by(candidate)
+            except Exception:
+                continue
+            issuers.append(candidate)
+        issuers.sort(key=lambda c: c.subject != c.issuer)
+        return issuers
+
+    @staticmethod
+    def parse_downloaded(data):
+        """caIssuers 응답 해석 - DER/PEM 인증서 또는 PKCS#7(.p7c) 묶음"""
+        from cryptography.hazmat.primitives.serialization import pkcs7
+        
+        if b'-----BEGIN' in data[:64]:
+            if b'PKCS7' in data[:64]:
+                return pkcs7.load_pem_pkcs7_certificates(data)
+            return x509.load_pem_x509_certificates(data)
+        try:
+            return [x509.load_der_x509_certificate(data)]
+        except ValueError:
+            return pkcs7.load_der_pkcs7_certificates(data)
+
+    def fetch_url(self, url):
+        """caIssuers URL 내려받아 미러에 저장 (이미 받은 URL은 네트워크 없이 반환)"""
+        if url in self.index['urls']:
+            return [self.load(digest) for digest in self.index['urls'][url]]
+        status, data = self.http.request('GET', url)
+        if status != 200:
+            raise ValueError(f"HTTP {status}")
+        certificates = self.parse_downloaded(data)
+        self.store(certificates, url)
+        return certificates
+
+    def fetch(self, urls):
+        """여러 caIssuers URL을 동시에 내려받기 - 실패한 URL은 failed_urls에 기록"""
+        urls = [url for url in dict.fromkeys(urls) if url not in self.failed_urls]
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.FETCH_WORKERS, len(urls))) as executor:
+            futures = {executor.submit(self.fetch_url, url): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.failed_urls[futures[future]] = str(e)
+
+    def complete_chain(self, certificates, records=None):
+        """체인 마지막 인증서부터 발급자를 미러(필요 시 AIA)에서 찾아 이어 붙이고 추가된 인증서 반환
+        
+        records는 certificates와 같은 순서의 확장 레코드로, 있으면 AIA URL을 레코드에서 읽습니다.
+        """
+        chain = list(certificates)
+        records_by_cert = {id(cert): record for cert, record in zip(chain, records or ())}
+        added = []
+        for _ in range(self.MAX_CHAIN_DEPTH):
+            last = chain[-1]
+            if last.subject == last.issuer:
+                break
+            issuers = self.find_issuers(last)
+            if not issuers and self.allow_fetch:
+                urls = get_aia_urls(last, x509.oid.AuthorityInformationAccessOID.CA_ISSUERS,
+                                    records_by_cert.get(id(last)))
+                if urls:
+                    self.fetch(urls)
+                    issuers = self.find_issuers(last)
+            if not issuers or issuers[0] in chain:
+                break
+            chain.append(issuers[0])
+            added.append(issuers[0])
+        return added
+
+
+class EmbeddedCertificate:
+    """설정 파일 안에서 찾은 인증서 하나 (원본 파일 내 위치와 분석용 데이터)"""
+
+    __slots__ = ('offset', 'encoding', 'data')
+
+    def __init__(self, offset, encoding, data):
+        self.offset = offset      # 원본 파일 안의 바이트 오프셋
+        self.encoding = encoding  # 'pem' 또는 'base64'
+        self.data = data          # analyze_data()에 넘길 PEM 또는 DER 바이트
+
+
+class EmbeddedCertificateScanner:
+    """YAML/JSON/.env/Kubernetes Secret 등 임의의 텍스트 파일 안에 포함된 인증서 탐색
+
+    파일을 mmap으로 열고 하나의 정규식으로 PEM 블록과 base64로 인코딩된 DER(MII…)/PEM(LS0tLS1CRUdJTi…)을
+    찾습니다. 인증서 표식이 없는 구간은 바이트 검색으로 건너뛰므로 수 GB 저장소도 빠르게 훑습니다.
+    base64 값은 한 줄이거나 YAML 블록 스칼라처럼 줄바꿈 + 들여쓰기로 나뉘어(76열 등) 있어도 찾습니다.
+    """
+
+    # base64 본문: 첫 줄 이후 줄바꿈 + 들여쓰기로 이어지는 줄 허용
+    BASE64_RUN = rb'[A-Za-z0-9+/]{40,}(?:\r?\n[ \t]*[A-Za-z0-9+/]+)*={0,2}'
+    EMBEDDED_RE = re.compile(
+        rb'[-ML](?:(?<=-)----BEGIN CERTIFICATE-----.*?-----END CERTIFICATE-----'
+        rb'|(?<=M)II' + BASE64_RUN +
+        rb'|(?<=L)S0tLS1CRUdJTi' + BASE64_RUN + rb')', re.DOTALL)
+    WHITESPACE_RE = re.compile(rb'\s+')
+    # PEM 체인의 블록 사이 (줄바꿈, 들여쓰기, JSON 문자열의 \n 이스케이프)
+    PEM_GAP_RE = re.compile(rb'(?:\s|\\r|\\n)*')
+    MARKERS = (b'-----BEGIN CERTIFICATE-----', b'MII', b'LS0tLS1CRUdJTi')
+    WINDOW = 8 * 1024 * 1024       # 표식 유무를 먼저 확인하는 구간 크기
+    MAX_MATCH = 1024 * 1024        # 인증서 하나(또는 base64 체인)의 최대 길이
+    SKIP_DIRS = {'.git', '.hg', '.svn'}
+
+    @classmethod
+    def collect_files(cls, paths):
+        """파일/폴더 경로 목록에서 검사할 파일 목록 구성 (확장자와 무관, VCS 폴더 제외)"""
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames[:] = sorted(name for name in dirnames if name not in cls.SKIP_DIRS)
+                    files.extend(os.path.join(dirpath, filename) for filename in sorted(filenames))
+            else:
+                files.append(path)
+        return files
+
+    def scan_file(self, filepath):
+        """파일 하나를 mmap으로 열어 포함된 인증서를 순서대로 반환"""
+        with mapped_file(filepath) as data:
+            return list(self.scan(data))
+
+    def iter_matches(self, data):
+        """정규식 일치 순회 - 표식이 없는 구간은 건너뜀"""
+        size = len(data)
+        pos = 0
+        while pos < size:
+            window_end = min(pos + self.WINDOW, size)
+            marker_end = min(window_end + len(self.MARKERS[0]), size)
+            if all(data.find(marker, pos, marker_end) < 0 for marker in self.MARKERS):
+                pos = window_end
+                continue
+            match = self.EMBEDDED_RE.search(data, pos, min(window_end + self.MAX_MATCH, size))
+            if match is None:
+                pos = window_end
+                continue
+            yield match
+            pos = match.end()
+
+    def scan(self, data):
+        """버퍼(bytes/mmap)에서 인증서 찾기 - 이어진 PEM 블록은 하나의 체인으로 묶음"""
+        chain_start, chain_end, blocks = None, None, []
+        for match in self.iter_matches(data):
+            if match.group(0)[:1] == b'-':
+                if blocks and self.PEM_GAP_RE.fullmatch(data, chain_end, match.start()):
+                    blocks.append(match.group(0))
+                else:
+                    if blocks:
+                        yield self.make_pem(chain_start, blocks)
+                    chain_start, blocks = match.start(), [match.group(0)]
+                chain_end = match.end()
+                continue
+            if blocks:
+                yield self.make_pem(chain_start, blocks)
+                blocks = []
+            embedded = self.decode_base64(match.start(), match.group(0))
+            if embedded is not None:
+                yield embedded
+        if blocks:
+            yield self.make_pem(chain_start, blocks)
+
+    @staticmethod
+    def make_pem(offset, blocks):
+        """PEM 블록 묶음 → EmbeddedCertificate (JSON 문자열의 줄바꿈 이스케이프 복원)"""
+        data = b'\n'.join(blocks).replace(b'\\r', b'').replace(b'\\n', b'\n') + b'\n'
+        return EmbeddedCertificate(offset, 'pem', data)
+
+    @classmethod
+    def decode_base64(cls, offset, text):
+        """base64 값 디코딩 - 인증서 PEM 또는 v3 인증서 DER 형태일 때만 반환 (개인키/CSR 등 제외)
+
+        여러 줄 값은 공백을 모두 제거한 뒤 디코딩합니다. 패딩 없는 값 뒤 줄에 다른 값이 이어 붙어
+        일치한 경우를 위해 4의 배수로 자르고, DER은 첫 TLV 길이만큼, PEM은 마지막 END 줄까지만 사용합니다.
+        """
+        compact = cls.WHITESPACE_RE.sub(b'', text)
+        if not compact.endswith(b'='):
+            compact = compact[:len(compact) - len(compact) % 4]
+        data = decode_base64_text(compact)
+        if not data:
+            return None
+        if data.startswith(b'-----BEGIN'):
+            end = data.rfind(b'-----END CERTIFICATE-----')
+            if end < 0 or b'-----BEGIN CERTIFICATE-----' not in data:
+                return None
+            return EmbeddedCertificate(offset, 'base64', data[:end + len(b'-----END CERTIFICATE-----')] + b'\n')
+        if sniff_der_kind(data) == 'certificate':
+            _, end = _der_read(data, 0)
+            return EmbeddedCertificate(offset, 'base64', data[:end])
+        return None
+
+
+class ArchiveScanner:
+    """zip/jar/tar/tar.gz 아카이브를 디스크에 풀지 않고 멤버 단위로 스트리밍하며 인증서 찾기
+
+    멤버 종류는 확장자가 아니라 내용(중첩 아카이브, DER 인증서, PKCS#12, JKS 매직, PEM/base64)으로
+    판별합니다. 중첩 아카이브는 max_depth 단계까지, 멤버는 max_member_size 이하만 메모리로 읽으며
+    건너뛴 멤버는 skipped에 (경로, 이유)로 기록됩니다. 압축 데이터가 손상된 멤버(zlib/lzma 오류)도
+    건너뛰므로 아카이브 하나가 전체 검사를 멈추지 않습니다.
+    """
+
+    MAX_DEPTH = 3
+    MAX_MEMBER_SIZE = 64 * 1024 * 1024
+    COMPRESSED_TAR_MAGICS = (b'\x1f\x8b', b'BZh', b'\xfd7zXZ\x00')  # gzip, bzip2, xz
+    SNIFF_SIZE = 262  # tar 헤더의 'ustar' 표식(257~261)까지
+
+    def __init__(self, max_depth=MAX_DEPTH, max_member_size=MAX_MEMBER_SIZE):
+        self.max_depth = max_depth
+        self.max_member_size = max_member_size
+        self.embedded_scanner = EmbeddedCertificateScanner()
+        self.skipped = []
+
+    @classmethod
+    def archive_kind(cls, head):
+        """앞부분 바이트로 아카이브 종류 판별 → 'zip' | 'tar' | None"""
+        if head[:4] in (b'PK\x03\x04', b'PK\x05\x06'):
+            return 'zip'
+        if head[257:262] == b'ustar' or head.startswith(cls.COMPRESSED_TAR_MAGICS):
+            return 'tar'
+        return None
+
+    @classmethod
+    def is_archive(cls, filepath):
+        """파일이 아카이브인지 내용으로 확인"""
+        with open(filepath, 'rb') as f:
+            return cls.archive_kind(f.read(cls.SNIFF_SIZE)) is not None
+
+    def scan_file(self, filepath):
+        """아카이브 파일의 (멤버 경로, EmbeddedCertificate) 순회 - 멤버 경로는 'a.tar.gz!/certs/x.pem' 형태"""
+        with open(filepath, 'rb') as f:
+            kind = self.archive_kind(f.read(self.SNIFF_SIZE))
+            f.seek(0)
+            for found in self.scan_archive(f, kind, filepath, 1):
+                yield found
+
+    def iter_members(self, fileobj, kind):
+        """일반 파일 멤버의 (이름, 크기, 읽기 함수) 순회 - tar는 되감기 없는 스트림 모드"""
+        if kind == 'zip':
+            with zipfile.ZipFile(fileobj) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir():
+                        yield info.filename, info.file_size, lambda info=info: archive.read(info)
+        else:
+            with tarfile.open(fileobj=fileobj, mode='r|*') as archive:
+                for member in archive:
+                    if member.isfile():
+                        yield member.name, member.size, lambda member=member: archive.extractfile(member).read()
+
+    def scan_archive(self, fileobj, kind, name, depth):
+        """아카이브 하나의 멤버를 차례로 읽어 판별"""
+        try:
+            for member_name, size, read in self.iter_members(fileobj, kind):
+                member_path = f"{name}!/{member_name}"
+                if size > self.max_member_size:
+                    self.skipped.append((member_path, f"크기 제한 초과 ({size // (1024 * 1024)} MiB)"))
+                    continue
+                try:
+                    data = read()
+                except (RuntimeError, zipfile.BadZipFile, NotImplementedError, zlib.error, lzma.LZMAError) as e:
+                    # 암호화/지원하지 않는 압축 방식/압축 데이터 손상 멤버
+                    self.skipped.append((member_path, f"읽기 실패: {str(e)}"))
+                    continue
+                for found in self.scan_member(member_path, data, depth):
+                    yield found
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError, zlib.error, lzma.LZMAError) as e:
+            # tar 스트림은 멤버 경계 없이 이어서 풀기 때문에 손상 지점 이후 멤버는 읽을 수 없음
+            self.skipped.append((name, f"아카이브 읽기 실패: {str(e)}"))
+
+    def scan_member(self, member_path, data, depth):
+        """멤버 내용 판별 - 중첩 아카이브는 재귀, 인증서/PFX/키스토어는 통째로, 그 외는 포함된 인증서 탐색"""
+        kind = self.archive_kind(data[:self.SNIFF_SIZE])
+        if kind is not None:
+            if depth >= self.max_depth:
+                self.skipped.append((member_path, f"중첩 깊이 제한 ({self.max_depth}단계)"))
+            else:
+                for found in self.scan_archive(io.BytesIO(data), kind, member_path, depth + 1):
+                    yield found
+            return
+        if data[:4] in (b'\xfe\xed\xfe\xed', b'\xce\xce\xce\xce') or sniff_der_kind(data):
+            yield member_path, EmbeddedCertificate(None, 'binary', data)
+            return
+        for embedded in self.embedded_scanner.scan(data):
+            yield member_path, embedded
+
+
+class _SanTrieNode:
+    """SanIndex 트라이 노드 (목록은 필요할 때만 생성)"""
+
+    __slots__ = ('children', 'exact', 'wildcard')
+
+    def __init__(self):
+        self.children = {}
+        self.exact = None     # 이 이름과 정확히 같은 SAN의 항목 번호
+        self.wildcard = None  # '*.이 이름' SAN의 항목 번호
+
+
+class SanIndex:
+    """분석 결과 전체의 SAN → 인증서 색인 (라벨을 뒤집은 트라이)
+
+    api.example.com은 com → example → api 경로에, *.example.com은 example 노드의
+    와일드카드 목록에 저장합니다. 조회는 호스트 라벨 수만큼만 내려가므로
+    SAN이 수십만 개여도 O(라벨 수)입니다.
+    """
+
+    def __init__(self):
+        self.root = _SanTrieNode()
+        self.entries = []  # 항목 번호 → 인증서 요약 (배포된 파일별)
+        self.name_count = 0
+
+    @classmethod
+    def from_results(cls, results):
+        index = cls()
+        for result in results:
+            index.add_result(result)
+        return index
+
+    @staticmethod
+    def split_labels(name):
+        """정규화(소문자, 끝의 점 제거) 후 뒤집은 라벨 목록"""
+        return name.strip().rstrip('.').lower().split('.')[::-1]
+
+    def add_result(self, result):
+        """분석 결과 하나의 모든 인증서(키스토어 항목 포함) 색인"""
+        cert_lists = [result.get('certificates', [])]
+        cert_lists += [entry['certificates'] for entry in result.get('keystore_entries', [])]
+        seen = set()  # 같은 파일에 중복으로 들어 있는 인증서는 한 번만
+        for cert_infos in cert_lists:
+            for cert_info in cert_infos:
+                cert_key = (cert_info.get('subject'), cert_info.get('serial'))
+                if cert_key not in seen:
+                    seen.add(cert_key)
+                    self.add_certificate(cert_info, result.get('file_path', ''))
+
+    def add_certificate(self, cert_info, file_path=''):
+        san_domains = cert_info.get('san_domains') or []
+        if not san_domains:
+            return
+        entry_id = len(self.entries)
+        self.entries.append({
+            'subject': cert_info.get('subject', ''),
+            'serial': cert_info.get('serial', ''),
+            'not_after': cert_info.get('not_after'),
+            'validity_status': cert_info.get('validity_status', ''),
+            'san_domains': san_domains,
+            'file_path': file_path
+        })
+        
+        for name in san_domains:
+            labels = self.split_labels(name)
+            is_wildcard = labels[-1] == '*' and len(labels) >= 3  # '*.com' 같은 공용 접미사 와일드카드는 무시
+            node = self.root
+            for label in (labels[:-1] if is_wildcard else labels):
+                child = node.children.get(label)
+                if child is None:
+                    child = node.children[label] = _SanTrieNode()
+                node = child
+            if is_wildcard:
+                if node.wildcard is None:
+                    node.wildcard = []
+                node.wildcard.append(entry_id)
+            else:
+                if node.exact is None:
+                    node.exact = []
+                node.exact.append(entry_id)
+            self.name_count += 1
+
+    def lookup(self, hostname):
+        """hostname을 포함하는 인증서 목록 - [{'entry', 'match'(exact/wildcard), 'san'}]
+
+        와일드카드는 가장 왼쪽 라벨 하나만 대신합니다(*.example.com은 a.example.com만, a.b.example.com은 제외).
+        '*.example.com'으로 조회하면 그 와일드카드 SAN을 가진 인증서를 찾습니다.
+        """
+        labels = self.split_labels(hostname)
+        if not all(labels):
+            return []
+        if labels[-1] == '*':
+            node = self.find_node(labels[:-1])
+            return [{'entry': self.entries[i], 'match': 'exact', 'san': hostname.lower()}
+                    for i in ((node.wildcard or []) if node else [])]
+        
+        wildcard_ids = []
+        exact_ids = []
+        node = self.root
+        for depth, label in enumerate(labels):
+            if depth == len(labels) - 1 and node.wildcard:
+                wildcard_ids = node.wildcard
+            node = node.children.get(label)
+            if node is None:
+                break
+        else:
+            exact_ids = node.exact or []
+        
+        # 정확히 일치하는 SAN이 있는 인증서는 와일드카드 일치로 다시 세지 않음
+        exact_set = set(exact_ids)
+        wildcard_name = '*.' + '.'.join(reversed(labels[:-1]))
+        return ([{'entry': self.entries[i], 'match': 'exact', 'san': '.'.join(reversed(labels))}
+                 for i in dict.fromkeys(exact_ids)] +
+                [{'entry': self.entries[i], 'match': 'wildcard', 'san': wildcard_name}
+                 for i in dict.fromkeys(wildcard_ids) if i not in exact_set])
+
+    def find_node(self, labels):
+        node = self.root
+        for label in labels:
+            node = node.children.get(label)
+            if node is None:
+                return None
+        return node
+
+
+class HostnameMatcher:
+    """인증서 하나에 대한 호스트명 검증기 (RFC 6125)
+
+    SAN을 정확한 이름 집합과 와일드카드 접미사 집합으로 한 번만 바꿔 두므로
+    호스트 목록이 길어도 호스트당 집합 조회 두 번이면 됩니다.
+    와일드카드는 가장 왼쪽의 완전한 '*' 라벨만 인정하고(f*.example.com 불가),
+    정확히 한 라벨만 대신하며, '*.com'처럼 라벨이 하나뿐인 접미사는 무시합니다.
+    """
+
+    def __init__(self, san_domains, ip_addresses=()):
+        self.exact = set()
+        self.wildcard_suffixes = set()
+        for name in san_domains:
+            name = self.normalize(name)
+            if name.startswith('*.'):
+                suffix = name[2:]
+                if '*' not in suffix and '.' in suffix:
+                    self.wildcard_suffixes.add(suffix)
+            elif name and '*' not in name:
+                self.exact.add(name)
+        self.ip_addresses = set(ip_addresses)
+
+    @classmethod
+    def from_cert_info(cls, cert_info):
+        """extract_certificate_info 결과로 생성 (SAN DNS 이름 + IP 주소)"""
+        record = cert_info.get('extension_record')
+        if record is None and cert_info.get('cert_object') is not None:
+            record = decode_extensions(cert_info['cert_object'])
+        return cls(cert_info.get('san_domains') or [], record.ip_addresses if record else [])
+
+    @staticmethod
+    def normalize(hostname):
+        """소문자 + 끝의 점 제거, 유니코드 도메인은 IDNA(A-label)로 변환"""
+        hostname = hostname.strip().rstrip('.').lower()
+        if not hostname.isascii():
+            try:
+                hostname = hostname.encode('idna').decode('ascii')
+            except UnicodeError:
+                pass
+        return hostname
+
+    def match(self, hostname):
+        """일치한 SAN 이름을 반환 (일치하지 않으면 None)"""
+        address = None
+        candidate = hostname.strip().strip('[]')
+        if candidate[:1].isdigit() or ':' in candidate:
+            try:
+                address = ipaddress.ip_address(candidate)
+            except ValueError:
+                pass
+        if address is not None:
+            # IP 주소는 SAN의 IP 항목과만 비교 (와일드카드 없음)
+            return str(address) if address in self.ip_addresses else None
+        
+        hostname = self.normalize(hostname)
+        if hostname in self.exact:
+            return hostname
+        first_label, _, suffix = hostname.partition('.')
+        if first_label and suffix in self.wildcard_suffixes:
+            return '*.' + suffix
+        return None
+
+    def match_many(self, hostnames):
+        """[(호스트명, 일치한 SAN 또는 None)]"""
+        return [(hostname, self.match(hostname)) for hostname in hostnames]
+
+
+class FleetAggregator:
+    """파일 전체의 인증서 중복 배포·키 재사용 집계 (스트리밍)
+
+    분석 결과를 하나씩 받아 SHA-256 지문별 배포 위치와 공개키(SPKI) 해시별 지문만 남기므로
+    메모리는 파일 수가 아니라 고유 인증서 수에 비례합니다. 결과 dict 자체는 보관하지 않습니다.
+    기본적으로 CA 인증서는 제외합니다(중간 CA는 모든 번들에 들어 있는 것이 정상).
+    """
+
+    def __init__(self, include_ca=False):
+        self.include_ca = include_ca
+        self.certificates = {}  # 지문 → 인증서 요약 + 배포 위치
+        self.by_spki = {}       # SPKI 해시 → [지문]
+        self.files = 0
+        self.errors = 0
+
+    def add_result(self, result):
+        self.files += 1
+        if result.get('status') == 'error':
+            self.errors += 1
+            return
+        file_path = result.get('file_path', '')
+        # 키스토어는 별칭별 체인만 집계 (certificates는 대표 항목의 복사)
+        chains = [(entry['alias'], entry['certificates']) for entry in result.get('keystore_entries', [])]
+        chains = chains or [('', result.get('certificates', []))]
+        
+        for alias, cert_infos in chains:
+            location = f"{file_path}#{alias}" if alias else file_path
+            for cert_info in cert_infos:
+                fingerprint = cert_info.get('fingerprint_sha256')
+                cert = cert_info.get('cert_object')
+                if not fingerprint or cert is None:
+                    continue
+                entry = self.certificates.get(fingerprint)
+                if entry is None:
+                    is_ca = cert_info.get('is_ca')
+                    if is_ca is None:
+                        is_ca = decode_extensions(cert).is_ca
+                    if not self.include_ca and is_ca:
+                        continue
+                    entry = self.certificates[fingerprint] = {
+                        'fingerprint_sha256': fingerprint,
+                        'spki_sha256': cert_info.get('spki_sha256', ''),
+                        'subject': cert_info.get('subject', ''),
+                        'serial': cert_info.get('serial', ''),
+                        'not_before': cert_info.get('not_before'),
+                        'not_after': cert_info.get('not_after'),
+                        'locations': []
+                    }
+                    self.by_spki.setdefault(entry['spki_sha256'], []).append(fingerprint)
+                if not entry['locations'] or entry['locations'][-1] != location:
+                    entry['locations'].append(location)
+
+    def report(self, min_locations=2):
+        """중복 배포(같은 지문이 min_locations곳 이상)와 키 재사용(같은 SPKI에 지문 여러 개) 목록"""
+        duplicates = sorted((entry for entry in self.certificates.values() if len(entry['locations']) >= min_locations),
+                            key=lambda entry: -len(entry['locations']))
+        key_reuse = []
+        for spki, fingerprints in self.by_spki.items():
+            if len(fingerprints) > 1:
+                entries = sorted((self.certificates[fp] for fp in fingerprints), key=lambda entry: entry['not_before'])
+                key_reuse.append({'spki_sha256': spki, 'certificates': entries})
+        key_reuse.sort(key=lambda group: -len(group['certificates']))
+        return {
+            'files': self.files,
+            'errors': self.errors,
+            'unique_certificates': len(self.certificates),
+            'duplicates': duplicates,
+            'key_reuse': key_reuse
+        }
+
+
+class _MappedStrings:
+    """mmap으로 읽은 문자열 풀 - 요청된 문자열만 디코딩"""
+
+    def __init__(self, offsets, source, base):
+        self.offsets = offsets
+        self.source = source  # mmap 객체
+        self.base = base      # 풀 시작 위치
+        self.blob = memoryview(source)[base:base + offsets[-1]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, code):
+        return str(self.blob[self.offsets[code]:self.offsets[code + 1]], 'utf-8')
+
+    def __iter__(self):
+        return (self[code] for code in range(len(self)))
+
+    def find(self, value):
+        """문자열의 코드 (없으면 None) - 전체 사전을 만들지 않고 풀을 직접 검색"""
+        needle = value.encode('utf-8')
+        if not needle:
+            return next((code for code in range(len(self)) if self.offsets[code] == self.offsets[code + 1]), None)
+        position = self.base
+        end = self.base + self.offsets[-1]
+        while True:
+            position = self.source.find(needle, position, end)
+            if position < 0:
+                return None
+            relative = position - self.base
+            code = bisect_right(self.offsets, relative) - 1  # 빈 문자열과 시작 위치가 같을 수 있음
+            if code < len(self) and self.offsets[code] == relative and self.offsets[code + 1] == relative + len(needle):
+                return code
+            position += 1
+
+
+class CertificateTable:
+    """배치 결과 인증서의 열 지향 테이블 (메모리 절약형 결과 저장소)
+
+    인증서마다 dict(cert_object, datetime 포함)를 두는 대신 열별 array에 값을 쌓습니다.
+    문자열(경로, DN, 시리얼, 키 종류 등)은 하나의 풀에 인터닝해 정수 코드로, 날짜는 epoch 초로,
+    지문은 32바이트 고정 폭으로 저장합니다. 배치 중에 행을 계속 추가할 수 있고
+    save()로 단일 바이너리 파일, export_csv()로 CSV를 만들며 load()는 파일을 mmap으로 엽니다.
+    """
+
+    STRING_COLUMNS = ('file_path', 'subject', 'issuer', 'serial', 'key_type', 'curve',
+                      'signature_hash', 'usage', 'san_domains', 'chain_status')
+    INT_COLUMNS = {'key_bits': 'I', 'validity_days': 'i', 'not_before': 'q', 'not_after': 'q'}
+    # chain_complete: 파일 체인의 is_complete, chain_expiry: 체인 유효 만료(effective_not_after)를 정한 인증서
+    FLAG_COLUMNS = ('has_san', 'server_auth', 'is_ca', 'chain_complete', 'chain_expiry')
+    DIGEST_COLUMNS = ('fingerprint_sha256', 'spki_sha256')  # SHA-256 32바이트 고정 폭
+    DIGEST_SIZE = 32
+
+    FILE_MAGIC = b'SSLCTAB1'
+    FILE_HEADER = struct.Struct('<8sBxxxQIIxxxx')   # 매직, 바이트 순서(0=little), 행 수, 문자열 수, 열 수 (32바이트)
+    COLUMN_HEADER = struct.Struct('<24scxIQxx')      # 열 이름, typecode, 항목 폭, 데이터 바이트 수 (40바이트)
+
+    def __init__(self):
+        self.strings = []       # 코드 → 문자열
+        self.string_codes = {}  # 문자열 → 코드 (mmap으로 연 테이블은 처음 필요할 때 구성)
+        self.columns = {name: array('I') for name in self.STRING_COLUMNS}
+        self.columns.update({name: array(typecode) for name, typecode in self.INT_COLUMNS.items()})
+        self.columns.update({name: array('B') for name in self.FLAG_COLUMNS})
+        self.columns.update({name: array('B') for name in self.DIGEST_COLUMNS})
+        self.mapped = None      # load()로 연 mmap 객체
+        self.missing_columns = set()  # load()한 파일에 없던 열 (이전 형식 - 0으로 채움)
+
+    @classmethod
+    def from_results(cls, results):
+        table = cls()
+        for result in results:
+            table.add_result(result)
+        return table
+
+    def __len__(self):
+        return len(self.columns['key_bits'])
+
+    def intern(self, value):
+        codes = self.get_string_codes()
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def code(self, value):
+        """문자열의 코드 (테이블에 없으면 None)"""
+        if self.string_codes is None:
+            return self.strings.find(value)
+        return self.string_codes.get(value)
+
+    def get_string_codes(self):
+        if self.string_codes is None:
+            self.string_codes = {value: code for code, value in enumerate(self.strings)}
+        return self.string_codes
+
+    def add_result(self, result):
+        """분석 결과 하나의 인증서(키스토어는 별칭별 체인)를 행으로 추가 - analyze_batch의 on_result에서 호출 가능"""
+        if result.get('status') == 'error':
+            return
+        chain_info = result.get('chain_info', {})
+        chain_status = chain_info.get('status', '')
+        chain_complete = bool(chain_info.get('is_complete'))
+        chains = [(entry['chain_info'], entry['certificates']) for entry in result.get('keystore_entries', [])]
+        for expiry_info, cert_infos in chains or [(chain_info, result.get('certificates', []))]:
+            # 체인 유효 만료 인증서는 체인(키스토어는 별칭)마다 한 행만 표시
+            expiry_fingerprint = expiry_info.get('expiry_fingerprint')
+            for cert_info in cert_infos:
+                if 'key_type' in cert_info:
+                    chain_expiry = bool(expiry_fingerprint) and cert_info.get('fingerprint_sha256') == expiry_fingerprint
+                    if chain_expiry:
+                        expiry_fingerprint = None
+                    self.append(cert_info, result.get('file_path', ''), chain_status, chain_complete, chain_expiry)
+
+    def append(self, cert_info, file_path='', chain_status='', chain_complete=False, chain_expiry=False):
+        if self.mapped is not None:
+            self.materialize()
+        columns = self.columns
+        columns['file_path'].append(self.intern(file_path))
+        columns['chain_status'].append(self.intern(chain_status))
+        columns['san_domains'].append(self.intern(' '.join(cert_info.get('san_domains') or [])))
+        for name in ('subject', 'issuer', 'serial', 'key_type', 'curve', 'signature_hash', 'usage'):
+            columns[name].append(self.intern(cert_info.get(name) or ''))
+        for name in ('key_bits', 'validity_days'):
+            columns[name].append(cert_info.get(name) or 0)
+        for name in ('not_before', 'not_after'):
+            columns[name].append(int(cert_info[name].timestamp()) if cert_info.get(name) else 0)
+        for name in ('has_san', 'server_auth', 'is_ca'):
+            columns[name].append(1 if cert_info.get(name) else 0)
+        columns['chain_complete'].append(1 if chain_complete else 0)
+        columns['chain_expiry'].append(1 if chain_expiry else 0)
+        for name in self.DIGEST_COLUMNS:
+            digest = cert_info.get(name)
+            columns[name].frombytes(bytes.fromhex(digest) if digest else bytes(self.DIGEST_SIZE))
+
+    def digest(self, name, index):
+        """지문 열의 index번째 값 (16진수)"""
+        return bytes(self.columns[name][index * self.DIGEST_SIZE:(index + 1) * self.DIGEST_SIZE]).hex()
+
+    def row(self, index):
+        """행 하나를 dict로 복원 (보고서 출력용)"""
+        row = {name: self.strings[self.columns[name][index]] for name in self.STRING_COLUMNS}
+        row['san_domains'] = row['san_domains'].split()
+        row.update({name: self.columns[name][index] for name in self.INT_COLUMNS})
+        for name in ('not_before', 'not_after'):
+            row[name] = datetime.fromtimestamp(row[name], timezone.utc)
+        row.update({name: bool(self.columns[name][index]) for name in self.FLAG_COLUMNS})
+        row.update({name: self.digest(name, index) for name in self.DIGEST_COLUMNS})
+        return row
+
+    def save(self, path):
+        """단일 바이너리 파일로 저장 (헤더 → 문자열 풀 → 열 데이터, 8바이트 정렬)"""
+        encoded = [value.encode('utf-8') for value in self.strings]
+        offsets = array('Q', [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        
+        def padding(size):
+            return b'\0' * (-size % 8)
+        
+        columns = {name: column for name, column in self.columns.items() if name not in self.missing_columns}
+        with open(path, 'wb') as f:
+            f.write(self.FILE_HEADER.pack(self.FILE_MAGIC, 0 if sys.byteorder == 'little' else 1,
+                                          len(self), len(encoded), len(columns)))
+            f.write(offsets.tobytes())
+            blob = b''.join(encoded)
+            f.write(blob + padding(len(blob)))
+            for name, column in columns.items():
+                data = column.tobytes() if isinstance(column, array) else bytes(column)
+                width = self.DIGEST_SIZE if name in self.DIGEST_COLUMNS else 1
+                f.write(self.COLUMN_HEADER.pack(name.encode('ascii'), column_typecode(column).encode('ascii'), width, len(data)))
+                f.write(data + padding(len(data)))
+
+    @classmethod
+    def load(cls, path):
+        """save()로 만든 파일을 mmap으로 열기 - 열은 복사 없이 memoryview, 문자열은 필요할 때 디코딩"""
+        
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        magic, byteorder, rows, string_count, column_count = cls.FILE_HEADER.unpack_from(mapped, 0)
+        if magic != cls.FILE_MAGIC:
+            raise ValueError("인증서 테이블 파일이 아닙니다.")
+        swap = (byteorder == 0) != (sys.byteorder == 'little')
+        
+        def column_view(start, nbytes, typecode):
+            if swap:
+                values = array(typecode)
+                values.frombytes(bytes(view[start:start + nbytes]))
+                values.byteswap()
+                return values
+            return view[start:start + nbytes].cast(typecode)
+        
+        table = cls()
+        offset = cls.FILE_HEADER.size
+        offsets = column_view(offset, (string_count + 1) * 8, 'Q')
+        offset += (string_count + 1) * 8
+        blob_size = offsets[-1]
+        table.strings = _MappedStrings(offsets, mapped, offset)
+        table.string_codes = None
+        offset += blob_size + (-blob_size % 8)
+        
+        loaded = set()
+        for _ in range(column_count):
+            name, typecode, width, nbytes = cls.COLUMN_HEADER.unpack_from(mapped, offset)
+            offset += cls.COLUMN_HEADER.size
+            name = name.rstrip(b'\0').decode('ascii')
+            table.columns[name] = column_view(offset, nbytes, typecode.decode('ascii'))
+            loaded.add(name)
+            offset += nbytes + (-nbytes % 8)
+        if len(table) != rows:
+            raise ValueError("인증서 테이블 파일이 손상되었습니다.")
+        
+        # 이전 형식 파일에 없는 열은 0으로 채우고 기록 (SnapshotDiff는 이 열을 비교하지 않음)
+        table.missing_columns = set(table.columns) - loaded
+        for name in table.missing_columns:
+            column = table.columns[name]
+            width = cls.DIGEST_SIZE if name in cls.DIGEST_COLUMNS else 1
+            column.frombytes(bytes(rows * width * column.itemsize))
+        table.mapped = mapped
+        return table
+
+    def materialize(self):
+        """mmap으로 연 테이블을 메모리 array로 복사 (행 추가 전)"""
+        for name, column in self.columns.items():
+            if not isinstance(column, array):
+                values = array(column.format)
+                values.frombytes(column.tobytes())
+                self.columns[name] = values
+        self.strings = list(self.strings)
+        self.string_codes = None
+        self.mapped = None
+
+    def export_csv(self, path):
+        """CSV로 내보내기 (날짜는 ISO 8601 UTC, SAN은 공백 구분)"""
+        import csv
+        
+        names = list(self.STRING_COLUMNS) + list(self.INT_COLUMNS) + list(self.FLAG_COLUMNS) + list(self.DIGEST_COLUMNS)
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            for index in range(len(self)):
+                row = self.row(index)
+                row['san_domains'] = ' '.join(row['san_domains'])
+                for name in ('not_before', 'not_after'):
+                    row[name] = row[name].strftime('%Y-%m-%dT%H:%M:%SZ')
+                writer.writerow([row[name] for name in names])
+
+
+def column_typecode(column):
+    """array 또는 memoryview 열의 typecode"""
+    return column.typecode if isinstance(column, array) else column.format
+
+
+class CertificateLinter:
+    """구조화 필드 기반 인증서 정책 점검
+
+    규칙마다 CertificateTable의 필요한 열만 한 번에 훑어 위반 행 번호 목록을 만듭니다.
+    리프 전용 규칙(유효기간, SAN, serverAuth)은 CA 인증서를 제외합니다.
+    """
+
+    RULES = [
+        ('rsa_key_too_small', 'error', 'RSA 키 길이 부족'),
+        ('banned_curve', 'error', '사용 금지 타원곡선'),
+        ('weak_signature_hash', 'error', '취약한 서명 해시 (SHA-1/MD5)'),
+        ('validity_too_long', 'warning', '리프 유효기간 초과'),
+        ('missing_san', 'error', '리프에 SAN 없음'),
+        ('missing_server_auth', 'warning', '리프에 serverAuth EKU 없음'),
+    ]
+
+    def __init__(self, min_rsa_bits=2048, banned_curves=('secp192r1', 'secp224r1', 'sect163k1', 'sect163r2'),
+                 banned_hashes=('md5', 'sha1'), max_validity_days=398):
+        self.min_rsa_bits = min_rsa_bits
+        self.banned_curves = set(banned_curves)
+        self.banned_hashes = set(banned_hashes)
+        self.max_validity_days = max_validity_days
+
+    def run(self, table):
+        """{규칙 ID: 위반 행 번호 목록}"""
+        return {rule_id: getattr(self, 'rule_' + rule_id)(table) for rule_id, _, _ in self.RULES}
+
+    def codes(self, table, values):
+        return {table.code(value) for value in values} - {None}
+
+    def rule_rsa_key_too_small(self, table):
+        rsa_code = table.code('RSA')
+        key_types, key_bits = table.columns['key_type'], table.columns['key_bits']
+        return [i for i, (key_type, bits) in enumerate(zip(key_types, key_bits))
+                if key_type == rsa_code and bits < self.min_rsa_bits]
+
+    def rule_banned_curve(self, table):
+        banned = self.codes(table, self.banned_curves)
+        return [i for i, curve in enumerate(table.columns['curve']) if curve in banned] if banned else []
+
+    def rule_weak_signature_hash(self, table):
+        banned = self.codes(table, self.banned_hashes)
+        return [i for i, code in enumerate(table.columns['signature_hash']) if code in banned] if banned else []
+
+    def rule_validity_too_long(self, table):
+        limit = self.max_validity_days
+        return [i for i, (days, is_ca) in enumerate(zip(table.columns['validity_days'], table.columns['is_ca']))
+                if days > limit and not is_ca]
+
+    def rule_missing_san(self, table):
+        return [i for i, (has_san, is_ca) in enumerate(zip(table.columns['has_san'], table.columns['is_ca']))
+                if not has_san and not is_ca]
+
+    def rule_missing_server_auth(self, table):
+        return [i for i, (server_auth, is_ca) in enumerate(zip(table.columns['server_auth'], table.columns['is_ca']))
+                if not server_auth and not is_ca]
+
+    def summarize(self, findings):
+        """[(규칙 ID, 심각도, 설명, 위반 수)] - 위반이 있는 규칙만"""
+        return [(rule_id, severity, description, len(findings[rule_id]))
+                for rule_id, severity, description in self.RULES if findings.get(rule_id)]
+
+
+class ExpiryForecast:
+    """CertificateTable의 not_after 열(epoch 초) 기반 만료 예측
+
+    기준 시각부터 horizon_days까지를 주 또는 달력 월 구간으로 나눈 경계 배열을 먼저 만들고,
+    열을 한 번 정렬한 뒤 경계마다 이진 탐색으로 구간별 수를 세므로 행마다 datetime을 만들지 않습니다.
+    체인별 가장 먼저 만료되는 인증서는 체인 검증의 유효 만료(chain_expiry 열)를 그대로 쓰므로
+    상태 패널의 체인 유효기간과 같은 인증서를 가리킵니다.
+    """
+
+    BUCKETS = ('week', 'month')
+
+    def __init__(self, as_of=None, horizon_days=90, bucket='week'):
+        if bucket not in self.BUCKETS:
+            raise ValueError(f"지원하지 않는 구간 단위입니다: {bucket}")
+        as_of = as_of or datetime.now(timezone.utc)
+        self.as_of = as_of if as_of.tzinfo else as_of.replace(tzinfo=timezone.utc)
+        self.horizon_days = max(1, horizon_days)
+        self.bucket = bucket
+
+    def bucket_edges(self):
+        """구간 경계 epoch 초 [기준 시각, ..., 예측 끝] - 월 단위는 매월 1일 00:00 UTC에서 나눔"""
+        start = int(self.as_of.timestamp())
+        end = start + self.horizon_days * 86400
+        if self.bucket == 'week':
+            edges = list(range(start, end, 7 * 86400))
+        else:
+            edges = [start]
+            year, month = self.as_of.year, self.as_of.month
+            while True:
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+                edge = int(datetime(year, month, 1, tzinfo=timezone.utc).timestamp())
+                if edge >= end:
+                    break
+                edges.append(edge)
+        edges.append(end)
+        return edges
+
+    def run(self, table):
+        """예측 보고서 dict
+
+        expired: 기준 시각에 이미 만료된 수, buckets: [(구간 시작, 구간 끝, 만료 수)],
+        later: 예측 기간 이후 만료 수, chains: 체인별 유효 만료 인증서 [(not_after epoch 초, 행 번호)] 만료 순
+        (chain_expiry 열이 없는 이전 형식 테이블은 파일별 가장 이른 not_after)
+        label_format: 구간 표시용 strftime 형식 (예측 기간이 해를 넘기면 연도 포함)
+        """
+        edges = self.bucket_edges()
+        not_after = table.columns['not_after']
+        
+        # 구간 번호: 0 = 이미 만료, 1..n = 예측 구간, n+1 = 예측 기간 이후
+        # 경계 e 앞의 값 수 = 정렬된 열에서 bisect_left(e), 인접 경계의 차가 구간별 수
+        values = sorted(not_after)
+        before = [0] + [bisect_left(values, edge) for edge in edges] + [len(values)]
+        counts = [high - low for low, high in zip(before, before[1:])]
+        
+        if 'chain_expiry' in table.missing_columns:
+            earliest = {}  # 파일 경로 코드 → 가장 먼저 만료되는 행
+            for index, (path_code, value) in enumerate(zip(table.columns['file_path'], not_after)):
+                current = earliest.get(path_code)
+                if current is None or value < not_after[current]:
+                    earliest[path_code] = index
+            chain_rows = earliest.values()
+        else:
+            chain_rows = [index for index, flag in enumerate(table.columns['chain_expiry']) if flag]
+        
+        def to_datetime(epoch):
+            return datetime.fromtimestamp(epoch, timezone.utc)
+        
+        horizon_end = to_datetime(edges[-1])
+        return {
+            'as_of': self.as_of,
+            'horizon_days': self.horizon_days,
+            'bucket': self.bucket,
+            'total': len(table),
+            'horizon_end': horizon_end,
+            'label_format': '%m-%d' if horizon_end.year == self.as_of.year else '%y-%m-%d',
+            'expired': counts[0],
+            'buckets': [(to_datetime(edges[i - 1]), to_datetime(edges[i]), counts[i]) for i in range(1, len(edges))],
+            'later': counts[-1],
+            'chains': sorted((not_after[index], index) for index in chain_rows)
+        }
+
+
+class SnapshotDiff:
+    """두 CertificateTable 스냅샷의 변경 사항 (파일 경로 + 지문 해시 조인)
+
+    이전 스냅샷의 (경로, 지문)으로 해시 테이블을 만들고 새 스냅샷 행으로 조회하므로 행 수에 선형입니다.
+    짝이 없는 행은 같은 파일·같은 Subject끼리 다시 맞춰 갱신(같은 키)과 키 변경을 구분하고,
+    나머지는 추가/제거로 봅니다. 파일별 체인은 chain_complete 열(체인 검증의 is_complete)이 바뀐 경우만 보고합니다.
+    """
+
+    CHANGES = ('added', 'removed', 'renewed', 'key_changed', 'chain_broken', 'chain_repaired')
+
+    def __init__(self, old, new):
+        self.old = old
+        self.new = new
+
+    @staticmethod
+    def path_names(table):
+        """파일 경로 코드 → 문자열 (mmap 테이블도 코드마다 한 번만 디코딩)"""
+        return {code: table.strings[code] for code in set(table.columns['file_path'])}
+
+    @staticmethod
+    def keyed_rows(table, names):
+        """{(파일 경로, SHA-256 지문 바이트): 행 번호}"""
+        size = table.DIGEST_SIZE
+        fingerprints = bytes(table.columns['fingerprint_sha256'])
+        return {(names[code], fingerprints[index * size:(index + 1) * size]): index
+                for index, code in enumerate(table.columns['file_path'])}
+
+    @staticmethod
+    def chain_states(table, names):
+        """{파일 경로: (체인 완전 여부, 체인 상태)} (파일의 첫 행 기준)
+
+        chain_complete 열이 없는 이전 형식 스냅샷은 빈 dict (체인 변경을 판정하지 않음)
+        """
+        if 'chain_complete' in table.missing_columns:
+            return {}
+        first_rows = {}
+        for index, code in enumerate(table.columns['file_path']):
+            if code not in first_rows:
+                first_rows[code] = index
+        complete, statuses = table.columns['chain_complete'], table.columns['chain_status']
+        decoded = {code: table.strings[code] for code in {statuses[index] for index in first_rows.values()}}
+        return {names[code]: (bool(complete[index]), decoded[statuses[index]]) for code, index in first_rows.items()}
+
+    @staticmethod
+    def describe(table, index):
+        """변경 레코드에 넣을 행 요약"""
+        return {
+            'subject': table.strings[table.columns['subject'][index]],
+            'serial': table.strings[table.columns['serial'][index]],
+            'not_after': datetime.fromtimestamp(table.columns['not_after'][index], timezone.utc).isoformat(),
+            'fingerprint_sha256': table.digest('fingerprint_sha256', index),
+            'spki_sha256': table.digest('spki_sha256', index)
+        }
+
+    def run(self):
+        """변경 레코드(dict)를 하나씩 생성 - change: CHANGES 중 하나"""
+        old_names, new_names = self.path_names(self.old), self.path_names(self.new)
+        old_rows = self.keyed_rows(self.old, old_names)
+        new_rows = self.keyed_rows(self.new, new_names)
+        
+        # 지문이 그대로인 행은 변경 없음 - 짝 없는 이전 행은 (경로, Subject)별 갱신 후보
+        subjects = self.old.columns['subject']
+        candidates = {}
+        for key, index in old_rows.items():
+            if key not in new_rows:
+                candidates.setdefault((key[0], self.old.strings[subjects[index]]), []).append(index)
+        
+        subjects = self.new.columns['subject']
+        for key, index in new_rows.items():
+            if key in old_rows:
+                continue
+            path = key[0]
+            new = self.describe(self.new, index)
+            group = candidates.get((path, new['subject']))
+            if not group:
+                yield {'change': 'added', 'file_path': path, 'new': new}
+                continue
+            old = self.describe(self.old, group.pop())
+            change = 'renewed' if old['spki_sha256'] == new['spki_sha256'] else 'key_changed'
+            yield {'change': change, 'file_path': path, 'old': old, 'new': new}
+        
+        for (path, _), indexes in candidates.items():
+            for index in indexes:
+                yield {'change': 'removed', 'file_path': path, 'old': self.describe(self.old, index)}
+        
+        old_states = self.chain_states(self.old, old_names)
+        for path, (complete, status) in self.chain_states(self.new, new_names).items():
+            old_state = old_states.get(path)
+            if old_state is None or old_state[0] == complete:
+                continue
+            yield {'change': 'chain_repaired' if complete else 'chain_broken', 'file_path': path,
+                   'old': {'chain_complete': old_state[0], 'chain_status': old_state[1]},
+                   'new': {'chain_complete': complete, 'chain_status': status}}
+
+
+class _CertificateRef:
+    """프로세스 간 전송용 인증서 자리표시자 (DER) - 받는 쪽에서 인증서 객체로 복원"""
+
+    __slots__ = ('der',)
+
+    def __init__(self, der):
+        self.der = der
+
+
+def _pack_result(value):
+    """분석 결과를 프로세스 간 전송 가능한 형태로 변환 (인증서 객체 → DER, PEM 블록 파싱 캐시 제거)"""
+    if isinstance(value, dict):
+        return {key: _pack_result(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_pack_result(item) for item in value)
+    if isinstance(value, x509.Certificate):
+        return _CertificateRef(value.public_bytes(serialization.Encoding.DER))
+    if isinstance(value, PemBlock):
+        block = PemBlock.__new__(PemBlock)
+        block.label, block.kind, block.data, block.offset, block._parsed = value.label, value.kind, value.data, value.offset, None
+        return block
+    return value
+
+
+def _unpack_result(value, loaded=None):
+    """_pack_result의 역변환 - 같은 인증서는 한 번만 파싱"""
+    if loaded is None:
+        loaded = {}
+    if isinstance(value, dict):
+        return {key: _unpack_result(item, loaded) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unpack_result(item, loaded) for item in value)
+    if isinstance(value, _CertificateRef):
+        if value.der not in loaded:
+            loaded[value.der] = x509.load_der_x509_certificate(value.der)
+        return loaded[value.der]
+    return value
+
+
+def _supervised_worker_main(conn, memory_limit_mb, pfx_password, pfx_passwords, as_of=None):
+    """감시 작업 프로세스 - (번호, 경로)를 받아 형식 분석 후 (번호, 성공 여부, 결과 또는 오류) 전송"""
+    if memory_limit_mb:
+        try:
+            import resource  # POSIX 전용 (Windows에서는 메모리 제한 없이 시간 제한만 적용)
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass
+    
+    analyzer = CertificateAnalyzer(pfx_password=pfx_password, pfx_passwords=pfx_passwords, pfx_workers=0,
+                                   as_of=as_of)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        index, filepath = task
+        try:
+            message = (index, True, _pack_result(analyzer.analyze_file_format(filepath)))
+        except MemoryError:
+            message = (index, False, f"메모리 제한 초과 ({memory_limit_mb}MB)")
+        except Exception as e:
+            message = (index, False, str(e))
+        conn.send(message)
+
+
+class SupervisedWorkerPool:
+    """파일별 분석을 감시되는 작업 프로세스에서 실행 (파일당 시간 제한 + 프로세스 메모리 제한)
+
+    깊은 ASN.1 중첩이나 거대한 PFX 반복 횟수 같은 병적인 입력으로 작업 프로세스가 멈추거나
+    죽으면 프로세스를 종료하고 새로 띄운 뒤 해당 파일만 오류로 기록하므로,
+    파일 하나가 배치 전체를 붙잡지 않습니다. 메모리 제한(RLIMIT_AS)은 POSIX에서만 적용됩니다.
+    """
+
+    DEFAULT_TIMEOUT = 60         # 파일 하나의 최대 분석 시간 (초)
+    DEFAULT_MEMORY_LIMIT_MB = 2048
+
+    def __init__(self, workers=None, timeout=DEFAULT_TIMEOUT, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB,
+                 pfx_password='', pfx_passwords=None, as_of=None):
+        self.workers = workers or max(1, min(8, os.cpu_count() or 1))
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.pfx_password = pfx_password
+        self.pfx_passwords = list(pfx_passwords or [])
+        self.as_of = as_of
+        self.idle = []       # 대기 중인 (프로세스, 연결)
+        self.restarts = 0    # 시간 초과/비정상 종료로 다시 띄운 횟수
+
+    def start_worker(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_supervised_worker_main,
+            args=(child_conn, self.memory_limit_mb, self.pfx_password, self.pfx_passwords, self.as_of),
+            daemon=True)
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    @staticmethod
+    def stop_worker(worker, kill=False):
+        process, conn = worker
+        if not kill:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                kill = True
+            process.join(timeout=1)
+        if kill or process.is_alive():
+            process.kill()
+            process.join()
+        conn.close()
+
+    def get_worker(self):
+        """대기 중인 작업 프로세스 (죽어 있으면 새로 띄움)"""
+        while self.idle:
+            worker = self.idle.pop()
+            if worker[0].is_alive():
+                return worker
+            self.stop_worker(worker, kill=True)
+        return self.start_worker()
+
+    def imap(self, tasks):
+        """(번호, 파일 경로) 작업을 나눠 실행 - 완료 순서대로 (번호, 성공 여부, 결과 또는 오류 메시지) 반환"""
+        pending = list(reversed(tasks))
+        busy = {}  # 연결 → (작업 프로세스, 번호, 시작 시각)
+        try:
+            while pending or busy:
+                while pending and len(busy) < self.workers:
+                    worker = self.get_worker()
+                    index, filepath = pending.pop()
+                    try:
+                        worker[1].send((index, filepath))
+                    except (OSError, ValueError):
+                        self.stop_worker(worker, kill=True)
+                        pending.append((index, filepath))
+                        continue
+                    busy[worker[1]] = (worker, index, time.monotonic())
+                
+                deadline = min(started for _, _, started in busy.values()) + self.timeout
+                for conn in wait_connections(list(busy), timeout=max(0, deadline - time.monotonic())):
+                    worker, index, _ = busy.pop(conn)
+                    try:
+                        _, ok, payload = conn.recv()
+                    except (EOFError, OSError):
+                        # 작업 중 프로세스가 죽음 (메모리 제한으로 인한 강제 종료, 파서 크래시 등)
+                        worker[0].join(timeout=1)
+                        self.stop_worker(worker, kill=True)
+                        self.restarts += 1
+                        yield index, False, f"작업 프로세스 비정상 종료 (종료 코드 {worker[0].exitcode})"
+                        continue
+                    self.idle.append(worker)
+                    yield index, ok, payload
+                
+                now = time.monotonic()
+                for conn, (worker, index, started) in list(busy.items()):
+                    if now - started >= self.timeout:
+                        del busy[conn]
+                        self.stop_worker(worker, kill=True)
+                        self.restarts += 1
+                        yield index, False, f"분석 시간 초과 ({self.timeout:g}초) - 작업 프로세스를 다시 시작했습니다"
+        finally:
+            # 중단된 경우 진행 중이던 작업 프로세스는 결과를 기다리지 않고 종료
+            for worker, _, _ in busy.values():
+                self.stop_worker(worker, kill=True)
+
+    def close(self, kill=False):
+        """대기 중인 작업 프로세스 종료 (kill=True이면 정상 종료를 기다리지 않음)"""
+        while self.idle:
+            self.stop_worker(self.idle.pop(), kill)
+
+
+class CertificateAnalyzer:
+    """인증서 분석 엔진 (GUI 비의존)
+
+    파일 파싱, 정보 추출, 체인 검증 로직을 담당합니다.
+    GUI 클래스가 상속해서 사용하며, 벤치마크/스크립트에서는 단독으로 생성할 수 있습니다.
+    """
+
+    # PFX 복호화 전용 프로세스 풀 기본 크기 (0이면 풀 없이 현재 스레드에서 처리)
+    DEFAULT_PFX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+    EXPIRING_DAYS = 30  # 남은 기간이 이보다 짧으면 "곧 만료"
+
+    def __init__(self, pfx_password=None, pfx_passwords=None, pfx_workers=None,
+                 file_timeout=None, memory_limit_mb=None, as_of=None):
+        self.pfx_password = pfx_password
+        self.pfx_password_cache = PfxPasswordCache(pfx_passwords)
+        self.pfx_workers = self.DEFAULT_PFX_WORKERS if pfx_workers is None else pfx_workers
+        self.pfx_pool = None
+        # file_timeout 지정 시 analyze_batch는 파일마다 감시 작업 프로세스(SupervisedWorkerPool)에서 분석
+        self.file_timeout = file_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.supervised_pool = None
+        self.crl_index = None  # CrlIndex 지정 시 분석 결과에 오프라인 폐기 확인 적용
+        self.ocsp_client = None  # OcspClient 지정 시 apply_ocsp_checks로 실시간 폐기 확인
+        self.aia_mirror = None  # AiaMirror 지정 시 불완전한 체인을 AIA 미러로 보완
+        self.as_of = as_of  # 유효기간 판정 기준 시각 (None이면 분석 시점의 현재 시각)
+
+    def evaluation_time(self):
+        """유효기간 판정 기준 시각 (UTC)"""
+        if self.as_of is None:
+            return datetime.now(timezone.utc)
+        return self.as_of if self.as_of.tzinfo else self.as_of.replace(tzinfo=timezone.utc)
+
+    def get_pfx_password(self):
+        """PFX 복호화에 사용할 비밀번호 (GUI에서는 입력 필드 값으로 재정의)"""
+        return self.pfx_password or ''
+    
+    def is_certificate_file(self, filepath):
+        """인증서 파일인지 확인 (확장자 + 파일 크기)"""
+        try:
+            # 파일 존재 여부 확인
+            if not os.path.exists(filepath) or not os.path.isfile(filepath):
+                return False
+            
+            # 확장자 확인
+            cert_extensions = ['.pem', '.crt', '.cer', '.pfx', '.p12', '.der'] + KEYSTORE_EXTENSIONS
+            if not any(filepath.lower().endswith(ext) for ext in cert_extensions):
+                return False
+            
+            # 파일 크기 확인 (100바이트 ~ 안전 상한: PEM 텍스트는 mmap 스트리밍이라 크게 허용)
+            file_size = os.path.getsize(filepath)
+            is_pem_text = filepath.lower().endswith(('.pem', '.crt', '.cer'))
+            if file_size < 100 or file_size > (MAX_PEM_FILE_SIZE if is_pem_text else MAX_BINARY_FILE_SIZE):
+                return False
+            
+            # 기본적인 파일 내용 확인
+            try:
+                with open(filepath, 'rb') as f:
+                    header = f.read(100)  # 첫 100바이트만 확인
+                    
+                # PEM 형식 확인
+                if filepath.lower().endswith(('.pem', '.crt', '.cer')):
+                    if b'-----BEGIN' not in header and b'-----' not in header:
+                        # BASE64 인코딩된 내용이 있는지 확인
+                        try:
+                            header_str = header.decode('ascii', errors='ignore')
+                            if not any(c.isalnum() for c in header_str):
+                                return False
+                        except:
+                            return False
+                
+                # DER 형식 확인 (바이너리)
+                elif filepath.lower().endswith('.der'):
+                    # ASN.1 DER 형식은 0x30으로 시작
+                    if not header.startswith(b'\x30'):
+                        return False
+                
+                # PFX/P12 형식 확인
+                elif filepath.lower().endswith(('.pfx', '.p12')):
+                    # PKCS#12 매직 바이트 확인
+                    if not (header.startswith(b'\x30') or b'PK' in header[:20]):
+                        return False
+                
+                # Java 키스토어 확인 (JKS/JCEKS 매직 또는 PKCS#12 키스토어)
+                elif filepath.lower().endswith(tuple(KEYSTORE_EXTENSIONS)):
+                    if not (header[:4] in (b'\xfe\xed\xfe\xed', b'\xce\xce\xce\xce') or header.startswith(b'\x30')):
+                        return False
+                        
+            except (IOError, OSError):
+                return False
+            
+            return True
+            
+        except Exception:
+            return False
+    
+    def collect_certificate_files(self, paths):
+        """파일/폴더 경로 목록에서 인증서 파일 목록 구성 (폴더는 하위까지 탐색)"""
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames.sort()
+                    for filename in sorted(filenames):
+                        filepath = os.path.join(dirpath, filename)
+                        if self.is_certificate_file(filepath):
+                            files.append(filepath)
+            else:
+                files.append(path)
+        return files
+    
+    def analyze_source(self, source, source_name=None):
+        """분석 진입점 - 경로(str)는 파일로, bytes/memoryview는 메모리 데이터로 분석"""
+        if isinstance(source, str):
+            return self.analyze_certificate(source)
+        return self.analyze_data(source, source_name or '붙여넣기')
+    
+    def analyze_data(self, data, source_name='붙여넣기'):
+        """메모리의 인증서 데이터 분석 (붙여넣기·네트워크 수신 데이터, 임시 파일 없이)
+        
+        PEM 블록이 있으면 PEM 분석, 없으면 내용으로 JKS/JCEKS, PKCS#12, DER 인증서를 구분해 분석
+        (헤더 없는 base64 텍스트는 디코딩 후 판별)
+        """
+        try:
+            data = memoryview(data).cast('B')
+            if PEM_BLOCK_RE.search(data):
+                result = self.analyze_pem_data(data, source_name)
+            elif bytes(data[:4]) in (b'\xfe\xed\xfe\xed', b'\xce\xce\xce\xce'):
+                result = self.analyze_keystore_data(bytes(data), source_name)
+            else:
+                der_data = decode_base64_text(data) or bytes(data)
+                if sniff_der_kind(der_data) == 'pkcs12':
+                    result = self.analyze_pkcs12_data(der_data, source_name)
+                else:
+                    result = self.analyze_der_data(der_data)
+            result['source_name'] = source_name
+            return self.finalize_result(result)
+        except Exception as e:
+            return self.make_error_result(e)
+    
+    def analyze_certificate(self, filepath):
+        """인증서 분석 (기존 로직 재사용)"""
+        try:
+            return self.finalize_result(self.analyze_file_format(filepath))
+        except Exception as e:
+            return self.make_error_result(e)
+    
+    def analyze_file_format(self, filepath):
+        """확장자별 형식 분석 (후처리 전 단계 - 감시 작업 프로세스에서는 이 단계만 실행)"""
+        file_ext = os.path.splitext(filepath)[1].lower()
+        if file_ext in ['.pfx', '.p12']:
+            return self.analyze_pkcs12_certificate(filepath)
+        elif file_ext in KEYSTORE_EXTENSIONS:
+            return self.analyze_keystore(filepath)
+        elif file_ext == '.der':
+            return self.analyze_der_certificate(filepath)
+        return self.analyze_pem_certificate(filepath)
+    
+    def finalize_result(self, result):
+        """형식별 분석 후 공통 후처리 (AIA 체인 보완 → 오프라인 CRL 폐기 확인 → 체인 유효기간)"""
+        if self.aia_mirror is not None and result.get('certificates'):
+            self.apply_aia_completion(result)
+        if self.crl_index is not None:
+            self.apply_revocation_check(result)
+        self.apply_chain_expiry(result)
+        return result
+    
+    def apply_chain_expiry(self, result):
+        """체인(키스토어는 별칭별 체인)의 유효 만료 시각을 chain_info에 기록 - 대용량 묶음은 체인이 아니므로 제외"""
+        if 'bundle_stats' in result:
+            return
+        chains = [(result.setdefault('chain_info', {}), result.get('certificates', [result]))]
+        chains += [(entry['chain_info'], entry['certificates']) for entry in result.get('keystore_entries', [])]
+        for chain_info, cert_infos in chains:
+            chain_info.update(self.get_chain_expiry(cert_infos))
+    
+    def get_chain_expiry(self, cert_infos):
+        """체인의 유효 만료 = 리프부터 발급 관계로 이어진 중간 CA·루트 중 가장 이른 not_after와 그 인증서
+        
+        리프가 유효해도 중간 CA가 먼저 만료되면 그 시점에 체인 전체가 검증에 실패합니다.
+        체인은 order_certificate_chain으로 리프부터 이어 붙이므로 같은 파일에 있어도
+        연결되지 않은 인증서는 세지 않습니다. expiry_position은 리프(0)부터의 체인 내 위치입니다.
+        """
+        linked_infos = [info for info in cert_infos if info.get('cert_object') is not None]
+        if linked_infos:
+            infos_by_cert = {id(info['cert_object']): info for info in linked_infos}
+            chain, _, _ = self.order_certificate_chain(*self.certificates_and_records(linked_infos))
+            cert_infos = [infos_by_cert[id(cert)] for cert in chain]
+        dated = [(info['not_after'], position, info) for position, info in enumerate(cert_infos) if info.get('not_after')]
+        if not dated:
+            return {}
+        not_after, position, weakest = min(dated, key=lambda item: (item[0], item[1]))
+        return {
+            'effective_not_after': not_after,
+            'expiry_position': position,
+            'expiry_subject': weakest.get('subject', ''),
+            'expiry_fingerprint': weakest.get('fingerprint_sha256', ''),
+            'expiry_status': weakest.get('validity_status', ''),
+            'expiry_color': weakest.get('validity_color', ''),
+            'expiry_before_leaf': position > 0  # 같은 시각이면 리프를 택하므로 리프보다 먼저 만료
+        }
+    
+    @staticmethod
+    def chain_expiry_sort_key(result):
+        """결과 정렬 키 - 체인 유효 만료가 이른 순 (분석 실패 등 만료 시각 없는 결과는 뒤로)"""
+        not_after = result.get('chain_info', {}).get('effective_not_after')
+        return (not_after is None, not_after.timestamp() if not_after else 0)
+    
+    def apply_aia_completion(self, result):
+        """불완전한 체인이면 빠진 중간/루트 인증서를 AIA 미러에서 찾아 체인에 추가하고 다시 검증"""
+        if result.get('chain_info', {}).get('is_complete') or 'bundle_stats' in result:
+            return
+        cert_infos = result['certificates']
+        certificates = [info.get('cert_object') for info in cert_infos]
+        if any(cert is None for cert in certificates):
+            return
+        
+        added = self.aia_mirror.complete_chain(certificates, [info.get('extension_record') for info in cert_infos])
+        if not added:
+            return
+        for cert in added:
+            cert_info = self.extract_certificate_info(cert)
+            cert_info['source'] = 'aia'
+            cert_infos.append(cert_info)
+        
+        chain_info = self.verify_certificate_chain(certificates + added)
+        chain_info['details'] = f"🧩 파일에 없는 인증서 {len(added)}개를 AIA 미러에서 보완\n" + chain_info.get('details', '')
+        result['chain_info'] = chain_info
+        result['aia_added'] = len(added)
+    
+    def apply_revocation_check(self, result):
+        """체인의 각 인증서를 CRL 색인으로 확인하고 폐기된 인증서가 있으면 체인 상태 갱신"""
+        revoked_lines = []
+        for cert_infos in self.get_certificate_lists(result):
+            certificates = [info.get('cert_object') for info in cert_infos if info.get('cert_object') is not None]
+            for cert_info in cert_infos:
+                cert = cert_info.get('cert_object')
+                if cert is None or 'revocation_status' in cert_info:
+                    continue
+                # CRL 서명은 같은 체인 안의 발급자 인증서로 확인 (없으면 AIA 미러, 그다음 CRL 디렉토리의 CA 인증서)
+                issuers = [candidate for candidate in certificates if candidate.subject == cert.issuer]
+                if not issuers and self.aia_mirror is not None:
+                    issuers = self.aia_mirror.find_issuers(cert)
+                revocation = self.crl_index.lookup(cert, issuers)
+                cert_info['revocation_status'] = revocation['status']
+                cert_info['revocation'] = revocation if revocation['status'] == 'revoked' else None
+                cert_info['revocation_checked'] = revocation['status'] in ('revoked', 'good')
+                cn = self.extract_cn_from_subject(cert_info.get('subject', ''))
+                if revocation['status'] == 'revoked':
+                    revoked_at = revocation['revocation_date'].strftime('%Y-%m-%d')
+                    revoked_lines.append(f"⛔ 폐기됨: {cn} ({revoked_at}, {os.path.basename(revocation['crl_path'])})")
+                elif revocation['status'] == 'unverified':
+                    revoked_lines.append(f"⚠️ CRL 미검증 (발급자 인증서 없음 또는 서명 불일치, 적용 안 함): {cn}의 발급자 CRL "
+                                         f"({os.path.basename(revocation['crl_path'])})")
+                if revocation['stale']:
+                    revoked_lines.append(f"⚠️ CRL 갱신 필요 (nextUpdate 지남): {cn}의 발급자 CRL")
+        
+        if result.get('certificates'):
+            leaf_info = result['certificates'][0]
+            result['revocation'] = leaf_info.get('revocation')
+        
+        self.add_revocation_details(result, revoked_lines)
+    
+    def get_certificate_lists(self, result):
+        """결과에 담긴 체인별 인증서 정보 목록 (키스토어는 항목별 체인)"""
+        cert_lists = [result.get('certificates', [])]
+        cert_lists += [entry['certificates'] for entry in result.get('keystore_entries', [])]
+        return cert_lists
+    
+    def add_revocation_details(self, result, lines):
+        """폐기 확인 결과를 체인 상세에 덧붙이고, 폐기(⛔) 항목이 있으면 체인 상태 갱신"""
+        if not lines:
+            return
+        chain_info = dict(result.get('chain_info', {}))
+        chain_info['details'] = '\n'.join(filter(None, [chain_info.get('details', '')] + lines))
+        if any(line.startswith('⛔') for line in lines):
+            chain_info['status'] = '❌ 폐기된 인증서 포함'
+            chain_info['is_complete'] = False
+        result['chain_info'] = chain_info
+    
+    def apply_ocsp_checks(self, results):
+        """여러 결과의 리프/발급자 쌍을 모아 OCSP로 한 번에 확인
+        
+        응답자별로 묶어 보내므로 같은 중간 CA 아래 리프가 많아도 왕복 횟수가 적습니다.
+        """
+        targets = []
+        for result in results:
+            for cert_infos in self.get_certificate_lists(result):
+                if not cert_infos or cert_infos[0].get('cert_object') is None:
+                    continue
+                leaf_info = cert_infos[0]
+                leaf = leaf_info['cert_object']
+                issuer = next((info['cert_object'] for info in cert_infos[1:]
+                               if info.get('cert_object') is not None and info['cert_object'].subject == leaf.issuer), None)
+                if issuer is None:
+                    leaf_info['ocsp'] = {'status': 'no_issuer', 'error': '파일에 발급자 인증서가 없어 OCSP 요청 불가'}
+                    continue
+                targets.append((result, leaf_info, leaf, issuer))
+        
+        statuses = self.ocsp_client.check([(leaf, issuer) for _, _, leaf, issuer in targets],
+                                          records=[leaf_info.get('extension_record') for _, leaf_info, _, _ in targets]
+                                          ) if targets else []
+        
+        lines_by_result = {}
+        for (result, leaf_info, _, _), status in zip(targets, statuses):
+            leaf_info['ocsp'] = status
+            cn = self.extract_cn_from_subject(leaf_info.get('subject', ''))
+            lines = lines_by_result.setdefault(id(result), (result, []))[1]
+            if status['status'] == 'revoked':
+                revoked_at = status['revocation_time'].strftime('%Y-%m-%d') if status['revocation_time'] else '?'
+                lines.append(f"⛔ OCSP 폐기됨: {cn} ({revoked_at})")
+            elif status['status'] == 'error':
+                lines.append(f"⚠️ OCSP 확인 실패: {cn} - {status['error']}")
+            elif status['status'] == 'unknown':
+                lines.append(f"⚠️ OCSP 응답자가 알 수 없는 인증서: {cn}")
+            elif status['status'] == 'unverified':
+                kind = '폐기 응답' if status.get('reported_status') == 'revoked' else f"{status.get('reported_status')} 응답"
+                lines.append(f"⚠️ OCSP {kind} 서명 확인 불가 (적용 안 함): {cn}")
+        
+        for result in results:
+            if result.get('certificates'):
+                result['ocsp'] = result['certificates'][0].get('ocsp')
+        for result, lines in lines_by_result.values():
+            self.add_revocation_details(result, lines)
+    
+    def analyze_pem_certificate(self, filepath):
+        """PEM/CRT 인증서 분석 (LARGE_BUNDLE_SIZE를 넘는 묶음은 스트리밍 분석)"""
+        if os.path.getsize(filepath) > LARGE_BUNDLE_SIZE:
+            return self.analyze_large_bundle(filepath)
+        with open(filepath, 'rb') as f:
+            cert_data = f.read()
+        return self.analyze_pem_data(cert_data, filepath)
+    
+    def iter_bundle_certificates(self, filepath):
+        """PEM 파일을 mmap으로 열어 (오프셋, 인증서 객체 또는 None)을 하나씩 반환 - 파싱 실패는 None
+        
+        이미 지나간 구간의 페이지는 madvise로 반납해 파일 크기와 무관하게 RSS를 일정하게 유지합니다.
+        """
+        release = getattr(mmap, 'MADV_DONTNEED', None)  # Python 3.8+ / POSIX
+        released = 0
+        with mapped_file(filepath) as data:
+            for block in iter_pem_blocks(data):
+                if release is not None and block.offset - released >= LARGE_BUNDLE_SIZE:
+                    end = block.offset - block.offset % mmap.PAGESIZE
+                    data.madvise(release, released, end - released)
+                    released = end
+                if block.kind != 'certificate':
+                    continue
+                try:
+                    yield block.offset, block.parse()
+                except ValueError:
+                    yield block.offset, None
+    
+    def analyze_large_bundle(self, filepath):
+        """대용량 PEM 묶음(통합 CA 번들, 덤프) 분석 - 블록 단위로 파싱해 메모리 사용량 일정
+        
+        모든 인증서의 만료/CA 여부는 집계하고, 상세 정보(certificates)는 앞쪽
+        BUNDLE_DETAIL_LIMIT개만 보관합니다. 전체 순회는 iter_bundle_certificates()를 사용합니다.
+        """
+        now = self.evaluation_time()
+        certificates = []
+        stats = {'total': 0, 'ca': 0, 'expired': 0, 'expiring': 0, 'errors': 0}
+        earliest = None
+        for offset, cert in self.iter_bundle_certificates(filepath):
+            if cert is None:
+                stats['errors'] += 1
+                continue
+            stats['total'] += 1
+            cert_info = None
+            if len(certificates) < BUNDLE_DETAIL_LIMIT:
+                cert_info = self.extract_certificate_info(cert)
+                stats['ca'] += cert_info['is_ca']
+            else:
+                stats['ca'] += self.is_ca_certificate(cert)
+            not_after = _utc_attr(cert, 'not_valid_after')
+            if not_after < now:
+                stats['expired'] += 1
+            elif (not_after - now).days < self.EXPIRING_DAYS:
+                stats['expiring'] += 1
+            if earliest is None or not_after < earliest[0]:
+                earliest = (not_after, self.format_name(cert.subject))
+            if cert_info is not None:
+                cert_info['position'] = len(certificates)
+                cert_info['offset'] = offset
+                cert_info['cert_object'] = cert
+                certificates.append(cert_info)
+        
+        if not certificates:
+            raise ValueError("유효한 인증서를 찾을 수 없습니다.")
+        
+        result = dict(certificates[0])
+        result['file_type'] = os.path.splitext(filepath)[1].lower()
+        result['cert_count'] = stats['total']
+        result['certificates'] = certificates
+        result['bundle_stats'] = stats
+        details = [f"인증서 {stats['total']:,}개 (CA {stats['ca']:,}개) - 파일 {os.path.getsize(filepath) / (1024 * 1024):.0f} MiB",
+                   f"만료 {stats['expired']:,}개, {self.EXPIRING_DAYS}일 내 만료 {stats['expiring']:,}개",
+                   f"가장 먼저 만료: {earliest[1]} ({earliest[0]:%Y-%m-%d})"]
+        if stats['errors']:
+            details.append(f"⚠️ 파싱 실패 블록 {stats['errors']:,}개")
+        if stats['total'] > len(certificates):
+            details.append(f"상세 정보는 앞쪽 {len(certificates):,}개만 표시")
+        result['chain_info'] = {
+            'status': f"📚 대용량 인증서 묶음 ({stats['total']:,}개)",
+            'details': '\n'.join(details),
+            'is_complete': False
+        }
+        return result
+    
+    def analyze_pem_data(self, cert_data, source_name):
+        """PEM 데이터(bytes/memoryview) 분석 - 파일·붙여넣기 공통 경로"""
+        # 모든 PEM 블록 분류 (인증서/개인키/CSR/CRL) - 파싱은 필요한 블록만
+        pem_blocks = split_pem_blocks(cert_data)
+        cert_pem_blocks = [block for block in pem_blocks if block.kind == 'certificate']
+        cert_blocks = [block.data for block in cert_pem_blocks]
+        
+        if not cert_blocks:
+            found = self.summarize_pem_blocks(pem_blocks)
+            if found:
+                raise ValueError(f"유효한 인증서를 찾을 수 없습니다. (발견: {found})")
+            raise ValueError("유효한 인증서를 찾을 수 없습니다.")
+        
+        # 첫 번째 인증서 분석 (리프 인증서)
+        cert = cert_pem_blocks[0].parse()
+        
+        leaf_info = self.extract_certificate_info(cert)
+        result = dict(leaf_info)
+        result['cert_count'] = len(cert_blocks)
+        result['file_type'] = os.path.splitext(source_name)[1].lower() or '.pem'
+        result['certificates'] = []
+        result['pem_blocks'] = pem_blocks
+        result['pem_summary'] = self.summarize_pem_blocks(pem_blocks)
+        
+        # 모든 인증서 정보 수집 (리프는 위에서 만든 정보를 재사용)
+        for i, block in enumerate(cert_pem_blocks):
+            cert_obj = cert if i == 0 else block.parse()
+            cert_info = leaf_info if i == 0 else self.extract_certificate_info(cert_obj)
+            cert_info['position'] = i
+            cert_info['cert_object'] = cert_obj
+            result['certificates'].append(cert_info)
+        
+        # 같은 파일의 개인키가 리프 인증서와 짝이 맞는지 확인
+        key_blocks = [block for block in pem_blocks if block.kind == 'private_key']
+        if key_blocks:
+            result['has_private_key'] = True
+            result['key_match'] = self.check_private_key_match(key_blocks, cert)
+        
+        # 체인 검증 수행
+        if len(cert_blocks) > 1:
+            chain_result = self.verify_certificate_chain([info['cert_object'] for info in result['certificates']])
+            result['chain_info'] = chain_result
+        else:
+            result['chain_info'] = {
+                'status': '📄 단일 인증서',
+                'details': '중간 인증서가 필요할 수 있습니다',
+                'is_complete': False
+            }
+        
+        return result
+    
+    def iter_keys_and_certificates(self, filepath):
+        """파일 안의 인증서와 개인키를 순회 → ('certificate' | 'private_key' | 'error', 객체 또는 오류 메시지)"""
+        password_text = self.get_pfx_password()
+        password = password_text.encode('utf-8') if password_text else None
+        
+        # PEM은 mmap으로 블록 단위 처리 (큰 파일도 블록 하나 크기의 메모리만 사용)
+        with mapped_file(filepath) as data:
+            if data.find(b'-----BEGIN') >= 0:
+                for block in iter_pem_blocks(data):
+                    if block.kind in ('certificate', 'private_key'):
+                        try:
+                            yield block.kind, block.parse(password)
+                        except (TypeError, ValueError, UnsupportedAlgorithm) as e:
+                            yield 'error', f"{block.label}: {str(e)}"
+                return
+            if len(data) > MAX_BINARY_FILE_SIZE:
+                raise ValueError(f"파일이 너무 큽니다. (DER 최대 {MAX_BINARY_FILE_SIZE // (1024 * 1024)}MB)")
+            data = bytes(data)
+        
+        # DER: 인증서 또는 개인키
+        try:
+            yield 'certificate', x509.load_der_x509_certificate(data)
+        except ValueError:
+            yield 'private_key', serialization.load_der_private_key(data, password)
+    
+    def is_ca_certificate(self, cert):
+        """CA 인증서 여부 (BasicConstraints CA 플래그)"""
+        return decode_extensions(cert).is_ca
+    
+    def match_key_pairs(self, root_dir, on_progress=None):
+        """디렉토리 트리의 개인키/인증서 짝 검사 (공개키 지문 해시 조인, O(n))
+        
+        결과: 일치한 짝, 같은 이름(site.crt/site.key) 또는 같은 파일인데 불일치한 짝,
+        짝 없는 개인키, 짝 없는 서버 인증서(CA 제외, 불일치 짝으로 보고한 항목은 다시 넣지 않음), 읽기 실패 파일
+        """
+        certs_by_fp = {}    # 공개키 지문 → [인증서 항목]
+        keys_by_fp = {}     # 공개키 지문 → [개인키 항목]
+        groups = {}         # (디렉토리, 파일명 stem) → {'certs': set(지문), 'keys': set(지문)}
+        errors = []
+        scanned = 0
+        
+        for dirpath, _, filenames in os.walk(root_dir):
+            for filename in filenames:
+                stem, ext = os.path.splitext(filename)
+                if ext.lower() not in KEY_PAIR_EXTENSIONS:
+                    continue
+                filepath = os.path.join(dirpath, filename)
+                try:
+                    if os.path.getsize(filepath) > MAX_PEM_FILE_SIZE:
+                        continue
+                    found = list(self.iter_keys_and_certificates(filepath))
+                except (TypeError, ValueError, UnsupportedAlgorithm, OSError) as e:
+                    errors.append({'path': filepath, 'error': str(e)})
+                    continue
+                
+                scanned += 1
+                if on_progress:
+                    on_progress(scanned, filepath)
+                group = groups.setdefault((dirpath, stem), {'certs': set(), 'keys': set(), 'paths': set()})
+                
+                for kind, obj in found:
+                    if kind == 'error':
+                        errors.append({'path': filepath, 'error': obj})
+                    elif kind == 'certificate':
+                        if self.is_ca_certificate(obj):
+                            continue
+                        fingerprint = self.get_public_key_fingerprint(obj.public_key())
+                        certs_by_fp.setdefault(fingerprint, []).append({
+                            'path': filepath,
+                            'subject': self.format_name(obj.subject),
+                            'key_info': self.get_public_key_info(obj.public_key()),
+                            'fingerprint': fingerprint
+                        })
+                        group['certs'].add(fingerprint)
+                    else:
+                        fingerprint = self.get_public_key_fingerprint(obj.public_key())
+                        keys_by_fp.setdefault(fingerprint, []).append({
+                            'path': filepath,
+                            'key_info': self.get_public_key_info(obj.public_key()),
+                            'fingerprint': fingerprint
+                        })
+                        group['keys'].add(fingerprint)
+                    group['paths'].add(filepath)
+        
+        # 해시 조인: 같은 지문끼리 짝
+        matched = []
+        for fingerprint, key_entries in keys_by_fp.items():
+            cert_entries = certs_by_fp.get(fingerprint)
+            if cert_entries:
+                matched.append({'fingerprint': fingerprint, 'keys': key_entries, 'certificates': cert_entries})
+        
+        # 이름(또는 파일)으로 짝지어진 인증서/개인키인데 지문이 겹치지 않는 경우
+        mismatched = []
+        reported = set()  # 불일치 짝으로 이미 보고한 (경로, 지문) - 짝 없는 목록에서 제외
+        for (dirpath, stem), group in groups.items():
+            if group['certs'] and group['keys'] and not (group['certs'] & group['keys']):
+                reported.update((path, fingerprint) for path in group['paths']
+                                for fingerprint in group['certs'] | group['keys'])
+                mismatched.append({
+                    'name': os.path.join(dirpath, stem),
+                    'paths': sorted(group['paths']),
+                    'cert_fingerprints': sorted(group['certs']),
+                    'key_fingerprints': sorted(group['keys'])
+                })
+        
+        def unmatched(by_fp, other):
+            # 같은 파일에 같은 키/인증서가 여러 번 들어 있어도 한 번만
+            entries = []
+            for fingerprint, fp_entries in by_fp.items():
+                if fingerprint in other:
+                    continue
+                for entry in fp_entries:
+                    key = (entry['path'], fingerprint)
+                    if key not in reported:
+                        reported.add(key)
+                        entries.append(entry)
+            return entries
+        
+        unmatched_keys = unmatched(keys_by_fp, certs_by_fp)
+        unmatched_certs = unmatched(certs_by_fp, keys_by_fp)
+        
+        return {
+            'root': root_dir,
+            'scanned': scanned,
+            'matched': matched,
+            'mismatched': mismatched,
+            'unmatched_keys': unmatched_keys,
+            'unmatched_certs': unmatched_certs,
+            'errors': errors
+        }
+    
+    def summarize_pem_blocks(self, pem_blocks):
+        """PEM 블록 종류별 개수 요약 (예: '인증서 3개, 개인키 1개')"""
+        names = [('certificate', '인증서'), ('private_key', '개인키'), ('csr', 'CSR'),
+                 ('crl', 'CRL'), ('other', '기타')]
+        counts = {}
+        for block in pem_blocks:
+            counts[block.kind] = counts.get(block.kind, 0) + 1
+        return ', '.join(f"{label} {counts[kind]}개" for kind, label in names if counts.get(kind))
+    
+    def check_private_key_match(self, key_blocks, leaf_cert):
+        """개인키 블록과 리프 인증서의 공개키 비교"""
+        leaf_public_key = leaf_cert.public_key()
+        password_text = self.get_pfx_password()
+        password = password_text.encode('utf-8') if password_text else None
+        unreadable = []
+        
+        for block in key_blocks:
+            try:
+                private_key = block.parse(password)
+            except (TypeError, ValueError, UnsupportedAlgorithm):
+                # 암호화된 키인데 비밀번호가 없거나 틀린 경우, 손상된 키, 지원하지 않는 키 종류
+                unreadable.append(block)
+                continue
+            if public_keys_match(private_key.public_key(), leaf_public_key):
+                return {'status': 'match', 'message': '✅ 개인키가 리프 인증서와 일치합니다'}
+        
+        if len(unreadable) == len(key_blocks):
+            if any(b'ENCRYPTED' in block.data for block in unreadable):
+                return {'status': 'encrypted', 'message': '🔒 암호화된 개인키 (비밀번호 필요 - 비교 불가)'}
+            return {'status': 'error', 'message': '❌ 개인키를 읽을 수 없습니다'}
+        return {'status': 'mismatch', 'message': '❌ 개인키가 리프 인증서와 일치하지 않습니다'}
+    
+    def analyze_der_certificate(self, filepath):
+        """DER 인증서 분석"""
+        with open(filepath, 'rb') as f:
+            cert_data = f.read()
+        return self.analyze_der_data(cert_data)
+    
+    def analyze_der_data(self, cert_data):
+        """DER 인증서 데이터 분석"""
+        cert = x509.load_der_x509_certificate(cert_data)
+        result = self.extract_certificate_info(cert)
+        result['file_type'] = '.der'
+        result['cert_count'] = 1
+        result['certificates'] = [result.copy()]
+        result['chain_info'] = {
+            'status': '📄 단일 인증서',
+            'details': '중간 인증서가 필요할 수 있습니다',
+            'is_complete': False
+        }
+        return result
+    
+    def analyze_pkcs12_certificate(self, filepath):
+        """PKCS#12 (PFX/P12) 인증서 분석"""
+        with open(filepath, 'rb') as f:
+            p12_data = f.read()
+        
+        return self.analyze_pkcs12_data(p12_data, filepath)
+    
+    def analyze_pkcs12_data(self, p12_data, source_name):
+        """PKCS#12 데이터 분석 (source_name은 비밀번호 캐시의 디렉토리 기준)"""
+        private_key, certificate, additional_certificates = self.load_pkcs12_with_candidates(
+            source_name, p12_data
+        )
+        return self.build_pkcs12_result(certificate, additional_certificates, private_key is not None)
+    
+    def build_pkcs12_result(self, certificate, additional_certificates, has_private_key):
+        """복호화된 PKCS#12 내용으로 분석 결과 구성"""
+        if certificate is None:
+            raise ValueError("PFX 파일에서 인증서를 찾을 수 없습니다.")
+        
+        main_cert_info = self.extract_certificate_info(certificate)
+        result = dict(main_cert_info)
+        result['file_type'] = '.pfx'
+        result['has_private_key'] = has_private_key
+        result['cert_count'] = 1 + (len(additional_certificates) if additional_certificates else 0)
+        result['certificates'] = []
+        
+        # 메인 인증서
+        main_cert_info['position'] = 0
+        main_cert_info['cert_type'] = 'leaf'
+        main_cert_info['cert_object'] = certificate
+        result['certificates'].append(main_cert_info)
+        
+        # 추가 인증서들
+        if additional_certificates:
+            for i, cert in enumerate(additional_certificates):
+                cert_info = self.extract_certificate_info(cert)
+                cert_info['position'] = i + 1
+                cert_info['cert_type'] = 'ca'
+                cert_info['cert_object'] = cert
+                result['certificates'].append(cert_info)
+            
+            # PFX의 체인 검증
+            all_certs = [certificate] + list(additional_certificates)
+            pfx_chain_result = self.verify_pfx_chain(all_certs)
+            result['chain_info'] = pfx_chain_result
+        else:
+            result['chain_info'] = {
+                'status': '📄 단일 인증서',
+                'details': '중간 CA가 포함되지 않음',
+                'is_complete': False
+            }
+        
+        return result
+    
+    def analyze_keystore(self, filepath):
+        """Java 키스토어 (JKS/JCEKS/PKCS12 키스토어) 분석 - 모든 별칭의 체인을 한 번에 처리"""
+        with open(filepath, 'rb') as f:
+            keystore_data = f.read()
+        return self.analyze_keystore_data(keystore_data, filepath)
+    
+    def analyze_keystore_data(self, keystore_data, source_name):
+        """키스토어 데이터 분석 (source_name은 비밀번호 캐시의 디렉토리 기준)"""
+        entries = []
+        warning = None
+        keystore_meta = {}
+        try:
+            for alias, entry_type, chain in self.iter_keystore_entries(source_name, keystore_data, keystore_meta):
+                cert_infos = []
+                for i, cert in enumerate(chain):
+                    cert_info = self.extract_certificate_info(cert)
+                    cert_info['position'] = i
+                    cert_info['cert_type'] = 'leaf' if i == 0 else 'ca'
+                    cert_info['cert_object'] = cert
+                    cert_infos.append(cert_info)
+                
+                if len(chain) > 1:
+                    chain_info = self.verify_pfx_chain(chain)
+                else:
+                    chain_info = {
+                        'status': '📄 단일 인증서',
+                        'details': '중간 CA가 포함되지 않음',
+                        'is_complete': False
+                    }
+                entries.append({
+                    'alias': alias,
+                    'entry_type': entry_type,
+                    'certificates': cert_infos,
+                    'chain_info': chain_info
+                })
+        except ValueError as e:
+            # 앞쪽 항목은 읽었으면 결과를 살리고 경고로 표시
+            if not entries:
+                raise
+            warning = str(e)
+        
+        entries = [entry for entry in entries if entry['certificates']]
+        if not entries:
+            raise ValueError("키스토어에서 인증서를 찾을 수 없습니다.")
+        
+        # 대표 항목: 첫 번째 개인키 항목 (없으면 첫 항목)
+        primary = next((entry for entry in entries if entry['entry_type'] == 'PrivateKeyEntry'), entries[0])
+        
+        result = dict(primary['certificates'][0])
+        result['file_type'] = '.keystore'
+        result['keystore_type'] = keystore_meta.get('type')
+        result['keystore_password_verified'] = keystore_meta.get('password_verified')
+        result['keystore_entries'] = entries
+        result['keystore_warning'] = warning
+        result['has_private_key'] = any(entry['entry_type'] == 'PrivateKeyEntry' for entry in entries)
+        result['cert_count'] = sum(len(entry['certificates']) for entry in entries)
+        result['certificates'] = primary['certificates']
+        result['chain_info'] = primary['chain_info']
+        return result
+    
+    def iter_keystore_entries(self, filepath, keystore_data, meta):
+        """키스토어 형식을 판별해 (별칭, 항목 타입, [인증서 객체]) 순회
+
+        meta에는 키스토어 형식('type')과 비밀번호 확인 여부('password_verified')가 기록됩니다.
+        """
+        if keystore_data[:4] in (b'\xfe\xed\xfe\xed', b'\xce\xce\xce\xce'):
+            meta['type'] = 'JKS' if keystore_data[:4] == b'\xfe\xed\xfe\xed' else 'JCEKS'
+            meta['password_verified'] = False
+            data_key = hashlib.sha256(keystore_data).digest()
+            for password_text in self.pfx_password_cache.candidates(filepath, data_key, self.get_pfx_password()):
+                if password_text and _verify_jks_password(keystore_data, password_text):
+                    self.pfx_password_cache.record_success(filepath, data_key, password_text)
+                    meta['password_verified'] = True
+                    break
+            
+            for alias, entry_type, chain in _iter_jks_entries(keystore_data):
+                yield alias, entry_type, [x509.load_der_x509_certificate(der) for der in chain]
+            return
+        
+        # Java 9+ 기본 형식: PKCS#12 키스토어 (별칭 = friendly name)
+        meta['type'] = 'PKCS12'
+        data_key = hashlib.sha256(keystore_data).digest()
+        candidates = self.pfx_password_cache.candidates(filepath, data_key, self.get_pfx_password())
+        index, failed, loaded, error = _try_pkcs12_passwords(keystore_data, candidates, with_names=True)
+        self.record_pkcs12_attempts(filepath, data_key, candidates, index, failed, error)
+        meta['password_verified'] = True
+        
+        def friendly_name(pkcs12_cert):
+            name = pkcs12_cert.friendly_name
+            return name.decode('utf-8', errors='replace') if name else None
+        
+        # 별칭 없는 추가 인증서는 개인키 항목의 체인으로 취급
+        unnamed_chain = [c.certificate for c in loaded.additional_certs if not friendly_name(c)]
+        if loaded.cert is not None:
+            alias = friendly_name(loaded.cert) or '(별칭 없음)'
+            yield alias, 'PrivateKeyEntry' if loaded.key is not None else 'trustedCertEntry', \
+                [loaded.cert.certificate] + unnamed_chain
+        elif unnamed_chain:
+            yield '(별칭 없음)', 'trustedCertEntry', unnamed_chain
+        
+        for pkcs12_cert in loaded.additional_certs:
+            alias = friendly_name(pkcs12_cert)
+            if alias:
+                yield alias, 'trustedCertEntry', [pkcs12_cert.certificate]
+    
+    def load_pkcs12_with_candidates(self, filepath, p12_data):
+        """비밀번호 후보를 차례로 시도해 PKCS#12 복호화 (현재 스레드)"""
+        data_key = hashlib.sha256(p12_data).digest()
+        candidates = self.pfx_password_cache.candidates(filepath, data_key, self.get_pfx_password())
+        index, failed, loaded, error = _try_pkcs12_passwords(p12_data, candidates)
+        self.record_pkcs12_attempts(filepath, data_key, candidates, index, failed, error)
+        return loaded
+    
+    def record_pkcs12_attempts(self, filepath, data_key, candidates, index, failed, error):
+        """복호화 시도 결과를 비밀번호 캐시에 반영 (모두 실패한 경우 예외)"""
+        cache = self.pfx_password_cache
+        for i in failed:
+            cache.record_failure(data_key, candidates[i])
+        
+        if index is not None:
+            cache.record_success(filepath, data_key, candidates[index])
+            return
+        
+        if error is None or "invalid" in error.lower() or "could not deserialize" in error.lower():
+            raise ValueError("PFX 비밀번호가 틀렸거나 파일이 손상되었습니다.")
+        raise ValueError(error)
+    
+    def get_pfx_pool(self):
+        """PFX 복호화 전용 프로세스 풀 (처음 사용할 때 생성)"""
+        if self.pfx_pool is None:
+            self.pfx_pool = ProcessPoolExecutor(max_workers=self.pfx_workers)
+        return self.pfx_pool
+    
+    def shutdown_pfx_pool(self, wait=True):
+        """작업 프로세스 풀 종료 (PFX 복호화 풀, 감시 작업 프로세스)
+
+        대기 중인 작업은 취소하고, wait=True이면 작업 프로세스가 끝날 때까지 기다립니다.
+        (CLI 종료 시 기다리지 않으면 종료 중인 인터프리터에서 풀 관리 스레드가 닫힌 파이프를 건드려 EBADF가 납니다)
+        GUI 창 닫기처럼 이벤트 루프를 막으면 안 되는 곳은 wait=False - 실행 중인 작업은
+        인터프리터 종료 시 concurrent.futures가 정리하고, 대기 중인 감시 작업 프로세스는 바로 종료합니다.
+        """
+        if self.pfx_pool is not None:
+            self.pfx_pool.shutdown(wait=wait, cancel_futures=True)
+            self.pfx_pool = None
+        if self.supervised_pool is not None:
+            self.supervised_pool.close(kill=not wait)
+            self.supervised_pool = None
+    
+    def submit_pkcs12(self, filepath):
+        """PFX 복호화를 프로세스 풀에 제출 → collect_pkcs12로 결과 수집"""
+        with open(filepath, 'rb') as f:
+            p12_data = f.read()
+        
+        data_key = hashlib.sha256(p12_data).digest()
+        candidates = self.pfx_password_cache.candidates(filepath, data_key, self.get_pfx_password())
+        future = self.get_pfx_pool().submit(_decode_pkcs12_worker, p12_data, candidates)
+        return future, data_key, candidates
+    
+    def collect_pkcs12(self, filepath, job):
+        """프로세스 풀의 복호화 결과로 PFX 분석 결과 구성"""
+        future, data_key, candidates = job
+        index, failed, decoded, error = future.result()
+        self.record_pkcs12_attempts(filepath, data_key, candidates, index, failed, error)
+        
+        has_private_key, certificate_der, additional_der = decoded
+        certificate = x509.load_der_x509_certificate(certificate_der) if certificate_der else None
+        additional_certificates = [x509.load_der_x509_certificate(der) for der in additional_der]
+        return self.build_pkcs12_result(certificate, additional_certificates, has_private_key)
+    
+    def make_error_result(self, error):
+        """분석 실패 결과"""
+        return {
+            'status': 'error',
+            'summary': f'파일 분석 실패: {str(error)}',
+            'details': '',
+            'extensions': '',
+            'chain_info': {'status': '❌ 분석 실패'}
+        }
+    
+    def analyze_batch(self, file_paths, on_result=None):
+        """다중 파일 분석 - 입력 순서대로 결과 목록 반환
+        
+        PFX/P12는 전용 프로세스 풀에서 복호화하고 PEM/DER는 현재 스레드에서 처리하므로
+        느린 키 유도가 나머지 파일 처리를 막지 않습니다.
+        on_result(index, result)는 파일별 분석이 끝날 때마다 호출됩니다.
+        file_timeout이 지정되면 모든 파일을 감시 작업 프로세스에서 분석합니다.
+        """
+        if self.file_timeout:
+            return self.analyze_batch_supervised(file_paths, on_result)
+        results = [None] * len(file_paths)
+        
+        def finish(index, result):
+            result['file_path'] = file_paths[index]
+            result['file_name'] = os.path.basename(file_paths[index])
+            results[index] = result
+            if on_result:
+                on_result(index, result)
+        
+        # 디렉토리별 첫 PFX를 먼저 보내 성공한 비밀번호를 캐시에 남긴 뒤 나머지를 보냄
+        first_wave, second_wave, seen_dirs = [], [], set()
+        if self.pfx_workers:
+            for index, filepath in enumerate(file_paths):
+                if os.path.splitext(filepath)[1].lower() in ['.pfx', '.p12']:
+                    directory = os.path.dirname(os.path.abspath(filepath))
+                    (second_wave if directory in seen_dirs else first_wave).append(index)
+                    seen_dirs.add(directory)
+        pfx_indexes = set(first_wave) | set(second_wave)
+        
+        def submit_wave(indexes):
+            jobs = {}
+            for index in indexes:
+                try:
+                    job = self.submit_pkcs12(file_paths[index])
+                    jobs[job[0]] = (index, job)
+                except Exception as e:
+                    finish(index, self.make_error_result(e))
+            return jobs
+        
+        def collect_wave(jobs):
+            for future in as_completed(jobs):
+                index, job = jobs[future]
+                try:
+                    finish(index, self.finalize_result(self.collect_pkcs12(file_paths[index], job)))
+                except Exception as e:
+                    finish(index, self.make_error_result(e))
+        
+        jobs = submit_wave(first_wave)
+        
+        for index, filepath in enumerate(file_paths):
+            if index not in pfx_indexes:
+                finish(index, self.analyze_certificate(filepath))
+        
+        collect_wave(jobs)
+        collect_wave(submit_wave(second_wave))
+        
+        # OCSP는 파일별로 보내지 않고 전체 결과를 모아 응답자별 일괄 요청
+        if self.ocsp_client is not None:
+            self.apply_ocsp_checks(results)
+        return results
+    
+    def get_supervised_pool(self):
+        """감시 작업 프로세스 풀 (비밀번호나 기준 시각이 바뀌면 새로 생성)"""
+        password = self.get_pfx_password()
+        passwords = list(self.pfx_password_cache.passwords)
+        pool = self.supervised_pool
+        if (pool is None or pool.pfx_password != password or pool.pfx_passwords != passwords
+                or pool.as_of != self.as_of):
+            if pool is not None:
+                pool.close()
+            pool = self.supervised_pool = SupervisedWorkerPool(
+                timeout=self.file_timeout,
+                memory_limit_mb=self.memory_limit_mb or SupervisedWorkerPool.DEFAULT_MEMORY_LIMIT_MB,
+                pfx_password=password, pfx_passwords=passwords, as_of=self.as_of)
+        return pool
+    
+    def analyze_batch_supervised(self, file_paths, on_result=None):
+        """analyze_batch의 격리 실행 - 형식 분석은 작업 프로세스에서, 후처리(AIA/CRL/OCSP)는 현재 프로세스에서
+        
+        시간 제한을 넘기거나 작업 프로세스가 죽은 파일은 오류 결과로 기록됩니다.
+        """
+        results = [None] * len(file_paths)
+        pool = self.get_supervised_pool()
+        for index, ok, payload in pool.imap(list(enumerate(file_paths))):
+            if ok:
+                try:
+                    result = self.finalize_result(_unpack_result(payload))
+                except Exception as e:
+                    result = self.make_error_result(e)
+            else:
+                result = self.make_error_result(payload)
+            result['file_path'] = file_paths[index]
+            result['file_name'] = os.path.basename(file_paths[index])
+            results[index] = result
+            if on_result:
+                on_result(index, result)
+        
+        if self.ocsp_client is not None:
+            self.apply_ocsp_checks(results)
+        return results
+    
+    def iter_analyze(self, file_paths, chunk_size=256):
+        """analyze_batch를 묶음 단위로 실행하며 결과를 하나씩 반환 (전체 결과 목록을 보관하지 않음)"""
+        for start in range(0, len(file_paths), chunk_size):
+            for result in self.analyze_batch(file_paths[start:start + chunk_size]):
+                yield result
+    
+    def analyze_embedded(self, paths, on_result=None, archive_scanner=None):
+        """설정 파일/폴더(YAML, JSON, .env, Kubernetes Secret 등)와 아카이브에 포함된 인증서 분석
+        
+        찾은 인증서(이어진 PEM 체인은 하나로)마다 결과 하나를 반환하며, 결과에는 원본
+        file_path(아카이브 멤버는 'a.zip!/certs/x.pem')와 embedded_offset이 들어갑니다.
+        zip/tar 아카이브는 ArchiveScanner로 풀지 않고 읽으며, 읽을 수 없는 파일(OSError/ValueError)은
+        status가 'error'인 결과로 목록에 남깁니다.
+        """
+        scanner = EmbeddedCertificateScanner()
+        if archive_scanner is None:
+            archive_scanner = ArchiveScanner()
+        results = []
+        for filepath in scanner.collect_files(paths):
+            try:
+                if ArchiveScanner.is_archive(filepath):
+                    found = archive_scanner.scan_file(filepath)
+                else:
+                    found = [(filepath, embedded) for embedded in scanner.scan_file(filepath)]
+                for source_name, embedded in found:
+                    result = self.analyze_data(embedded.data, source_name)
+                    result['file_path'] = source_name
+                    result['file_name'] = os.path.basename(filepath) + source_name[len(filepath):]
+                    if embedded.offset is not None:
+                        result['file_name'] += f" @{embedded.offset}"
+                    result['embedded_offset'] = embedded.offset
+                    result['embedded_encoding'] = embedded.encoding
+                    results.append(result)
+                    if on_result:
+                        on_result(len(results) - 1, result)
+            except (OSError, ValueError) as e:
+                result = self.make_error_result(e)
+                result.update(file_path=filepath, file_name=os.path.basename(filepath),
+                              embedded_offset=None, embedded_encoding=None)
+                results.append(result)
+                if on_result:
+                    on_result(len(results) - 1, result)
+        
+        if self.ocsp_client is not None:
+            self.apply_ocsp_checks(results)
+        return results
+    
+    def extract_certificate_info(self, cert):
+        """인증서에서 정보 추출 (기존 로직 재사용)"""
+        # 기본 정보
+        subject = self.format_name(cert.subject)
+        issuer = self.format_name(cert.issuer)
+        serial = hex(cert.serial_number)[2:].upper()
+        
+        # 날짜 정보
+        not_before = cert.not_valid_before
+        not_after = cert.not_valid_after
+        
+        # timezone 정보 통일
+        if not_before.tzinfo is None:
+            not_before = not_before.replace(tzinfo=timezone.utc)
+        if not_after.tzinfo is None:
+            not_after = not_after.replace(tzinfo=timezone.utc)
+        
+        # 기준 시각(기본: 현재)과 비교
+        now = self.evaluation_time()
+        
+        try:
+            if not_after < now:
+                days_left = (now - not_after).days
+                validity_status = f"만료됨 ({days_left}일 전)"
+                validity_color = 'danger'
+            elif (not_after - now).days < self.EXPIRING_DAYS:
+                days_left = (not_after - now).days
+                validity_status = f"곧 만료 ({days_left}일 남음)"
+                validity_color = 'warning'
+            else:
+                days_left = (not_after - now).days
+                validity_status = f"유효 ({days_left}일 남음)"
+                validity_color = 'success'
+        except Exception:
+            validity_status = "유효성 확인 불가"
+            validity_color = 'warning'
+        
+        # 공개키 정보
+        public_key = cert.public_key()
+        key_info = self.get_public_key_info(public_key)
+        spki_sha256 = self.get_public_key_fingerprint(public_key)
+        key_type, key_bits, curve = self.get_public_key_details(public_key)
+        
+        # 확장 필드는 한 번만 디코딩해 SAN·용도·정책 필드가 함께 사용
+        extension_record = decode_extensions(cert)
+        san_domains = extension_record.dns_names
+        usage = self.describe_usage(extension_record)
+        
+        # 정책 점검용 구조화 필드 (표시용 문자열과 별도)
+        try:
+            signature_hash = cert.signature_hash_algorithm.name if cert.signature_hash_algorithm else ''
+        except Exception:
+            signature_hash = 'unknown'
+        
+        return {
+            'subject': subject,
+            'issuer': issuer,
+            'serial': serial,
+            'not_before': not_before,
+            'not_after': not_after,
+            'validity_status': validity_status,
+            'validity_color': validity_color,
+            'key_info': key_info,
+            'spki_sha256': spki_sha256,
+            'fingerprint_sha256': cert.fingerprint(hashes.SHA256()).hex(),
+            'san_domains': san_domains,
+            'usage': usage,
+            'key_type': key_type,
+            'key_bits': key_bits,
+            'curve': curve,
+            'signature_hash': signature_hash,
+            'validity_days': int((not_after - not_before).total_seconds() // 86400),
+            'has_san': extension_record.has_san,
+            'server_auth': extension_record.has_eku(ExtendedKeyUsageOID.SERVER_AUTH),
+            'is_ca': extension_record.is_ca,
+            'extension_record': extension_record,
+            'cert_object': cert
+        }
+    
+    def format_name(self, name):
+        """X.509 Name을 문자열로 포맷"""
+        parts = []
+        for attribute in name:
+            if attribute.oid == NameOID.COMMON_NAME:
+                parts.append(f"CN={attribute.value}")
+            elif attribute.oid == NameOID.ORGANIZATION_NAME:
+                parts.append(f"O={attribute.value}")
+            elif attribute.oid == NameOID.ORGANIZATIONAL_UNIT_NAME:
+                parts.append(f"OU={attribute.value}")
+            elif attribute.oid == NameOID.COUNTRY_NAME:
+                parts.append(f"C={attribute.value}")
+            elif attribute.oid == NameOID.STATE_OR_PROVINCE_NAME:
+                parts.append(f"ST={attribute.value}")
+            elif attribute.oid == NameOID.LOCALITY_NAME:
+                parts.append(f"L={attribute.value}")
+        return ', '.join(parts)
+    
+    def get_public_key_info(self, public_key):
+        """공개키 정보 추출"""
+        from cryptography.hazmat.primitives.asymmetric import rsa, ec, dsa
+        
+        if isinstance(public_key, rsa.RSAPublicKey):
+            key_size = public_key.key_size
+            return f"RSA {key_size}bit"
+        elif isinstance(public_key, ec.EllipticCurvePublicKey):
+            curve_name = public_key.curve.name
+            key_size = public_key.curve.key_size
+            return f"ECC {curve_name} ({key_size}bit)"
+        elif isinstance(public_key, dsa.DSAPublicKey):
+            key_size = public_key.key_size
+            return f"DSA {key_size}bit"
+        else:
+            return f"{type(public_key).__name__}"
+    
+    def get_public_key_details(self, public_key):
+        """공개키 구조화 정보 → (종류, 비트 수, 곡선 이름)"""
+        from cryptography.hazmat.primitives.asymmetric import rsa, ec, dsa, ed25519, ed448
+        
+        if isinstance(public_key, rsa.RSAPublicKey):
+            return 'RSA', public_key.key_size, ''
+        elif isinstance(public_key, ec.EllipticCurvePublicKey):
+            return 'EC', public_key.curve.key_size, public_key.curve.name
+        elif isinstance(public_key, dsa.DSAPublicKey):
+            return 'DSA', public_key.key_size, ''
+        elif isinstance(public_key, ed25519.Ed25519PublicKey):
+            return 'Ed25519', 256, ''
+        elif isinstance(public_key, ed448.Ed448PublicKey):
+            return 'Ed448', 456, ''
+        return type(public_key).__name__, 0, ''
+    
+    def get_public_key_fingerprint(self, public_key):
+        """공개키 지문 (SubjectPublicKeyInfo DER의 SHA-256, 16진수)"""
+        spki = public_key.public_bytes(serialization.Encoding.DER,
+                                       serialization.PublicFormat.SubjectPublicKeyInfo)
+        return hashlib.sha256(spki).hexdigest()
+    
+    def extract_san_domains(self, cert):
+        """SAN에서 도메인 추출"""
+        return decode_extensions(cert).dns_names
+    
+    def get_certificate_usage(self, cert):
+        """인증서 용도 확인"""
+        return self.describe_usage(decode_extensions(cert))
+    
+    def describe_usage(self, extension_record):
+        """확장 레코드의 KU/EKU를 표시용 용도 문자열로 변환"""
+        usages = []
+        key_usage = extension_record.key_usage
+        if 'digital_signature' in key_usage:
+            usages.append("디지털 서명")
+        if 'key_encipherment' in key_usage:
+            usages.append("키 암호화")
+        if 'key_agreement' in key_usage:
+            usages.append("키 합의")
+        if extension_record.has_eku(ExtendedKeyUsageOID.SERVER_AUTH):
+            usages.append("서버 인증 (TLS/SSL)")
+        if extension_record.has_eku(ExtendedKeyUsageOID.CLIENT_AUTH):
+            usages.append("클라이언트 인증")
+        
+        return ', '.join(usages) if usages else "용도 불명"
+    
+    def verify_certificate_chain(self, cert_blocks):
+        """인증서 체인 검증 (기존 로직) - cert_blocks는 PEM 바이트 또는 이미 파싱한 인증서 객체"""
+        try:
+            certificates = []
+            for cert_block in cert_blocks:
+                if isinstance(cert_block, bytes):
+                    cert_block = x509.load_pem_x509_certificate(cert_block)
+                certificates.append(cert_block)
+            
+            chain_issues = []
+            is_complete_chain = True
+            
+            # 체인 연결성 검사 - 개선된 로직
+            for i in range(len(certificates) - 1):
+                current_cert = certificates[i]
+                next_cert = certificates[i + 1]
+                
+                current_issuer = self.format_name(current_cert.issuer)
+                next_subject = self.format_name(next_cert.subject)
+                
+                # 개선된 연결성 검사 사용
+                connection_status = self.check_certificate_connection(current_issuer, next_subject)
+                
+                if "연결됨" in connection_status:
+                    chain_issues.append(f"✅ 인증서 {i+1} → {i+2}: {connection_status}")
+                elif "부분 연결" in connection_status:
+                    chain_issues.append(f"🟡 인증서 {i+1} → {i+2}: {connection_status}")
+                    # 부분 연결은 경고로 처리하지만 체인 끊김은 아님
+                else:
+                    chain_issues.append(f"❌ 인증서 {i+1} → {i+2}: {connection_status}")
+                    chain_issues.append(f"   현재 Issuer: {current_issuer}")
+                    chain_issues.append(f"   다음 Subject: {next_subject}")
+                    is_complete_chain = False
+            
+            # 루트 인증서 확인
+            root_cert = certificates[-1]
+            root_subject = self.format_name(root_cert.subject)
+            root_issuer = self.format_name(root_cert.issuer)
+            
+            is_self_signed = (root_subject == root_issuer)
+            
+            if is_self_signed:
+                chain_issues.append(f"✅ 루트 CA: 자체 서명 인증서 확인됨")
+            else:
+                chain_issues.append(f"⚠️ 루트 CA: 자체 서명이 아님 (상위 CA 필요할 수 있음)")
+                is_complete_chain = False
+            
+            # 최종 판단
+            if is_complete_chain and len(certificates) >= 2:
+                status = "✅ 완전한 체인"
+            elif len(certificates) >= 2:
+                status = "⚠️ 불완전한 체인"
+            else:
+                status = "❓ 단일 인증서"
+            
+            return {
+                'status': status,
+                'details': '\n'.join(chain_issues),
+                'is_complete': is_complete_chain,
+                'cert_count': len(certificates)
+            }
+            
+        except Exception as e:
+            return {
+                'status': '❌ 체인 검증 실패',
+                'details': f'오류: {str(e)}',
+                'is_complete': False,
+                'cert_count': len(cert_blocks)
+            }
+    
+    def verify_pfx_chain(self, certificates):
+        """PFX 인증서 체인 검증 (기존 로직)"""
+        try:
+            if len(certificates) < 2:
+                return {'status': '❓ 단일 인증서', 'is_complete': False}
+            
+            # 간단한 체인 검증
+            leaf_cert = certificates[0]
+            ca_certs = certificates[1:]
+            
+            # 체인 연결 확인
+            current_cert = leaf_cert
+            chain_ok = True
+            
+            for ca_cert in ca_certs:
+                current_issuer = self.format_name(current_cert.issuer)
+                ca_subject = self.format_name(ca_cert.subject)
+                
+                if current_issuer == ca_subject:
+                    current_cert = ca_cert
+                else:
+                    chain_ok = False
+                    break
+            
+            # 마지막 인증서가 자체 서명인지 확인
+            if chain_ok:
+                root_subject = self.format_name(current_cert.subject)
+                root_issuer = self.format_name(current_cert.issuer)
+                
+                if root_subject == root_issuer:
+                    return {'status': '✅ 완전한 체인', 'is_complete': True}
+                else:
+                    return {'status': '⚠️ 불완전한 체인 (루트 CA 없음)', 'is_complete': False}
+            else:
+                return {'status': '⚠️ 불완전한 체인 (연결 오류)', 'is_complete': False}
+                
+        except Exception:
+            return {'status': '❌ 체인 검증 실패', 'is_complete': False}
+    
+    def certificates_and_records(self, cert_infos):
+        """인증서 정보 목록 → (인증서 객체 목록, 캐시된 확장 레코드 목록) - order_certificate_chain 인자용"""
+        return ([info['cert_object'] for info in cert_infos],
+                [info.get('extension_record') for info in cert_infos])
+    
+    def order_certificate_chain(self, certificates, records=None):
+        """인증서를 지문(SHA-256)으로 중복 제거하고 리프→루트 순서로 정렬
+        
+        Issuer/Subject DN이 이어지고, AKI/SKI가 둘 다 있으면 키 식별자까지 같아야 발급 관계로 봅니다.
+        records는 certificates와 같은 순서의 확장 레코드로, 없는 항목만 새로 디코딩합니다.
+        반환: (정렬된 체인, 체인에 연결되지 않은 인증서, 제거된 중복 수)
+        """
+        unique = {}
+        for cert, record in zip(certificates, records or [None] * len(certificates)):
+            unique.setdefault(cert.fingerprint(hashes.SHA256()), (cert, record))
+        certs = [cert for cert, _ in unique.values()]
+        duplicates = len(certificates) - len(certs)
+        
+        records = [record or decode_extensions(cert) for cert, record in unique.values()]
+        subjects = [cert.subject for cert in certs]
+        issuers = [cert.issuer for cert in certs]
+        by_subject = {}  # Subject DN → 인증서 인덱스 (발급자 후보를 해시 조회로 찾아 전체 쌍 비교를 피함)
+        for i, subject in enumerate(subjects):
+            by_subject.setdefault(subject, []).append(i)
+        
+        def issued_by(child, parent):
+            if issuers[child] != subjects[parent]:
+                return False
+            authority_key_id, subject_key_id = records[child].authority_key_id, records[parent].subject_key_id
+            if authority_key_id and subject_key_id:
+                return authority_key_id == subject_key_id
+            return True
+        
+        def parents_of(child):
+            return [i for i in by_subject.get(issuers[child], ()) if i != child and issued_by(child, i)]
+        
+        # 리프: 다른 인증서의 발급자가 아닌 인증서 (여럿이면 CA가 아닌 것, 그다음 파일 순서)
+        issuer_indexes = {parent for child in range(len(certs)) for parent in parents_of(child)}
+        leaf_candidates = [i for i in range(len(certs)) if i not in issuer_indexes] or list(range(len(certs)))
+        leaf_candidates.sort(key=lambda i: records[i].is_ca)
+        
+        order = [leaf_candidates[0]]
+        used = {order[0]}
+        while not issued_by(order[-1], order[-1]):
+            parent = next((i for i in parents_of(order[-1]) if i not in used), None)
+            if parent is None:
+                break
+            order.append(parent)
+            used.add(parent)
+        remaining = [i for i in range(len(certs)) if i not in used]
+        
+        return [certs[i] for i in order], [certs[i] for i in remaining], duplicates
+    
+    def build_fullchain(self, result, root_mode='keep'):
+        """분석 결과의 인증서 객체로 fullchain PEM 구성 (파일을 다시 읽지 않음)
+        
+        root_mode: keep(있는 그대로) / drop(자체 서명 루트 제외) / add(없으면 AIA 미러에서 보완)
+        반환: (PEM 바이트, 보고 dict)
+        """
+        cert_infos = [info for info in result.get('certificates', []) if info.get('cert_object') is not None]
+        if not cert_infos:
+            raise ValueError("내보낼 인증서가 없습니다.")
+        
+        chain, unrelated, duplicates = self.order_certificate_chain(*self.certificates_and_records(cert_infos))
+        notes = []
+        has_root = len(chain) > 1 and chain[-1].subject == chain[-1].issuer
+        if root_mode == 'drop' and has_root:
+            chain = chain[:-1]
+            notes.append("루트 인증서 제외")
+        elif root_mode == 'add' and not has_root:
+            records_by_cert = {id(info['cert_object']): info.get('extension_record') for info in cert_infos}
+            added = (self.aia_mirror.complete_chain(chain, [records_by_cert.get(id(cert)) for cert in chain])
+                     if self.aia_mirror is not None else [])
+            chain = chain + added
+            if added:
+                notes.append(f"AIA 미러에서 {len(added)}개 보완")
+            if chain[-1].subject != chain[-1].issuer:
+                notes.append("⚠️ 루트 인증서를 찾지 못해 추가하지 못했습니다")
+        if duplicates:
+            notes.append(f"중복 {duplicates}개 제거")
+        if unrelated:
+            notes.append(f"⚠️ 체인에 연결되지 않은 인증서 {len(unrelated)}개 제외")
+        
+        data = b''.join(cert.public_bytes(serialization.Encoding.PEM) for cert in chain)
+        return data, {'chain': chain, 'unrelated': unrelated, 'duplicates': duplicates, 'notes': notes}
+    
+    def export_fullchain(self, result, output_path, root_mode='keep'):
+        """정렬·중복 제거한 fullchain PEM을 한 번의 쓰기로 저장하고 보고 dict 반환"""
+        data, report = self.build_fullchain(result, root_mode)
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        report['output_path'] = output_path
+        return report
+    
+    def verify_hostnames(self, result, hostnames):
+        """분석 결과의 리프 인증서가 각 호스트명을 포함하는지 확인 (RFC 6125)
+        
+        반환: [{'hostname', 'ok', 'matched_by'}] - 리프는 발급 관계로 정렬한 체인의 첫 인증서
+        """
+        certificates = [info for info in result.get('certificates', []) if info.get('cert_object') is not None]
+        if not certificates:
+            raise ValueError("호스트명을 확인할 인증서가 없습니다.")
+        
+        chain, _, _ = self.order_certificate_chain(*self.certificates_and_records(certificates))
+        leaf_info = next(info for info in certificates if info['cert_object'] == chain[0])
+        matcher = HostnameMatcher.from_cert_info(leaf_info)
+        return [{'hostname': hostname, 'ok': matched is not None, 'matched_by': matched}
+                for hostname, matched in matcher.match_many(hostnames)]
+    
+    def extract_cn_from_subject(self, subject_full):
+        """Subject에서 CN 추출"""
+        if 'CN=' in subject_full:
+            try:
+                return subject_full.split('CN=')[1].split(',')[0].strip()
+            except:
+                pass
+        return subject_full if subject_full else 'Unknown'
+    
+    def check_certificate_connection(self, prev_issuer, current_subject):
+        """인증서 연결성 검사 - 개선된 로직"""
+        if not prev_issuer or not current_subject:
+            return "❓ 정보 불충분"
+        
+        # 1. 정확한 매칭 (기존 방식)
+        if prev_issuer.strip() == current_subject.strip():
+            return "🔗 연결됨"
+        
+        # 2. 정규화된 매칭 (공백, 순서 무시)
+        def normalize_dn(dn_string):
+            """DN 문자열을 정규화"""
+            # 쉼표로 분리하고 각 부분을 정리
+            parts = []
+            for part in dn_string.split(','):
+                part = part.strip()
+                if '=' in part:
+                    key, value = part.split('=', 1)
+                    parts.append(f"{key.strip()}={value.strip()}")
+            return sorted(parts)  # 순서 무관하게 정렬
+        
+        prev_normalized = normalize_dn(prev_issuer)
+        current_normalized = normalize_dn(current_subject)
+        
+        if prev_normalized == current_normalized:
+            return "🔗 연결됨 (정규화)"
+        
+        # 3. 핵심 필드만 비교 (CN 기준)
+        def extract_cn(dn_string):
+            """DN에서 CN만 추출"""
+            for part in dn_string.split(','):
+                part = part.strip()
+                if part.upper().startswith('CN='):
+                    return part.split('=', 1)[1].strip()
+            return None
+        
+        prev_cn = extract_cn(prev_issuer)
+        current_cn = extract_cn(current_subject)
+        
+        if prev_cn and current_cn and prev_cn == current_cn:
+            return "🔗 연결됨 (CN)"
+        
+        # 4. 부분적 매칭 확인
+        common_parts = set(prev_normalized) & set(current_normalized)
+        if len(common_parts) >= 2:  # 최소 2개 필드가 일치
+            return "🟡 부분 연결"
+        
+        # 5. 완전히 다른 경우
+        return "⚠️ 연결 끊김"
+
+
+class EnhancedSSLCertificateChecker(CertificateAnalyzer):
+    DETAIL_CACHE_SIZE = 256  # 상세 정보 렌더링 캐시 크기 (인증서 수)
+
     def __init__(self, root):
+        # 파일별 감시 작업 프로세스(격리 분석)는 "🛡️ 격리 분석"을 켰을 때만 사용
+        # (기본 경로는 PFX 프로세스 풀, 디렉토리별 첫 PFX 우선 처리, 공유 비밀번호 캐시를 그대로 사용)
+        super().__init__()
         self.root = root
+        self.tree_cert_map = {}    # 트리 항목 → 표시할 인증서 정보
+        self.detail_cache = {}     # 인증서 지문 → 렌더링된 상세 정보 (LRU)
+        self.detail_cert_info = None
+        self.ext_rendered_for = None
         self.has_drag_drop = HAS_TKINTERDND2
         self.root.title("SSL Certificate Checker v3.0 - Enhanced UI")
         self.root.geometry("1200x800")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # ===== FIX 1: status_var를 가장 먼저 생성 (초기화 순서 문제 해결) =====
         self.status_var = tk.StringVar(value="준비됨 - SSL Certificate Checker v3.0")
@@ -69,11 +3738,20 @@ class EnhancedSSLCertificateChecker:
         # 현재 분석 결과 저장
         self.current_result = None
         self.analysis_results = []  # 다중 파일 분석 결과
+        self.san_index = None  # 마지막 분석 결과의 SAN 색인 (호스트 검색용)
+        self.san_search_item = None
+        self.lint_table = None  # 다중 파일 정책 점검 (CertificateTable + 규칙별 위반 행)
+        self.lint_findings = {}
+        self.forecast_report = None  # 다중 파일 만료 예측 (ExpiryForecast.run 결과)
         
         # 스타일 설정
         self.setup_styles()
         self.setup_ui()
-        
+
+    def get_pfx_password(self):
+        """PFX 비밀번호 입력 필드 값 사용"""
+        return self.password_var.get()
+
     def get_color_theme(self):
         """현재 테마에 따른 색상 반환 - 개선된 디자인"""
         if self.dark_mode:
@@ -237,7 +3915,15 @@ class EnhancedSSLCertificateChecker:
         
         # 다중 파일 선택 버튼
         multi_btn = ttk.Button(file_frame, text="다중 파일", command=self.browse_multiple_files, width=10)
-        multi_btn.grid(row=0, column=2, padx=(0, 10))
+        multi_btn.grid(row=0, column=2, padx=(0, 5))
+        
+        # 폴더 전체 개인키/인증서 짝 검사
+        pair_btn = ttk.Button(file_frame, text="🔑 키 짝 검사", command=self.browse_key_pair_directory, width=12)
+        pair_btn.grid(row=0, column=3, padx=(0, 5))
+        
+        # 현재 분석 결과를 정렬된 fullchain.pem으로 내보내기
+        export_btn = ttk.Button(file_frame, text="💾 fullchain", command=self.export_fullchain_dialog, width=12)
+        export_btn.grid(row=0, column=4, padx=(0, 10))
         
         # 드래그 앤 드롭 라벨 (개선된 메시지)
         drop_label = ttk.Label(file_frame, text="💡 탐색기에서 인증서 파일을 드래그하거나 Ctrl+V로 붙여넣기 가능", 
@@ -262,9 +3948,35 @@ class EnhancedSSLCertificateChecker:
                                         command=lambda: pwd_entry.config(show="" if self.show_pwd_var.get() else "*"))
         show_pwd_check.grid(row=0, column=1, padx=(0, 10))
         
+        # 배치용 비밀번호 목록 (다중 PFX 분석 시 후보로 순서대로 시도)
+        pwd_list_btn = ttk.Button(pwd_frame, text="🔑 비밀번호 목록", command=self.load_password_list)
+        pwd_list_btn.grid(row=0, column=2, padx=(0, 10))
+        
+        # 오프라인 폐기 확인용 CRL 폴더
+        crl_btn = ttk.Button(pwd_frame, text="📋 CRL 폴더", command=self.browse_crl_directory)
+        crl_btn.grid(row=0, column=3, padx=(0, 10))
+        
+        # 실시간 폐기 확인 (AIA의 OCSP 응답자에 질의 - 네트워크 필요)
+        self.ocsp_var = tk.BooleanVar()
+        ocsp_check = ttk.Checkbutton(pwd_frame, text="🌐 OCSP 확인", variable=self.ocsp_var,
+                                     command=self.toggle_ocsp)
+        ocsp_check.grid(row=0, column=4, padx=(0, 10))
+        
+        # 빠진 중간 인증서를 AIA caIssuers에서 받아 로컬 미러에 보관
+        self.aia_var = tk.BooleanVar()
+        aia_check = ttk.Checkbutton(pwd_frame, text="🧩 AIA 보완", variable=self.aia_var,
+                                    command=self.toggle_aia)
+        aia_check.grid(row=0, column=5, padx=(0, 10))
+        
+        # 다중 파일을 파일마다 감시 작업 프로세스에서 분석 (멈추거나 메모리를 과도하게 쓰는 파일 대비)
+        self.isolation_var = tk.BooleanVar()
+        isolation_check = ttk.Checkbutton(pwd_frame, text="🛡️ 격리 분석", variable=self.isolation_var,
+                                          command=self.toggle_isolation)
+        isolation_check.grid(row=0, column=6, padx=(0, 10))
+        
         # 검증 버튼
         verify_btn = ttk.Button(pwd_frame, text="🔍 인증서 검증", command=self.verify_certificate)
-        verify_btn.grid(row=0, column=2, padx=(20, 0))
+        verify_btn.grid(row=0, column=7, padx=(20, 0))
         
         file_frame.columnconfigure(0, weight=1)
     
@@ -294,7 +4006,16 @@ class EnhancedSSLCertificateChecker:
         chain_info = result.get('chain_info', {})
         status = chain_info.get('status', 'unknown')
         
-        if '완전한 체인' in status:
+        if '폐기' in status:
+            if self.dark_mode:
+                bg_color = '#3a1e1e'
+                fg_color = '#ff6666'
+            else:
+                bg_color = '#f8d7da'
+                fg_color = '#721c24'
+            icon = '⛔'
+            status_text = '폐기된 인증서 포함'
+        elif '완전한 체인' in status:
             if self.dark_mode:
                 bg_color = '#1e3a1e'
                 fg_color = '#75d975'
@@ -322,6 +4043,18 @@ class EnhancedSSLCertificateChecker:
             icon = '❌'
             status_text = '체인 검증 실패'
         
+        # 리프가 유효해도 체인의 다른 인증서가 만료(임박)이면 경고
+        expiry_color = chain_info.get('expiry_color')
+        if icon in ('✅', '⚠️') and expiry_color in ('danger', 'warning'):
+            if expiry_color == 'danger':
+                bg_color, fg_color = ('#3a1e1e', '#ff6666') if self.dark_mode else ('#f8d7da', '#721c24')
+                icon = '❌'
+                status_text += ' - 만료된 인증서 포함'
+            else:
+                bg_color, fg_color = ('#3a2e1e', '#ffcc66') if self.dark_mode else ('#fff3cd', '#856404')
+                icon = '⏳'
+                status_text += ' - 체인 곧 만료'
+        
         # 상태 패널 프레임
         status_panel = tk.Frame(self.status_frame, bg=bg_color, relief='solid', bd=2)
         status_panel.pack(fill='x', pady=(0, 10))
@@ -337,10 +4070,22 @@ class EnhancedSSLCertificateChecker:
             details.append(f"📦 PFX 파일")
             if result.get('has_private_key'):
                 details.append("🔑 개인키 포함")
+        elif result.get('file_type') == '.keystore':
+            details.append(f"🗝️ Java 키스토어 ({result.get('keystore_type', '')})")
+            details.append(f"별칭 {len(result.get('keystore_entries', []))}개")
+            details.append(f"📜 인증서 {result.get('cert_count')}개")
         elif result.get('cert_count', 1) > 1:
             details.append(f"📜 인증서 {result.get('cert_count')}개")
         else:
             details.append("📄 단일 인증서")
+        
+        if result.get('key_match'):
+            details.append(result['key_match']['message'])
+        
+        if chain_info.get('effective_not_after') and result.get('cert_count', 1) > 1:
+            expiry_cn = self.extract_cn_from_subject(chain_info.get('expiry_subject', ''))
+            details.append(f"⏳ 체인 유효기간 ~{chain_info['effective_not_after']:%Y-%m-%d} "
+                           f"({expiry_cn}{', 리프보다 먼저 만료' if chain_info.get('expiry_before_leaf') else ''})")
             
         if details:
             detail_label = tk.Label(status_panel, text=" • ".join(details),
@@ -389,6 +4134,17 @@ class EnhancedSSLCertificateChecker:
         # 이벤트 바인딩
         self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
         
+        # 분석한 전체 인증서에서 호스트명을 포함하는 인증서 검색 (SAN 색인)
+        search_frame = ttk.Frame(tree_frame)
+        search_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(8, 0))
+        ttk.Label(search_frame, text="🔎 호스트:").grid(row=0, column=0, padx=(0, 5))
+        self.san_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.san_search_var, font=('Consolas', 10))
+        search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 5))
+        search_entry.bind('<Return>', lambda event: self.search_san_index())
+        ttk.Button(search_frame, text="SAN 검색", command=self.search_san_index).grid(row=0, column=2)
+        search_frame.columnconfigure(1, weight=1)
+        
         tree_frame.columnconfigure(0, weight=1)
         tree_frame.rowconfigure(0, weight=1)
         
@@ -434,6 +4190,24 @@ class EnhancedSSLCertificateChecker:
         self.ext_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         ext_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        # 잘린 확장 값의 [전체 보기] 링크 - 클릭한 항목만 펼침
+        self.ext_text.tag_configure('ext_more', foreground='#1e88e5', underline=True)
+        self.ext_text.tag_bind('ext_more', '<Button-1>', self.on_extension_more_click)
+        self.ext_text.tag_bind('ext_more', '<Enter>', lambda e: self.ext_text.config(cursor='hand2'))
+        self.ext_text.tag_bind('ext_more', '<Leave>', lambda e: self.ext_text.config(cursor=''))
+        
+        # 만료 예측 탭 - 다중 파일 분석 결과의 구간별 만료 수 타임라인
+        self.forecast_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.forecast_frame, text="📅 만료 예측")
+        
+        self.forecast_canvas = tk.Canvas(self.forecast_frame, height=300, highlightthickness=0,
+                                         bg=self.colors['tree_bg'])
+        self.forecast_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.forecast_canvas.bind('<Configure>', lambda e: self.render_forecast_timeline())
+        
+        # 확장 필드 탭은 보일 때만 렌더링
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_detail_tab_changed)
+        
         # 그리드 가중치 설정
         detail_frame.columnconfigure(0, weight=1)
         detail_frame.rowconfigure(0, weight=1)
@@ -441,6 +4215,8 @@ class EnhancedSSLCertificateChecker:
         self.info_frame.rowconfigure(0, weight=1)
         self.ext_frame.columnconfigure(0, weight=1)
         self.ext_frame.rowconfigure(0, weight=1)
+        self.forecast_frame.columnconfigure(0, weight=1)
+        self.forecast_frame.rowconfigure(0, weight=1)
     
     def setup_status_bar(self, parent, row):
         """하단 상태바"""
@@ -488,6 +4264,9 @@ class EnhancedSSLCertificateChecker:
         for child in self.root.winfo_children():
             self.update_theme_button_text(child)
             
+        if hasattr(self, 'forecast_canvas'):
+            self.render_forecast_timeline()
+        
         # 상태 패널이 있다면 다시 그리기
         if getattr(self, 'current_result', None):
             self.show_chain_status(self.current_result)
@@ -602,9 +4381,13 @@ class EnhancedSSLCertificateChecker:
             print(f"인증서 파일들: {cert_files}")
             
             if not cert_files:
+                # 설정 파일(YAML/JSON/.env 등)이면 안에 포함된 인증서를 찾아 분석
+                if self.has_embedded_certificates(files):
+                    self.process_multiple_files(files, embedded=True)
+                    return
                 messagebox.showwarning("드롭 실패", 
                     f"인증서 파일이 없습니다.\n"
-                    f"지원 형식: .pem, .crt, .cer, .pfx, .p12, .der\n"
+                    f"지원 형식: .pem, .crt, .cer, .pfx, .p12, .der, .keystore, .jks\n"
                     f"드롭된 파일: {len(files)}개")
                 if hasattr(self, 'status_var'):
                     self.status_var.set("❌ 인증서 파일 없음")
@@ -647,11 +4430,16 @@ class EnhancedSSLCertificateChecker:
                 if cert_files:
                     self.process_dropped_files(cert_files)
                     return "break"  # 이벤트 전파 중단
+                elif self.has_embedded_certificates(potential_files):
+                    self.process_multiple_files(potential_files, embedded=True)
+                    return "break"
                 else:
                     self.status_var.set("클립보드의 파일이 인증서 형식이 아닙니다")
-            else:
-                # 일반 텍스트는 기본 처리
-                pass
+            elif self.looks_like_certificate_text(clipboard_text):
+                # PEM/base64 인증서 내용 자체를 붙여넣은 경우 - 임시 파일 없이 메모리에서 분석
+                self.status_var.set("📋 붙여넣은 인증서 분석 중...")
+                self.start_verification(clipboard_text.encode('utf-8'))
+                return "break"
                 
         except tk.TclError:
             # 클립보드가 비어있거나 텍스트가 아닌 경우
@@ -659,6 +4447,25 @@ class EnhancedSSLCertificateChecker:
         except Exception as e:
             self.status_var.set(f"붙여넣기 오류: {str(e)[:50]}...")
     
+    def looks_like_certificate_text(self, text):
+        """붙여넣은 텍스트가 인증서 내용(PEM 블록 또는 충분히 긴 base64)인지 확인"""
+        data = text.strip().encode('utf-8', 'ignore')
+        if PEM_BLOCK_RE.search(data):
+            return True
+        der_data = decode_base64_text(data) if len(data) >= 256 else None
+        return bool(der_data) and der_data[:1] == b'\x30'
+    
+    def has_embedded_certificates(self, file_paths):
+        """파일이 아카이브이거나 안에 인증서(PEM 블록 또는 base64 인증서)가 하나라도 있는지 확인"""
+        scanner = EmbeddedCertificateScanner()
+        for filepath in file_paths:
+            try:
+                if ArchiveScanner.is_archive(filepath) or scanner.scan_file(filepath):
+                    return True
+            except (OSError, ValueError):
+                continue
+        return False
+    
     def process_dropped_files(self, cert_files):
         """드롭된/붙여넣은 파일 처리"""
         try:
@@ -667,9 +4474,12 @@ class EnhancedSSLCertificateChecker:
                 self.file_path_var.set(filepath)
                 self.status_var.set(f"✅ 파일 드롭됨: {os.path.basename(filepath)}")
                 
-                # PFX 파일인 경우 비밀번호 팝업
+                # PFX 파일인 경우 비밀번호 팝업 (후보 비밀번호가 있으면 바로 검증)
                 if filepath.lower().endswith(('.pfx', '.p12')):
-                    self.prompt_pfx_password(filepath)
+                    if self.pfx_password_cache.has_candidates_for(filepath):
+                        self.verify_certificate()
+                    else:
+                        self.prompt_pfx_password(filepath)
                     
             elif len(cert_files) > 1:
                 self.status_var.set(f"📁 다중 파일 드롭됨: {len(cert_files)}개")
@@ -678,66 +4488,14 @@ class EnhancedSSLCertificateChecker:
         except Exception as e:
             messagebox.showerror("파일 처리 오류", f"파일 처리 중 오류가 발생했습니다:\n{str(e)}")
     
-    def is_certificate_file(self, filepath):
-        """인증서 파일인지 확인 (확장자 + 파일 크기)"""
-        try:
-            # 파일 존재 여부 확인
-            if not os.path.exists(filepath) or not os.path.isfile(filepath):
-                return False
-            
-            # 확장자 확인
-            cert_extensions = ['.pem', '.crt', '.cer', '.pfx', '.p12', '.der']
-            if not any(filepath.lower().endswith(ext) for ext in cert_extensions):
-                return False
-            
-            # 파일 크기 확인 (1MB ~ 50MB 사이)
-            file_size = os.path.getsize(filepath)
-            if file_size < 100 or file_size > 50 * 1024 * 1024:  # 100바이트 ~ 50MB
-                return False
-            
-            # 기본적인 파일 내용 확인
-            try:
-                with open(filepath, 'rb') as f:
-                    header = f.read(100)  # 첫 100바이트만 확인
-                    
-                # PEM 형식 확인
-                if filepath.lower().endswith(('.pem', '.crt', '.cer')):
-                    if b'-----BEGIN' not in header and b'-----' not in header:
-                        # BASE64 인코딩된 내용이 있는지 확인
-                        try:
-                            header_str = header.decode('ascii', errors='ignore')
-                            if not any(c.isalnum() for c in header_str):
-                                return False
-                        except:
-                            return False
-                
-                # DER 형식 확인 (바이너리)
-                elif filepath.lower().endswith('.der'):
-                    # ASN.1 DER 형식은 0x30으로 시작
-                    if not header.startswith(b'\x30'):
-                        return False
-                
-                # PFX/P12 형식 확인
-                elif filepath.lower().endswith(('.pfx', '.p12')):
-                    # PKCS#12 매직 바이트 확인
-                    if not (header.startswith(b'\x30') or b'PK' in header[:20]):
-                        return False
-                        
-            except (IOError, OSError):
-                return False
-            
-            return True
-            
-        except Exception:
-            return False
-    
     def browse_file(self):
         """파일 선택 다이얼로그"""
         file_types = [
-            ("인증서 파일", "*.pem *.crt *.cer *.pfx *.p12 *.der"),
+            ("인증서 파일", "*.pem *.crt *.cer *.pfx *.p12 *.der *.keystore *.jks *.jceks"),
             ("PEM 파일", "*.pem"),
             ("CRT 파일", "*.crt *.cer"),
             ("PFX/P12 파일", "*.pfx *.p12"),
+            ("Java 키스토어", "*.keystore *.jks *.jceks"),
             ("DER 파일", "*.der"),
             ("모든 파일", "*.*")
         ]
@@ -750,17 +4508,19 @@ class EnhancedSSLCertificateChecker:
         if filename:
             self.file_path_var.set(filename)
             
-            # PFX 파일인 경우 비밀번호 팝업
+            # PFX 파일인 경우 비밀번호 팝업 (후보 비밀번호가 있으면 생략)
             if filename.lower().endswith(('.pfx', '.p12')):
-                self.prompt_pfx_password(filename)
+                if not self.pfx_password_cache.has_candidates_for(filename):
+                    self.prompt_pfx_password(filename)
     
     def browse_multiple_files(self):
         """다중 파일 선택 다이얼로그"""
         file_types = [
-            ("인증서 파일", "*.pem *.crt *.cer *.pfx *.p12 *.der"),
+            ("인증서 파일", "*.pem *.crt *.cer *.pfx *.p12 *.der *.keystore *.jks *.jceks"),
             ("PEM 파일", "*.pem"),
             ("CRT 파일", "*.crt *.cer"),
             ("PFX/P12 파일", "*.pfx *.p12"),
+            ("Java 키스토어", "*.keystore *.jks *.jceks"),
             ("DER 파일", "*.der"),
             ("모든 파일", "*.*")
         ]
@@ -777,6 +4537,128 @@ class EnhancedSSLCertificateChecker:
             else:
                 messagebox.showwarning("파일 선택", "인증서 파일을 찾을 수 없습니다.")
     
+    def load_password_list(self):
+        """PFX 비밀번호 목록 파일 로드 (배치 분석용)"""
+        filename = filedialog.askopenfilename(
+            title="PFX 비밀번호 목록 파일 선택 (한 줄에 하나)",
+            filetypes=[("텍스트 파일", "*.txt"), ("모든 파일", "*.*")]
+        )
+        if not filename:
+            return
+        
+        try:
+            added = self.pfx_password_cache.load_file(filename)
+        except (IOError, OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("비밀번호 목록 오류", f"비밀번호 목록을 읽을 수 없습니다:\n{str(e)}")
+            return
+        
+        total = len(self.pfx_password_cache.passwords)
+        self.status_var.set(f"🔑 비밀번호 후보 {added}개 추가됨 (총 {total}개) - PFX 분석 시 순서대로 시도")
+    
+    def browse_crl_directory(self):
+        """CRL 폴더를 선택해 오프라인 폐기 확인 색인 구성"""
+        directory = filedialog.askdirectory(title="CRL 파일(.crl/.pem/.der)이 있는 폴더 선택")
+        if not directory:
+            return
+        
+        self.progress.start()
+        self.status_var.set("CRL 색인 중... (대형 CRL은 시간이 걸릴 수 있습니다)")
+        
+        def run():
+            try:
+                crl_index = self.crl_index or CrlIndex()
+                parsed, reused, errors = crl_index.load_directory(directory)
+                self.crl_index = crl_index
+                revoked_total = sum(len(entry['serials']) for _, entries in crl_index.files.values() for entry in entries)
+                crl_files = sum(1 for _, entries in crl_index.files.values() if entries)
+                ca_total = sum(len(certificates) for certificates in crl_index.certificates.values())
+                msg = (f"📋 CRL {crl_files}개 색인 (새로 파싱 {parsed}, 폐기 시리얼 {revoked_total}개, "
+                       f"서명 확인용 CA 인증서 {ca_total}개)")
+                if errors:
+                    msg += f" • 읽기 실패 {len(errors)}개"
+                self.root.after(0, lambda: self.status_var.set(msg))
+            except Exception as e:
+                self.root.after(0, self.display_error, f"CRL 색인 오류: {str(e)}")
+            finally:
+                self.root.after(0, self.stop_progress)
+        
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+    
+    def export_fullchain_dialog(self):
+        """현재 분석 결과를 리프→루트 순서의 fullchain.pem으로 저장"""
+        if not self.current_result or not self.current_result.get('certificates'):
+            messagebox.showwarning("내보내기", "먼저 인증서 파일 하나를 분석하세요.")
+            return
+        
+        include_root = messagebox.askyesnocancel("fullchain 내보내기",
+                                                 "루트 인증서를 포함할까요?\n\n"
+                                                 "예: 포함 (없으면 AIA 미러에서 보완)\n아니오: 루트 제외")
+        if include_root is None:
+            return
+        output_path = filedialog.asksaveasfilename(title="fullchain 저장", initialfile="fullchain.pem",
+                                                   defaultextension=".pem",
+                                                   filetypes=[("PEM 파일", "*.pem"), ("모든 파일", "*.*")])
+        if not output_path:
+            return
+        
+        try:
+            report = self.export_fullchain(self.current_result, output_path, 'add' if include_root else 'drop')
+        except Exception as e:
+            messagebox.showerror("내보내기 오류", f"fullchain을 저장할 수 없습니다:\n{str(e)}")
+            return
+        
+        lines = [f"{i + 1}. {self.extract_cn_from_subject(self.format_name(cert.subject))}"
+                 for i, cert in enumerate(report['chain'])]
+        lines += [''] + report['notes'] if report['notes'] else []
+        self.status_var.set(f"💾 fullchain 저장 완료: {os.path.basename(output_path)} (인증서 {len(report['chain'])}개)")
+        messagebox.showinfo("fullchain 내보내기", f"저장 위치: {output_path}\n\n" + '\n'.join(lines))
+    
+    def toggle_ocsp(self):
+        """OCSP 실시간 확인 켜기/끄기 (끄면 연결과 응답 캐시 정리)"""
+        if self.ocsp_var.get():
+            self.ocsp_client = OcspClient()
+            self.status_var.set("🌐 OCSP 확인 사용 - 분석 시 응답자에 일괄 질의합니다")
+        else:
+            if self.ocsp_client is not None:
+                self.ocsp_client.close()
+            self.ocsp_client = None
+            self.status_var.set("OCSP 확인 해제")
+    
+    def toggle_aia(self):
+        """AIA 체인 보완 켜기/끄기 (미러는 디스크에 남아 다음 실행에서 재사용)"""
+        if self.aia_var.get():
+            self.aia_mirror = AiaMirror()
+            cached = len(self.aia_mirror.index['urls'])
+            self.status_var.set(f"🧩 AIA 보완 사용 - 미러: {self.aia_mirror.directory} (받아 둔 URL {cached}개)")
+        else:
+            if self.aia_mirror is not None:
+                self.aia_mirror.http.close()
+            self.aia_mirror = None
+            self.status_var.set("AIA 보완 해제")
+    
+    def on_close(self):
+        """창 닫기 - 작업 프로세스 풀과 HTTP 연결을 정리한 뒤 종료 (분석 중이어도 이벤트 루프를 막지 않음)"""
+        self.shutdown_pfx_pool(wait=False)
+        for client in (self.ocsp_client, self.aia_mirror):
+            if client is not None:
+                client.http.close()
+        self.root.destroy()
+    
+    def toggle_isolation(self):
+        """격리 분석 켜기/끄기 - 켜면 다중 파일을 파일마다 제한 시간이 있는 작업 프로세스에서 분석"""
+        if self.isolation_var.get():
+            self.file_timeout = SupervisedWorkerPool.DEFAULT_TIMEOUT
+            self.status_var.set(f"🛡️ 격리 분석 사용 - 파일당 최대 {self.file_timeout}초, "
+                                f"{SupervisedWorkerPool.DEFAULT_MEMORY_LIMIT_MB}MB")
+        else:
+            self.file_timeout = None
+            if self.supervised_pool is not None:
+                self.supervised_pool.close()
+                self.supervised_pool = None
+            self.status_var.set("격리 분석 해제")
+    
     def prompt_pfx_password(self, filepath):
         """PFX 파일 비밀번호 입력 팝업"""
         if not filepath.lower().endswith(('.pfx', '.p12')):
@@ -893,8 +4775,8 @@ class EnhancedSSLCertificateChecker:
             self.file_path_var.set("")
             self.status_var.set("PFX 비밀번호 입력이 취소되었습니다")
     
-    def process_multiple_files(self, file_paths):
-        """다중 파일 처리"""
+    def process_multiple_files(self, file_paths, embedded=False):
+        """다중 파일 처리 (embedded=True면 설정 파일 안에 포함된 인증서를 찾아 분석)"""
         if not file_paths:
             return
             
@@ -910,34 +4792,37 @@ class EnhancedSSLCertificateChecker:
             self.tree.delete(item)
         
         # 별도 스레드에서 실행
-        thread = threading.Thread(target=self.run_multiple_verification, args=(file_paths,))
+        thread = threading.Thread(target=self.run_multiple_verification, args=(file_paths, embedded))
         thread.daemon = True
         thread.start()
     
-    def run_multiple_verification(self, file_paths):
+    def run_multiple_verification(self, file_paths, embedded=False):
         """다중 파일 검증 실행"""
         try:
-            for i, filepath in enumerate(file_paths):
-                try:
-                    result = self.analyze_certificate(filepath)
-                    result['file_path'] = filepath
-                    result['file_name'] = os.path.basename(filepath)
-                    self.analysis_results.append(result)
-                    
-                    # UI 업데이트 (중간 진행 상황)
-                    progress_msg = f"분석 중... ({i+1}/{len(file_paths)}) {os.path.basename(filepath)}"
-                    self.root.after(0, lambda msg=progress_msg: self.status_var.set(msg))
-                    
-                except Exception as e:
-                    # 개별 파일 오류 처리
-                    error_result = {
-                        'file_path': filepath,
-                        'file_name': os.path.basename(filepath),
-                        'status': 'error',
-                        'summary': f'파일 분석 실패: {str(e)}',
-                        'chain_info': {'status': '❌ 분석 실패'}
-                    }
-                    self.analysis_results.append(error_result)
+            # 바뀐 CRL 파일만 다시 파싱
+            if self.crl_index is not None:
+                self.crl_index.refresh()
+            
+            completed = [0]
+            
+            def on_result(index, result):
+                # UI 업데이트 (중간 진행 상황)
+                completed[0] += 1
+                if embedded:
+                    progress_msg = f"포함된 인증서 분석 중... ({completed[0]}개 발견) {result.get('file_name', '')}"
+                else:
+                    progress_msg = f"분석 중... ({completed[0]}/{len(file_paths)}) {result.get('file_name', '')}"
+                self.root.after(0, lambda msg=progress_msg: self.status_var.set(msg))
+            
+            if embedded:
+                self.analysis_results = self.analyze_embedded(file_paths, on_result=on_result)
+            else:
+                # PFX/P12는 전용 프로세스 풀에서 병렬 복호화
+                self.analysis_results = self.analyze_batch(file_paths, on_result=on_result)
+            self.san_index = SanIndex.from_results(self.analysis_results)
+            self.lint_table = CertificateTable.from_results(self.analysis_results)
+            self.lint_findings = CertificateLinter().run(self.lint_table)
+            self.forecast_report = ExpiryForecast(as_of=self.evaluation_time()).run(self.lint_table)
             
             # 완료 후 UI 업데이트
             self.root.after(0, self.display_multiple_results)
@@ -950,542 +4835,373 @@ class EnhancedSSLCertificateChecker:
     
     def display_multiple_results(self):
         """다중 파일 분석 결과 표시"""
+        self.current_result = None
         if not self.analysis_results:
-            return
-        
-        # 상태 패널 - 다중 파일 요약
-        self.show_multiple_files_status()
-        
-        # 트리뷰에 다중 파일 결과 표시
-        self.populate_multiple_files_tree()
-        
-        # 상태 업데이트
-        success_count = sum(1 for r in self.analysis_results if r.get('status') != 'error')
-        self.status_var.set(f"✅ 다중 파일 분석 완료: {success_count}/{len(self.analysis_results)}개 성공")
-    
-    def show_multiple_files_status(self):
-        """다중 파일 상태 표시"""
-        for widget in self.status_frame.winfo_children():
-            widget.destroy()
-        
-        # 결과 요약
-        total_files = len(self.analysis_results)
-        success_files = sum(1 for r in self.analysis_results if r.get('status') != 'error')
-        complete_chains = sum(1 for r in self.analysis_results if '완전한 체인' in r.get('chain_info', {}).get('status', ''))
-        
-        # 상태 패널
-        if self.dark_mode:
-            bg_color = '#3c3c3c'
-            fg_color = '#ffffff'
-        else:
-            bg_color = '#f8f9fa'
-            fg_color = '#000000'
-            
-        status_panel = tk.Frame(self.status_frame, bg=bg_color, relief='solid', bd=2)
-        status_panel.pack(fill='x', pady=(0, 10))
-        
-        # 제목
-        title_label = tk.Label(status_panel, text=f"📊 다중 파일 분석 결과", 
-                              bg=bg_color, fg=fg_color, font=('Arial', 16, 'bold'))
-        title_label.pack(pady=10)
-        
-        # 요약 정보
-        summary_text = f"총 {total_files}개 파일 • 성공 {success_files}개 • 완전한 체인 {complete_chains}개"
-        summary_label = tk.Label(status_panel, text=summary_text,
-                                bg=bg_color, fg=fg_color, font=('Arial', 12))
-        summary_label.pack(pady=(0, 10))
-    
-    def populate_multiple_files_tree(self):
-        """다중 파일 결과를 트리에 표시"""
-        # 기존 아이템 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # 최상위 노드
-        summary_item = self.tree.insert('', 'end', 
-                                      text=f"📊 다중 파일 분석 결과",
-                                      values=('분석 요약', f'{len(self.analysis_results)}개 파일', ''))
-        
-        # 각 파일별 결과 추가
-        for result in self.analysis_results:
-            file_name = result.get('file_name', 'Unknown')
-            file_path = result.get('file_path', '')
-            
-            if result.get('status') == 'error':
-                # 오류 파일
-                file_item = self.tree.insert(summary_item, 'end',
-                                           text=f"❌ {file_name}",
-                                           values=('오류', '분석 실패', ''))
-                
-                self.tree.insert(file_item, 'end',
-                               text=f"  오류: {result.get('summary', 'Unknown error')}",
-                               values=('', '', ''))
-            else:
-                # 정상 분석된 파일
-                chain_status = result.get('chain_info', {}).get('status', '알 수 없음')
-                cert_count = result.get('cert_count', 1)
-                
-                # 상태 아이콘
-                if '완전한 체인' in chain_status:
-                    status_icon = "✅"
-                elif '불완전한 체인' in chain_status or '단일 인증서' in chain_status:
-                    status_icon = "⚠️"
-                else:
-                    status_icon = "❓"
-                
-                file_item = self.tree.insert(summary_item, 'end',
-                                           text=f"{status_icon} {file_name}",
-                                           values=('파일', chain_status, f'{cert_count}개 인증서'))
-                
-                # 인증서 상세 정보 (간단히)
-                certificates = result.get('certificates', [result])
-                for cert_info in certificates[:3]:  # 최대 3개만 표시
-                    cn = self.extract_cn_from_subject(cert_info.get('subject', ''))
-                    validity = cert_info.get('validity_status', '')
-                    validity_icon = self.get_validity_icon(validity)
-                    
-                    self.tree.insert(file_item, 'end',
-                                   text=f"  📜 {cn}",
-                                   values=('인증서', f'{validity_icon} {validity}', ''))
-                
-                if len(certificates) > 3:
-                    self.tree.insert(file_item, 'end',
-                                   text=f"  ... 및 {len(certificates) - 3}개 더",
-                                   values=('', '', ''))
-        
-        # 요약 노드 확장
-        self.tree.item(summary_item, open=True)
-        self.tree.selection_set(summary_item)
-    
-    def verify_certificate(self):
-        """인증서 검증 실행"""
-        filepath = self.file_path_var.get().strip()
-        
-        if not filepath:
-            messagebox.showerror("오류", "인증서 파일을 선택해주세요.")
-            return
-        
-        if not os.path.exists(filepath):
-            messagebox.showerror("파일 오류", "선택한 파일이 존재하지 않습니다.")
-            return
-        
-        # 백그라운드에서 검증 실행
-        self.start_verification(filepath)
-    
-    def start_verification(self, filepath):
-        """백그라운드에서 검증 시작"""
-        self.progress.start()
-        self.status_var.set("인증서 분석 중...")
-        
-        # 트리 초기화
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=self.run_verification, args=(filepath,))
-        thread.daemon = True
-        thread.start()
-    
-    def run_verification(self, filepath):
-        """실제 검증 로직 실행"""
-        try:
-            result = self.analyze_certificate(filepath)
-            self.root.after(0, self.display_results, result)
-        except Exception as e:
-            error_msg = f"분석 오류: {str(e)}"
-            self.root.after(0, self.display_error, error_msg)
-        finally:
-            self.root.after(0, self.stop_progress)
-    
-    def analyze_certificate(self, filepath):
-        """인증서 분석 (기존 로직 재사용)"""
-        file_ext = os.path.splitext(filepath)[1].lower()
-        
-        try:
-            if file_ext in ['.pfx', '.p12']:
-                return self.analyze_pkcs12_certificate(filepath)
-            elif file_ext == '.der':
-                return self.analyze_der_certificate(filepath)
-            else:
-                return self.analyze_pem_certificate(filepath)
-        except Exception as e:
-            return {
-                'status': 'error',
-                'summary': f'파일 분석 실패: {str(e)}',
-                'details': '',
-                'extensions': '',
-                'chain_info': {'status': '❌ 분석 실패'}
-            }
-    
-    def analyze_pem_certificate(self, filepath):
-        """PEM/CRT 인증서 분석"""
-        with open(filepath, 'rb') as f:
-            cert_data = f.read()
-        
-        # 여러 인증서가 있을 수 있으므로 분리
-        cert_blocks = []
-        current_cert = b""
-        in_cert = False
-        
-        for line in cert_data.split(b'\n'):
-            if b'-----BEGIN CERTIFICATE-----' in line:
-                in_cert = True
-                current_cert = line + b'\n'
-            elif b'-----END CERTIFICATE-----' in line:
-                current_cert += line + b'\n'
-                cert_blocks.append(current_cert)
-                current_cert = b""
-                in_cert = False
-            elif in_cert:
-                current_cert += line + b'\n'
-        
-        if not cert_blocks:
-            raise ValueError("유효한 인증서를 찾을 수 없습니다.")
-        
-        # 첫 번째 인증서 분석 (리프 인증서)
-        cert = x509.load_pem_x509_certificate(cert_blocks[0])
-        
-        result = self.extract_certificate_info(cert)
-        result['cert_count'] = len(cert_blocks)
-        result['file_type'] = os.path.splitext(filepath)[1].lower()
-        result['certificates'] = []
-        
-        # 모든 인증서 정보 수집
-        for i, cert_block in enumerate(cert_blocks):
-            cert_obj = x509.load_pem_x509_certificate(cert_block)
-            cert_info = self.extract_certificate_info(cert_obj)
-            cert_info['position'] = i
-            cert_info['cert_object'] = cert_obj
-            result['certificates'].append(cert_info)
-        
-        # 체인 검증 수행
-        if len(cert_blocks) > 1:
-            chain_result = self.verify_certificate_chain(cert_blocks)
-            result['chain_info'] = chain_result
-        else:
-            result['chain_info'] = {
-                'status': '📄 단일 인증서',
-                'details': '중간 인증서가 필요할 수 있습니다',
-                'is_complete': False
-            }
-        
-        return result
-    
-    def analyze_der_certificate(self, filepath):
-        """DER 인증서 분석"""
-        with open(filepath, 'rb') as f:
-            cert_data = f.read()
-        
-        cert = x509.load_der_x509_certificate(cert_data)
-        result = self.extract_certificate_info(cert)
-        result['file_type'] = '.der'
-        result['cert_count'] = 1
-        result['certificates'] = [result.copy()]
-        result['chain_info'] = {
-            'status': '📄 단일 인증서',
-            'details': '중간 인증서가 필요할 수 있습니다',
-            'is_complete': False
-        }
-        return result
-    
-    def analyze_pkcs12_certificate(self, filepath):
-        """PKCS#12 (PFX/P12) 인증서 분석"""
-        password = self.password_var.get().encode('utf-8') if self.password_var.get() else None
-        
-        with open(filepath, 'rb') as f:
-            p12_data = f.read()
-        
-        try:
-            private_key, certificate, additional_certificates = pkcs12.load_key_and_certificates(
-                p12_data, password
-            )
-        except ValueError as e:
-            if "invalid" in str(e).lower() or "could not deserialize" in str(e).lower():
-                raise ValueError("PFX 비밀번호가 틀렸거나 파일이 손상되었습니다.")
-            raise
-        
-        if certificate is None:
-            raise ValueError("PFX 파일에서 인증서를 찾을 수 없습니다.")
-        
-        result = self.extract_certificate_info(certificate)
-        result['file_type'] = '.pfx'
-        result['has_private_key'] = private_key is not None
-        result['cert_count'] = 1 + (len(additional_certificates) if additional_certificates else 0)
-        result['certificates'] = []
-        
-        # 메인 인증서
-        main_cert_info = self.extract_certificate_info(certificate)
-        main_cert_info['position'] = 0
-        main_cert_info['cert_type'] = 'leaf'
-        main_cert_info['cert_object'] = certificate
-        result['certificates'].append(main_cert_info)
-        
-        # 추가 인증서들
-        if additional_certificates:
-            for i, cert in enumerate(additional_certificates):
-                cert_info = self.extract_certificate_info(cert)
-                cert_info['position'] = i + 1
-                cert_info['cert_type'] = 'ca'
-                cert_info['cert_object'] = cert
-                result['certificates'].append(cert_info)
-            
-            # PFX의 체인 검증
-            all_certs = [certificate] + list(additional_certificates)
-            pfx_chain_result = self.verify_pfx_chain(all_certs)
-            result['chain_info'] = pfx_chain_result
-        else:
-            result['chain_info'] = {
-                'status': '📄 단일 인증서',
-                'details': '중간 CA가 포함되지 않음',
-                'is_complete': False
-            }
+            self.status_var.set("❌ 분석할 인증서를 찾을 수 없습니다")
+            return
         
-        return result
+        # 상태 패널 - 다중 파일 요약
+        self.show_multiple_files_status()
+        
+        # 트리뷰에 다중 파일 결과 표시
+        self.populate_multiple_files_tree()
+        self.render_forecast_timeline()
+        
+        # 상태 업데이트
+        success_count = sum(1 for r in self.analysis_results if r.get('status') != 'error')
+        self.status_var.set(f"✅ 다중 파일 분석 완료: {success_count}/{len(self.analysis_results)}개 성공")
     
-    def extract_certificate_info(self, cert):
-        """인증서에서 정보 추출 (기존 로직 재사용)"""
-        # 기본 정보
-        subject = self.format_name(cert.subject)
-        issuer = self.format_name(cert.issuer)
-        serial = hex(cert.serial_number)[2:].upper()
+    def show_multiple_files_status(self):
+        """다중 파일 상태 표시"""
+        for widget in self.status_frame.winfo_children():
+            widget.destroy()
         
-        # 날짜 정보
-        not_before = cert.not_valid_before
-        not_after = cert.not_valid_after
+        # 결과 요약
+        total_files = len(self.analysis_results)
+        success_files = sum(1 for r in self.analysis_results if r.get('status') != 'error')
+        complete_chains = sum(1 for r in self.analysis_results if '완전한 체인' in r.get('chain_info', {}).get('status', ''))
+        expiry_colors = [r.get('chain_info', {}).get('expiry_color') for r in self.analysis_results]
         
-        # timezone 정보 통일
-        if not_before.tzinfo is None:
-            not_before = not_before.replace(tzinfo=timezone.utc)
-        if not_after.tzinfo is None:
-            not_after = not_after.replace(tzinfo=timezone.utc)
+        # 상태 패널
+        if self.dark_mode:
+            bg_color = '#3c3c3c'
+            fg_color = '#ffffff'
+        else:
+            bg_color = '#f8f9fa'
+            fg_color = '#000000'
+            
+        status_panel = tk.Frame(self.status_frame, bg=bg_color, relief='solid', bd=2)
+        status_panel.pack(fill='x', pady=(0, 10))
         
-        # 현재 시간과 비교
-        now = datetime.now(timezone.utc)
+        # 제목
+        title_label = tk.Label(status_panel, text=f"📊 다중 파일 분석 결과", 
+                              bg=bg_color, fg=fg_color, font=('Arial', 16, 'bold'))
+        title_label.pack(pady=10)
         
-        try:
-            if not_after < now:
-                days_left = (now - not_after).days
-                validity_status = f"만료됨 ({days_left}일 전)"
-                validity_color = 'danger'
-            elif (not_after - now).days < 30:
-                days_left = (not_after - now).days
-                validity_status = f"곧 만료 ({days_left}일 남음)"
-                validity_color = 'warning'
-            else:
-                days_left = (not_after - now).days
-                validity_status = f"유효 ({days_left}일 남음)"
-                validity_color = 'success'
-        except Exception:
-            validity_status = "유효성 확인 불가"
-            validity_color = 'warning'
+        # 요약 정보
+        summary_text = f"총 {total_files}개 파일 • 성공 {success_files}개 • 완전한 체인 {complete_chains}개"
+        if 'danger' in expiry_colors or 'warning' in expiry_colors:
+            summary_text += (f" • 만료 포함 체인 {expiry_colors.count('danger')}개"
+                             f" • {self.EXPIRING_DAYS}일 내 만료 체인 {expiry_colors.count('warning')}개")
+        summary_label = tk.Label(status_panel, text=summary_text,
+                                bg=bg_color, fg=fg_color, font=('Arial', 12))
+        summary_label.pack(pady=(0, 10))
+    
+    def populate_multiple_files_tree(self):
+        """다중 파일 결과를 트리에 표시"""
+        # 기존 아이템 삭제
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.tree_cert_map = {}
         
-        # 공개키 정보
-        public_key = cert.public_key()
-        key_info = self.get_public_key_info(public_key)
+        # 최상위 노드
+        summary_item = self.tree.insert('', 'end', 
+                                      text=f"📊 다중 파일 분석 결과",
+                                      values=('분석 요약', f'{len(self.analysis_results)}개 파일', ''))
         
-        # SAN 도메인 추출
-        san_domains = self.extract_san_domains(cert)
+        # 각 파일별 결과 추가 (체인 유효 만료가 이른 순, 실패한 파일은 뒤로)
+        for result in sorted(self.analysis_results, key=self.chain_expiry_sort_key):
+            file_name = result.get('file_name', 'Unknown')
+            file_path = result.get('file_path', '')
+            
+            if result.get('status') == 'error':
+                # 오류 파일
+                file_item = self.tree.insert(summary_item, 'end',
+                                           text=f"❌ {file_name}",
+                                           values=('오류', '분석 실패', ''))
+                
+                self.tree.insert(file_item, 'end',
+                               text=f"  오류: {result.get('summary', 'Unknown error')}",
+                               values=('', '', ''))
+            else:
+                # 정상 분석된 파일
+                chain_status = result.get('chain_info', {}).get('status', '알 수 없음')
+                cert_count = result.get('cert_count', 1)
+                
+                # 상태 아이콘
+                if '완전한 체인' in chain_status:
+                    status_icon = "✅"
+                elif '불완전한 체인' in chain_status or '단일 인증서' in chain_status:
+                    status_icon = "⚠️"
+                else:
+                    status_icon = "❓"
+                chain_info = result.get('chain_info', {})
+                expiry_text = ''
+                if chain_info.get('effective_not_after'):
+                    expiry_text = f" • ~{chain_info['effective_not_after']:%Y-%m-%d}"
+                    status_icon = {'danger': '❌', 'warning': '⏳'}.get(chain_info.get('expiry_color'), status_icon)
+                
+                file_item = self.tree.insert(summary_item, 'end',
+                                           text=f"{status_icon} {file_name}",
+                                           values=('파일', chain_status, f'{cert_count}개 인증서{expiry_text}'))
+                
+                # 인증서 상세 정보 (간단히)
+                certificates = result.get('certificates', [result])
+                for cert_info in certificates[:3]:  # 최대 3개만 표시
+                    cn = self.extract_cn_from_subject(cert_info.get('subject', ''))
+                    validity = cert_info.get('validity_status', '')
+                    validity_icon = self.get_validity_icon(validity)
+                    
+                    cert_item = self.tree.insert(file_item, 'end',
+                                               text=f"  📜 {cn}",
+                                               values=('인증서', f'{validity_icon} {validity}', ''))
+                    self.tree_cert_map[cert_item] = cert_info
+                
+                if len(certificates) > 3:
+                    self.tree.insert(file_item, 'end',
+                                   text=f"  ... 및 {len(certificates) - 3}개 더",
+                                   values=('', '', ''))
         
-        # 인증서 용도
-        usage = self.get_certificate_usage(cert)
+        # 정책 점검 결과
+        if self.lint_table is not None:
+            self.add_lint_findings_to_tree()
         
-        return {
-            'subject': subject,
-            'issuer': issuer,
-            'serial': serial,
-            'not_before': not_before,
-            'not_after': not_after,
-            'validity_status': validity_status,
-            'validity_color': validity_color,
-            'key_info': key_info,
-            'san_domains': san_domains,
-            'usage': usage,
-            'cert_object': cert
-        }
-    
-    def format_name(self, name):
-        """X.509 Name을 문자열로 포맷"""
-        parts = []
-        for attribute in name:
-            if attribute.oid == NameOID.COMMON_NAME:
-                parts.append(f"CN={attribute.value}")
-            elif attribute.oid == NameOID.ORGANIZATION_NAME:
-                parts.append(f"O={attribute.value}")
-            elif attribute.oid == NameOID.ORGANIZATIONAL_UNIT_NAME:
-                parts.append(f"OU={attribute.value}")
-            elif attribute.oid == NameOID.COUNTRY_NAME:
-                parts.append(f"C={attribute.value}")
-            elif attribute.oid == NameOID.STATE_OR_PROVINCE_NAME:
-                parts.append(f"ST={attribute.value}")
-            elif attribute.oid == NameOID.LOCALITY_NAME:
-                parts.append(f"L={attribute.value}")
-        return ', '.join(parts)
+        # 요약 노드 확장
+        self.tree.item(summary_item, open=True)
+        self.tree.selection_set(summary_item)
     
-    def get_public_key_info(self, public_key):
-        """공개키 정보 추출"""
-        from cryptography.hazmat.primitives.asymmetric import rsa, ec, dsa
+    def render_forecast_timeline(self, limit=5):
+        """만료 예측 탭 Canvas에 구간별 만료 수 막대와 가장 먼저 만료되는 체인 목록 그리기"""
+        canvas = self.forecast_canvas
+        canvas.delete('all')
+        canvas.configure(bg=self.colors['tree_bg'])
+        report = self.forecast_report
+        if report is None:
+            canvas.create_text(12, 12, anchor='nw', fill=self.colors['fg_light'], font=('Arial', 10),
+                               text="여러 파일을 분석하면 만료 예측이 표시됩니다.")
+            return
         
-        if isinstance(public_key, rsa.RSAPublicKey):
-            key_size = public_key.key_size
-            return f"RSA {key_size}bit"
-        elif isinstance(public_key, ec.EllipticCurvePublicKey):
-            curve_name = public_key.curve.name
-            key_size = public_key.curve.key_size
-            return f"ECC {curve_name} ({key_size}bit)"
-        elif isinstance(public_key, dsa.DSAPublicKey):
-            key_size = public_key.key_size
-            return f"DSA {key_size}bit"
-        else:
-            return f"{type(public_key).__name__}"
+        width = max(canvas.winfo_width(), 320)
+        height = max(canvas.winfo_height(), 240)
+        canvas.create_text(12, 10, anchor='nw', fill=self.colors['tree_fg'], font=('Arial', 10, 'bold'),
+                           text=f"기준 {report['as_of']:%Y-%m-%d} • 향후 {report['horizon_days']}일 • "
+                                f"인증서 {report['total']}개")
+        
+        # 막대: 이미 만료 / 예측 구간들 / 이후
+        expiring_until = report['as_of'].timestamp() + self.EXPIRING_DAYS * 86400
+        bars = [('만료됨', report['expired'], self.colors['danger'])]
+        for start, _, count in report['buckets']:
+            color = self.colors['warning'] if start.timestamp() < expiring_until else self.colors['info']
+            bars.append((start.strftime(report['label_format']), count, color))
+        bars.append(('이후', report['later'], self.colors['fg_muted']))
+        
+        list_height = 22 + 16 * limit
+        top, bottom = 40, height - list_height - 24
+        slot = (width - 24) / len(bars)
+        peak = max(count for _, count, _ in bars) or 1
+        for i, (label, count, color) in enumerate(bars):
+            x0 = 12 + i * slot + slot * 0.15
+            x1 = 12 + (i + 1) * slot - slot * 0.15
+            y0 = bottom - (bottom - top - 14) * count / peak
+            canvas.create_rectangle(x0, y0, x1, bottom, fill=color, outline='')
+            canvas.create_text((x0 + x1) / 2, y0 - 2, anchor='s', text=str(count),
+                               fill=self.colors['tree_fg'], font=('Arial', 8))
+            canvas.create_text((x0 + x1) / 2, bottom + 3, anchor='n', text=label,
+                               fill=self.colors['fg_light'], font=('Arial', 8))
+        
+        # 체인별 가장 먼저 만료되는 인증서
+        y = bottom + 24
+        canvas.create_text(12, y, anchor='nw', fill=self.colors['tree_fg'], font=('Arial', 9, 'bold'),
+                           text="⛓️ 가장 먼저 만료되는 체인")
+        for not_after, index in report['chains'][:limit]:
+            y += 16
+            row = self.lint_table.row(index)
+            color = self.colors['danger'] if row['not_after'] < report['as_of'] else self.colors['tree_fg']
+            canvas.create_text(12, y, anchor='nw', fill=color, font=('Consolas', 9),
+                               text=f"{row['not_after']:%Y-%m-%d}  {self.extract_cn_from_subject(row['subject'])}  "
+                                    f"({os.path.basename(row['file_path'])})")
     
-    def extract_san_domains(self, cert):
-        """SAN에서 도메인 추출"""
-        try:
-            san_ext = cert.extensions.get_extension_for_oid(x509.oid.ExtensionOID.SUBJECT_ALTERNATIVE_NAME)
-            domains = []
-            for name in san_ext.value:
-                if isinstance(name, x509.DNSName):
-                    if hasattr(name, 'value'):
-                        domains.append(name.value)
-                    else:
-                        domains.append(str(name))
-            return domains
-        except (x509.ExtensionNotFound, AttributeError, Exception):
-            return []
+    def add_lint_findings_to_tree(self, limit=50):
+        """정책 점검(CertificateLinter) 위반을 규칙별로 트리에 추가"""
+        summary = CertificateLinter().summarize(self.lint_findings)
+        lint_item = self.tree.insert('', 'end', text="🧹 정책 점검",
+                                     values=('정책', f"위반 규칙 {len(summary)}개" if summary else '✅ 위반 없음',
+                                             f'{len(self.lint_table)}개 인증서'))
+        for rule_id, severity, description, count in summary:
+            rule_item = self.tree.insert(lint_item, 'end',
+                                         text=f"{'❌' if severity == 'error' else '⚠️'} {description}",
+                                         values=(rule_id, f'{count}개', ''))
+            for index in self.lint_findings[rule_id][:limit]:
+                row = self.lint_table.row(index)
+                self.tree.insert(rule_item, 'end',
+                                 text=f"  📜 {self.extract_cn_from_subject(row['subject'])} "
+                                      f"({os.path.basename(row['file_path'])})",
+                                 values=('인증서', f"{row['validity_days']}일",
+                                         f"{row['key_type']} {row['key_bits']}bit"))
+            if count > limit:
+                self.tree.insert(rule_item, 'end', text=f"  ... 및 {count - limit}개 더", values=('', '', ''))
     
-    def get_certificate_usage(self, cert):
-        """인증서 용도 확인"""
-        usages = []
+    def search_san_index(self):
+        """마지막 분석 결과의 SAN 색인에서 호스트명을 포함하는 인증서를 트리 맨 위에 표시"""
+        hostname = self.san_search_var.get().strip()
+        if not hostname:
+            return
+        if self.san_index is None:
+            messagebox.showinfo("SAN 검색", "먼저 인증서 파일을 분석하세요.")
+            return
         
-        try:
-            key_usage = cert.extensions.get_extension_for_oid(x509.oid.ExtensionOID.KEY_USAGE).value
-            if hasattr(key_usage, 'digital_signature') and key_usage.digital_signature:
-                usages.append("디지털 서명")
-            if hasattr(key_usage, 'key_encipherment') and key_usage.key_encipherment:
-                usages.append("키 암호화")
-            if hasattr(key_usage, 'key_agreement') and key_usage.key_agreement:
-                usages.append("키 합의")
-        except (x509.ExtensionNotFound, AttributeError, Exception):
-            pass
+        matches = self.san_index.lookup(hostname)
+        if self.san_search_item is not None and self.tree.exists(self.san_search_item):
+            self.tree.delete(self.san_search_item)
+        
+        icon = '✅' if matches else '❌'
+        self.san_search_item = self.tree.insert('', 0, text=f"🔎 {hostname}",
+                                                values=('SAN 검색', f'{icon} {len(matches)}개 인증서', ''))
+        for match in matches:
+            entry = match['entry']
+            cn = self.extract_cn_from_subject(entry['subject'])
+            file_name = os.path.basename(entry['file_path']) if entry['file_path'] else ''
+            self.tree.insert(self.san_search_item, 'end',
+                             text=f"  📜 {cn} ({file_name})" if file_name else f"  📜 {cn}",
+                             values=('정확히 일치' if match['match'] == 'exact' else match['san'],
+                                     f"{self.get_validity_icon(entry['validity_status'])} {entry['validity_status']}",
+                                     ''))
+        self.tree.item(self.san_search_item, open=True)
+        self.tree.see(self.san_search_item)
+        self.status_var.set(f"🔎 {hostname}: {len(matches)}개 인증서가 포함 "
+                            f"(색인 SAN {self.san_index.name_count}개)")
+    
+    def browse_key_pair_directory(self):
+        """폴더를 선택해 개인키/인증서 짝 검사 실행"""
+        directory = filedialog.askdirectory(title="개인키/인증서 짝을 검사할 폴더 선택")
+        if not directory:
+            return
         
-        try:
-            ext_key_usage = cert.extensions.get_extension_for_oid(x509.oid.ExtensionOID.EXTENDED_KEY_USAGE).value
-            if ExtendedKeyUsageOID.SERVER_AUTH in ext_key_usage:
-                usages.append("서버 인증 (TLS/SSL)")
-            if ExtendedKeyUsageOID.CLIENT_AUTH in ext_key_usage:
-                usages.append("클라이언트 인증")
-        except (x509.ExtensionNotFound, AttributeError, Exception):
-            pass
+        self.progress.start()
+        self.status_var.set(f"개인키/인증서 짝 검사 중... ({directory})")
         
-        return ', '.join(usages) if usages else "용도 불명"
+        thread = threading.Thread(target=self.run_key_pair_match, args=(directory,))
+        thread.daemon = True
+        thread.start()
     
-    def verify_certificate_chain(self, cert_blocks):
-        """인증서 체인 검증 (기존 로직)"""
+    def run_key_pair_match(self, directory):
+        """개인키/인증서 짝 검사 실행 (백그라운드)"""
         try:
-            certificates = []
-            for cert_block in cert_blocks:
-                cert = x509.load_pem_x509_certificate(cert_block)
-                certificates.append(cert)
-            
-            chain_issues = []
-            is_complete_chain = True
-            
-            # 체인 연결성 검사 - 개선된 로직
-            for i in range(len(certificates) - 1):
-                current_cert = certificates[i]
-                next_cert = certificates[i + 1]
-                
-                current_issuer = self.format_name(current_cert.issuer)
-                next_subject = self.format_name(next_cert.subject)
-                
-                # 개선된 연결성 검사 사용
-                connection_status = self.check_certificate_connection(current_issuer, next_subject)
-                
-                if "연결됨" in connection_status:
-                    chain_issues.append(f"✅ 인증서 {i+1} → {i+2}: {connection_status}")
-                elif "부분 연결" in connection_status:
-                    chain_issues.append(f"🟡 인증서 {i+1} → {i+2}: {connection_status}")
-                    # 부분 연결은 경고로 처리하지만 체인 끊김은 아님
-                else:
-                    chain_issues.append(f"❌ 인증서 {i+1} → {i+2}: {connection_status}")
-                    chain_issues.append(f"   현재 Issuer: {current_issuer}")
-                    chain_issues.append(f"   다음 Subject: {next_subject}")
-                    is_complete_chain = False
-            
-            # 루트 인증서 확인
-            root_cert = certificates[-1]
-            root_subject = self.format_name(root_cert.subject)
-            root_issuer = self.format_name(root_cert.issuer)
-            
-            is_self_signed = (root_subject == root_issuer)
-            
-            if is_self_signed:
-                chain_issues.append(f"✅ 루트 CA: 자체 서명 인증서 확인됨")
-            else:
-                chain_issues.append(f"⚠️ 루트 CA: 자체 서명이 아님 (상위 CA 필요할 수 있음)")
-                is_complete_chain = False
-            
-            # 최종 판단
-            if is_complete_chain and len(certificates) >= 2:
-                status = "✅ 완전한 체인"
-            elif len(certificates) >= 2:
-                status = "⚠️ 불완전한 체인"
-            else:
-                status = "❓ 단일 인증서"
-            
-            return {
-                'status': status,
-                'details': '\n'.join(chain_issues),
-                'is_complete': is_complete_chain,
-                'cert_count': len(certificates)
-            }
+            def on_progress(count, filepath):
+                if count % 50 == 0:
+                    msg = f"짝 검사 중... ({count}개 파일) {os.path.basename(filepath)}"
+                    self.root.after(0, lambda: self.status_var.set(msg))
             
+            report = self.match_key_pairs(directory, on_progress=on_progress)
+            self.root.after(0, self.display_key_pair_report, report)
         except Exception as e:
-            return {
-                'status': '❌ 체인 검증 실패',
-                'details': f'오류: {str(e)}',
-                'is_complete': False,
-                'cert_count': len(cert_blocks)
-            }
+            self.root.after(0, self.display_error, f"짝 검사 오류: {str(e)}")
+        finally:
+            self.root.after(0, self.stop_progress)
+    
+    def display_key_pair_report(self, report):
+        """개인키/인증서 짝 검사 결과 표시"""
+        self.current_result = None
+        for widget in self.status_frame.winfo_children():
+            widget.destroy()
+        
+        has_problem = report['mismatched'] or report['unmatched_keys']
+        if self.dark_mode:
+            bg_color, fg_color = ('#3a1e1e', '#ff6666') if has_problem else ('#1e3a1e', '#75d975')
+        else:
+            bg_color, fg_color = ('#f8d7da', '#721c24') if has_problem else ('#d4edda', '#155724')
+        
+        status_panel = tk.Frame(self.status_frame, bg=bg_color, relief='solid', bd=2)
+        status_panel.pack(fill='x', pady=(0, 10))
+        
+        icon = '❌' if has_problem else '✅'
+        tk.Label(status_panel, text=f"{icon} 개인키/인증서 짝 검사", bg=bg_color, fg=fg_color,
+                 font=('Arial', 16, 'bold')).pack(pady=10)
+        summary_text = (f"파일 {report['scanned']}개 • 일치 {len(report['matched'])}쌍 • "
+                        f"불일치 {len(report['mismatched'])}쌍 • 짝 없는 키 {len(report['unmatched_keys'])}개 • "
+                        f"짝 없는 인증서 {len(report['unmatched_certs'])}개")
+        tk.Label(status_panel, text=summary_text, bg=bg_color, fg=fg_color,
+                 font=('Arial', 12)).pack(pady=(0, 10))
+        
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        
+        def short_fp(fingerprint):
+            return fingerprint[:16] + '…'
+        
+        section = self.tree.insert('', 'end', text=f"❌ 불일치 ({len(report['mismatched'])}쌍)",
+                                   values=('불일치', '', ''), open=True)
+        for entry in report['mismatched']:
+            pair_item = self.tree.insert(section, 'end', text=f"  {entry['name']}", values=('짝', '지문 다름', ''))
+            for path in entry['paths']:
+                self.tree.insert(pair_item, 'end', text=f"    📄 {path}", values=('파일', '', ''))
+        
+        section = self.tree.insert('', 'end', text=f"🔑 짝 없는 개인키 ({len(report['unmatched_keys'])}개)",
+                                   values=('짝 없음', '', ''), open=True)
+        for entry in report['unmatched_keys']:
+            self.tree.insert(section, 'end', text=f"  {entry['path']}",
+                             values=('개인키', short_fp(entry['fingerprint']), entry['key_info']))
+        
+        section = self.tree.insert('', 'end', text=f"📜 짝 없는 인증서 ({len(report['unmatched_certs'])}개)",
+                                   values=('짝 없음', '', ''))
+        for entry in report['unmatched_certs']:
+            self.tree.insert(section, 'end', text=f"  {self.extract_cn_from_subject(entry['subject'])}",
+                             values=(os.path.basename(entry['path']), short_fp(entry['fingerprint']), entry['key_info']))
+        
+        section = self.tree.insert('', 'end', text=f"✅ 일치 ({len(report['matched'])}쌍)",
+                                   values=('일치', '', ''))
+        for entry in report['matched']:
+            cert_entry = entry['certificates'][0]
+            pair_item = self.tree.insert(section, 'end',
+                                         text=f"  {self.extract_cn_from_subject(cert_entry['subject'])}",
+                                         values=('짝', short_fp(entry['fingerprint']), cert_entry['key_info']))
+            for item in entry['keys'] + entry['certificates']:
+                self.tree.insert(pair_item, 'end', text=f"    📄 {item['path']}", values=('파일', '', ''))
+        
+        if report['errors']:
+            section = self.tree.insert('', 'end', text=f"⚠️ 읽기 실패 ({len(report['errors'])}개)",
+                                       values=('오류', '', ''))
+            for entry in report['errors']:
+                self.tree.insert(section, 'end', text=f"  {entry['path']}: {entry['error'][:80]}",
+                                 values=('오류', '', ''))
+        
+        self.status_var.set(f"✅ 짝 검사 완료: {summary_text}")
     
-    def verify_pfx_chain(self, certificates):
-        """PFX 인증서 체인 검증 (기존 로직)"""
+    def verify_certificate(self):
+        """인증서 검증 실행"""
+        filepath = self.file_path_var.get().strip()
+        
+        if not filepath:
+            messagebox.showerror("오류", "인증서 파일을 선택해주세요.")
+            return
+        
+        if not os.path.exists(filepath):
+            messagebox.showerror("파일 오류", "선택한 파일이 존재하지 않습니다.")
+            return
+        
+        # 백그라운드에서 검증 실행
+        self.start_verification(filepath)
+    
+    def start_verification(self, source):
+        """백그라운드에서 검증 시작 (source: 파일 경로 또는 붙여넣은 인증서 bytes)"""
+        self.progress.start()
+        self.status_var.set("인증서 분석 중...")
+        
+        # 트리 초기화
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        
+        # 별도 스레드에서 실행
+        thread = threading.Thread(target=self.run_verification, args=(source,))
+        thread.daemon = True
+        thread.start()
+    
+    def run_verification(self, source):
+        """실제 검증 로직 실행"""
         try:
-            if len(certificates) < 2:
-                return {'status': '❓ 단일 인증서', 'is_complete': False}
-            
-            # 간단한 체인 검증
-            leaf_cert = certificates[0]
-            ca_certs = certificates[1:]
-            
-            # 체인 연결 확인
-            current_cert = leaf_cert
-            chain_ok = True
-            
-            for ca_cert in ca_certs:
-                current_issuer = self.format_name(current_cert.issuer)
-                ca_subject = self.format_name(ca_cert.subject)
-                
-                if current_issuer == ca_subject:
-                    current_cert = ca_cert
-                else:
-                    chain_ok = False
-                    break
-            
-            # 마지막 인증서가 자체 서명인지 확인
-            if chain_ok:
-                root_subject = self.format_name(current_cert.subject)
-                root_issuer = self.format_name(current_cert.issuer)
-                
-                if root_subject == root_issuer:
-                    return {'status': '✅ 완전한 체인', 'is_complete': True}
-                else:
-                    return {'status': '⚠️ 불완전한 체인 (루트 CA 없음)', 'is_complete': False}
-            else:
-                return {'status': '⚠️ 불완전한 체인 (연결 오류)', 'is_complete': False}
-                
-        except Exception:
-            return {'status': '❌ 체인 검증 실패', 'is_complete': False}
+            if self.crl_index is not None:
+                self.crl_index.refresh()
+            result = self.analyze_source(source)
+            if self.ocsp_client is not None:
+                self.root.after(0, lambda: self.status_var.set("🌐 OCSP 응답자 확인 중..."))
+                self.apply_ocsp_checks([result])
+            self.san_index = SanIndex.from_results([result])
+            self.root.after(0, self.display_results, result)
+        except Exception as e:
+            error_msg = f"분석 오류: {str(e)}"
+            self.root.after(0, self.display_error, error_msg)
+        finally:
+            self.root.after(0, self.stop_progress)
     
     def display_results(self, result):
         """결과를 새로운 UI에 표시"""
@@ -1505,10 +5221,14 @@ class EnhancedSSLCertificateChecker:
         # 기존 아이템 삭제
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.tree_cert_map = {}
         
         certificates = result.get('certificates', [result])
         
-        if len(certificates) == 1:
+        if len(result.get('keystore_entries', [])) > 1:
+            # 키스토어: 별칭별 체인
+            self.add_keystore_to_tree(result)
+        elif len(certificates) == 1:
             # 단일 인증서
             cert_info = certificates[0]
             self.add_single_certificate_to_tree(cert_info)
@@ -1516,6 +5236,10 @@ class EnhancedSSLCertificateChecker:
             # 체인 구조로 표시
             self.add_certificate_chain_to_tree(certificates, result)
         
+        # 같은 PEM 파일의 개인키/CSR/CRL
+        if result.get('pem_blocks'):
+            self.add_pem_blocks_to_tree(result)
+        
         # 첫 번째 아이템 확장 및 선택
         if self.tree.get_children():
             first_item = self.tree.get_children()[0]
@@ -1548,8 +5272,11 @@ class EnhancedSSLCertificateChecker:
         
         # 최상위 체인 노드
         chain_icon = '✅' if '완전한 체인' in chain_status else ('⚠️' if '불완전' in chain_status else '❓')
+        chain_text = f"{chain_icon} 인증서 체인"
+        if chain_info.get('effective_not_after'):
+            chain_text += f" (~{chain_info['effective_not_after']:%Y-%m-%d})"
         chain_item = self.tree.insert('', 'end', 
-                                    text=f"{chain_icon} 인증서 체인",
+                                    text=chain_text,
                                     values=('체인 구조', chain_status, f'{len(certificates)}개 인증서'))
         
         # 각 인증서를 체인 순서대로 추가
@@ -1611,8 +5338,113 @@ class EnhancedSSLCertificateChecker:
                                    text=f"  {line}",
                                    values=('검증 결과', '', ''))
     
+    def add_pem_blocks_to_tree(self, result):
+        """인증서 외 PEM 블록 (개인키/CSR/CRL) 표시 - CSR/CRL은 이때 처음 파싱"""
+        pem_blocks = result['pem_blocks']
+        if all(block.kind == 'certificate' for block in pem_blocks):
+            return
+        
+        blocks_item = self.tree.insert('', 'end',
+                                     text="📦 PEM 블록 구성",
+                                     values=('PEM', result.get('pem_summary', ''), ''))
+        
+        if result.get('key_match'):
+            self.tree.insert(blocks_item, 'end',
+                           text=f"  🔑 {result['key_match']['message']}",
+                           values=('개인키', '', ''))
+        
+        for block in pem_blocks:
+            try:
+                if block.kind == 'csr':
+                    csr = block.parse()
+                    cn = self.extract_cn_from_subject(self.format_name(csr.subject))
+                    self.tree.insert(blocks_item, 'end',
+                                   text=f"  📝 CSR: {cn}",
+                                   values=('CSR', '✅ 서명 유효' if csr.is_signature_valid else '❌ 서명 오류',
+                                          self.get_public_key_info(csr.public_key())))
+                elif block.kind == 'crl':
+                    crl = block.parse()
+                    issuer_cn = self.extract_cn_from_subject(self.format_name(crl.issuer))
+                    self.tree.insert(blocks_item, 'end',
+                                   text=f"  📋 CRL: {issuer_cn}",
+                                   values=('CRL', f'폐기 {len(crl)}개', ''))
+                elif block.kind == 'other':
+                    self.tree.insert(blocks_item, 'end',
+                                   text=f"  ❔ {block.label}",
+                                   values=('기타', '', ''))
+            except Exception as e:
+                self.tree.insert(blocks_item, 'end',
+                               text=f"  ❌ {block.label}: 파싱 실패 ({str(e)[:50]})",
+                               values=('오류', '', ''))
+        
+        self.tree.item(blocks_item, open=True)
+    
+    def add_keystore_to_tree(self, result):
+        """키스토어의 별칭별 인증서 체인을 트리에 추가"""
+        entries = result.get('keystore_entries', [])
+        keystore_item = self.tree.insert('', 'end',
+                                       text=f"🗝️ Java 키스토어 ({result.get('keystore_type', '')})",
+                                       values=('키스토어', f'별칭 {len(entries)}개', f"{result.get('cert_count', 0)}개 인증서"))
+        
+        if result.get('keystore_warning'):
+            self.tree.insert(keystore_item, 'end',
+                           text=f"  ⚠️ {result['keystore_warning']}",
+                           values=('경고', '', ''))
+        
+        for entry in entries:
+            chain_status = entry['chain_info'].get('status', '')
+            icon = '🔑' if entry['entry_type'] == 'PrivateKeyEntry' else '📜'
+            entry_item = self.tree.insert(keystore_item, 'end',
+                                        text=f"{icon} {entry['alias']}",
+                                        values=(entry['entry_type'], chain_status,
+                                               f"{len(entry['certificates'])}개 인증서"))
+            
+            for cert_info in entry['certificates']:
+                cn = self.extract_cn_from_subject(cert_info.get('subject', ''))
+                validity_icon = self.get_validity_icon(cert_info.get('validity_status', ''))
+                cert_item = self.tree.insert(entry_item, 'end',
+                                           text=f"  📜 {cn}",
+                                           values=('인증서',
+                                                  f"{validity_icon} {cert_info.get('validity_status', '')}",
+                                                  cert_info.get('key_info', '')))
+                self.add_certificate_details_to_tree(cert_item, cert_info)
+    
     def add_certificate_details_to_tree(self, parent_item, cert_info):
         """인증서 상세 정보를 트리에 추가"""
+        self.tree_cert_map[parent_item] = cert_info
+        
+        # 파일에 없고 AIA 미러에서 보완된 인증서
+        if cert_info.get('source') == 'aia':
+            self.tree.insert(parent_item, 'end',
+                           text="  🧩 AIA 미러에서 보완됨 (파일에는 없음)",
+                           values=('AIA', '', ''))
+        
+        # 오프라인 CRL 폐기 정보
+        revocation = cert_info.get('revocation')
+        if revocation:
+            self.tree.insert(parent_item, 'end',
+                           text=f"  ⛔ 폐기됨: {revocation['revocation_date'].strftime('%Y-%m-%d')} "
+                                f"({os.path.basename(revocation['crl_path'])})",
+                           values=('CRL', '폐기', ''))
+        elif cert_info.get('revocation_status') == 'unverified':
+            self.tree.insert(parent_item, 'end',
+                           text="  ⚠️ CRL 미검증 (발급자 서명 확인 불가, 적용 안 함)",
+                           values=('CRL', '미검증', ''))
+        
+        # OCSP 실시간 확인 결과
+        ocsp_status = cert_info.get('ocsp')
+        if ocsp_status and ocsp_status['status'] in ('good', 'revoked', 'unknown', 'error', 'unverified'):
+            labels = {'good': '✅ 정상', 'revoked': '⛔ 폐기됨', 'unknown': '⚠️ 알 수 없음', 'error': '⚠️ 확인 실패',
+                      'unverified': '⚠️ 응답 미검증 (적용 안 함)'}
+            detail = ocsp_status.get('error', '')
+            if ocsp_status['status'] == 'revoked' and ocsp_status.get('revocation_time'):
+                detail = ocsp_status['revocation_time'].strftime('%Y-%m-%d')
+            elif ocsp_status['status'] != 'unverified' and ocsp_status.get('next_update'):
+                detail = f"nextUpdate {ocsp_status['next_update'].strftime('%Y-%m-%d %H:%M')}"
+            self.tree.insert(parent_item, 'end',
+                           text=f"  🌐 OCSP: {labels[ocsp_status['status']]}",
+                           values=('OCSP', detail, '' if ocsp_status.get('verified', True) else '서명 미확인'))
+        
         # Issuer 정보
         issuer = cert_info.get('issuer', '')
         if issuer != cert_info.get('subject', ''):
@@ -1645,15 +5477,6 @@ class EnhancedSSLCertificateChecker:
                            text=f"  🎯 용도: {usage}",
                            values=('용도', '', ''))
     
-    def extract_cn_from_subject(self, subject_full):
-        """Subject에서 CN 추출"""
-        if 'CN=' in subject_full:
-            try:
-                return subject_full.split('CN=')[1].split(',')[0].strip()
-            except:
-                pass
-        return subject_full if subject_full else 'Unknown'
-    
     def get_validity_icon(self, validity_status):
         """유효성 상태에 따른 아이콘 반환"""
         if '유효' in validity_status and '곧' not in validity_status:
@@ -1663,76 +5486,33 @@ class EnhancedSSLCertificateChecker:
         else:
             return "❌"
     
-    def check_certificate_connection(self, prev_issuer, current_subject):
-        """인증서 연결성 검사 - 개선된 로직"""
-        if not prev_issuer or not current_subject:
-            return "❓ 정보 불충분"
-        
-        # 1. 정확한 매칭 (기존 방식)
-        if prev_issuer.strip() == current_subject.strip():
-            return "🔗 연결됨"
-        
-        # 2. 정규화된 매칭 (공백, 순서 무시)
-        def normalize_dn(dn_string):
-            """DN 문자열을 정규화"""
-            # 쉼표로 분리하고 각 부분을 정리
-            parts = []
-            for part in dn_string.split(','):
-                part = part.strip()
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    parts.append(f"{key.strip()}={value.strip()}")
-            return sorted(parts)  # 순서 무관하게 정렬
-        
-        prev_normalized = normalize_dn(prev_issuer)
-        current_normalized = normalize_dn(current_subject)
-        
-        if prev_normalized == current_normalized:
-            return "🔗 연결됨 (정규화)"
-        
-        # 3. 핵심 필드만 비교 (CN 기준)
-        def extract_cn(dn_string):
-            """DN에서 CN만 추출"""
-            for part in dn_string.split(','):
-                part = part.strip()
-                if part.upper().startswith('CN='):
-                    return part.split('=', 1)[1].strip()
-            return None
-        
-        prev_cn = extract_cn(prev_issuer)
-        current_cn = extract_cn(current_subject)
-        
-        if prev_cn and current_cn and prev_cn == current_cn:
-            return "🔗 연결됨 (CN)"
-        
-        # 4. 부분적 매칭 확인
-        common_parts = set(prev_normalized) & set(current_normalized)
-        if len(common_parts) >= 2:  # 최소 2개 필드가 일치
-            return "🟡 부분 연결"
-        
-        # 5. 완전히 다른 경우
-        return "⚠️ 연결 끊김"
-    
     def on_tree_select(self, event):
-        """트리 선택 이벤트"""
+        """트리 선택 이벤트 - 선택한 항목(또는 가장 가까운 상위 인증서 항목)의 인증서 상세 표시"""
         selection = self.tree.selection()
-        if not selection or not self.current_result:
+        if not selection:
             return
         
-        selected_item = selection[0]
-        # 선택된 아이템의 텍스트 등으로 위치 매핑을 해도 되지만,
-        # 기본 구현은 첫 인증서를 상세보기로 표시
-        certificates = self.current_result.get('certificates', [self.current_result])
-        if certificates:
-            cert_info = certificates[0]
-            self.show_certificate_details(cert_info)
+        item = selection[0]
+        while item and item not in self.tree_cert_map:
+            item = self.tree.parent(item)
+        if item:
+            self.show_certificate_details(self.tree_cert_map[item])
+        elif self.current_result and self.current_result.get('certificates'):
+            self.show_certificate_details(self.current_result['certificates'][0])
     
-    def show_certificate_details(self, cert_info):
-        """인증서 상세 정보 표시"""
-        # 기본 정보 탭
-        self.info_text.config(state='normal')
-        self.info_text.delete(1.0, tk.END)
-        
+    def get_detail_cache_entry(self, cert_info):
+        """인증서 지문별 렌더링 캐시 항목 (최근 사용 순 LRU, DETAIL_CACHE_SIZE개까지)"""
+        key = cert_info.get('fingerprint_sha256') or id(cert_info)
+        entry = self.detail_cache.pop(key, None)
+        if entry is None:
+            entry = {'info': self.render_certificate_info(cert_info), 'extensions': None}
+            if len(self.detail_cache) >= self.DETAIL_CACHE_SIZE:
+                del self.detail_cache[next(iter(self.detail_cache))]
+        self.detail_cache[key] = entry
+        return entry
+    
+    def render_certificate_info(self, cert_info):
+        """기본 정보 탭 텍스트"""
         details = []
         details.append("=== 인증서 기본 정보 ===\n")
         details.append(f"📋 Subject: {cert_info.get('subject', 'N/A')}")
@@ -1750,6 +5530,8 @@ class EnhancedSSLCertificateChecker:
         details.append(f"   상태: {cert_info.get('validity_status', 'N/A')}")
         details.append("")
         details.append(f"🔐 공개키: {cert_info.get('key_info', 'N/A')}")
+        if cert_info.get('fingerprint_sha256'):
+            details.append(f"🔏 SHA-256 지문: {cert_info['fingerprint_sha256'].upper()}")
         details.append(f"📋 용도: {cert_info.get('usage', 'N/A')}")
         
         san_domains = cert_info.get('san_domains', [])
@@ -1758,39 +5540,92 @@ class EnhancedSSLCertificateChecker:
             details.append("🌐 도메인 (SAN):")
             for domain in san_domains:
                 details.append(f"   • {domain}")
+        return '\n'.join(details)
+    
+    def get_extension_entries(self, cert_info, entry):
+        """확장 필드 (이름, Critical 여부, 값 문자열) 목록 - 처음 볼 때 한 번만 디코딩해 캐시"""
+        if entry['extensions'] is None:
+            extensions = []
+            cert_obj = cert_info.get('cert_object')
+            if cert_obj is not None:
+                try:
+                    for ext in cert_obj.extensions:
+                        try:
+                            value = str(ext.value)
+                        except Exception:
+                            value = None
+                        extensions.append((getattr(ext.oid, '_name', str(ext.oid)), ext.critical, value))
+                except ValueError:
+                    extensions = None  # 확장 필드 디코딩 실패
+            entry['extensions'] = extensions
+        return entry['extensions']
+    
+    def show_certificate_details(self, cert_info):
+        """인증서 상세 정보 표시 (렌더링 결과는 지문별 캐시, 확장 필드 탭은 보일 때만 렌더링)"""
+        entry = self.get_detail_cache_entry(cert_info)
+        self.detail_cert_info = cert_info
         
-        self.info_text.insert(tk.END, '\n'.join(details))
+        self.info_text.config(state='normal')
+        self.info_text.delete(1.0, tk.END)
+        self.info_text.insert(tk.END, entry['info'])
         self.info_text.config(state='disabled')
         
-        # 확장 필드 탭 (간단 버전)
+        self.ext_rendered_for = None
+        if self.notebook.select() == str(self.ext_frame):
+            self.render_extensions_tab()
+    
+    def on_detail_tab_changed(self, event):
+        """확장 필드 탭으로 전환될 때 현재 인증서의 확장 필드 렌더링"""
+        if self.notebook.select() == str(self.ext_frame):
+            self.render_extensions_tab()
+    
+    def render_extensions_tab(self):
+        """확장 필드 탭 - 긴 값은 100자로 줄이고 [전체 보기]로 항목별 펼침"""
+        cert_info = self.detail_cert_info
+        if cert_info is None or self.ext_rendered_for is cert_info:
+            return
+        self.ext_rendered_for = cert_info
+        
         self.ext_text.config(state='normal')
         self.ext_text.delete(1.0, tk.END)
         
-        cert_obj = cert_info.get('cert_object')
-        if cert_obj:
-            ext_details = []
-            ext_details.append("=== 인증서 확장 필드 ===\n")
-            
-            try:
-                for ext in cert_obj.extensions:
-                    oid_name = getattr(ext.oid, '_name', str(ext.oid))
-                    critical_str = 'Critical' if ext.critical else 'Non-Critical'
-                    ext_details.append(f"• {oid_name} ({critical_str})")
-                    
-                    try:
-                        ext_value = str(ext.value)
-                        if len(ext_value) > 100:
-                            ext_value = ext_value[:100] + "... (truncated)"
-                        ext_details.append(f"  값: {ext_value}")
-                    except:
-                        ext_details.append(f"  값: <파싱 불가>")
-                    
-                    ext_details.append("")
-            except:
-                ext_details.append("확장 필드 정보를 읽을 수 없습니다.")
-            
-            self.ext_text.insert(tk.END, '\n'.join(ext_details))
+        if cert_info.get('cert_object') is not None:
+            extensions = self.get_extension_entries(cert_info, self.get_detail_cache_entry(cert_info))
+            self.ext_text.insert(tk.END, "=== 인증서 확장 필드 ===\n\n")
+            if extensions is None:
+                self.ext_text.insert(tk.END, "확장 필드 정보를 읽을 수 없습니다.")
+            for index, (name, critical, value) in enumerate(extensions or []):
+                self.ext_text.insert(tk.END, f"• {name} ({'Critical' if critical else 'Non-Critical'})\n")
+                if value is None:
+                    self.ext_text.insert(tk.END, "  값: <파싱 불가>\n\n")
+                    continue
+                self.ext_text.insert(tk.END, "  값: ")
+                if len(value) > 100:
+                    self.ext_text.insert(tk.END, value[:100] + "… ", f'ext_value_{index}')
+                    self.ext_text.insert(tk.END, "[전체 보기]", ('ext_more', f'ext_more_{index}'))
+                else:
+                    self.ext_text.insert(tk.END, value, f'ext_value_{index}')
+                self.ext_text.insert(tk.END, "\n\n")
+        
+        self.ext_text.config(state='disabled')
+    
+    def on_extension_more_click(self, event):
+        """[전체 보기] 클릭 - 해당 확장 값만 전체 문자열로 교체"""
+        position = self.ext_text.index(f"@{event.x},{event.y}")
+        index = next((int(tag[len('ext_more_'):]) for tag in self.ext_text.tag_names(position)
+                      if tag.startswith('ext_more_')), None)
+        extensions = self.get_detail_cache_entry(self.detail_cert_info)['extensions']
+        if index is None or not extensions:
+            return
         
+        self.ext_text.config(state='normal')
+        more_range = self.ext_text.tag_ranges(f'ext_more_{index}')
+        if more_range:
+            self.ext_text.delete(*more_range)
+        value_range = self.ext_text.tag_ranges(f'ext_value_{index}')
+        if value_range:
+            self.ext_text.delete(*value_range)
+            self.ext_text.insert(value_range[0], extensions[index][2], f'ext_value_{index}')
         self.ext_text.config(state='disabled')
     
     def display_error(self, error_msg):
@@ -1803,8 +5638,405 @@ class EnhancedSSLCertificateChecker:
         self.progress.stop()
 
 
+def add_isolation_arguments(parser):
+    """여러 파일을 분석하는 하위 명령의 파일별 격리 옵션"""
+    parser.add_argument('--timeout', type=float,
+                        help='파일마다 감시 작업 프로세스에서 분석하고 이 시간(초)을 넘으면 오류로 기록')
+    parser.add_argument('--memory-limit', type=int,
+                        help=f'작업 프로세스 메모리 제한 MB (--timeout과 함께, 기본 {SupervisedWorkerPool.DEFAULT_MEMORY_LIMIT_MB})')
+
+
+def build_arg_parser():
+    """명령줄 하위 명령 정의 (인자 없이 실행하면 GUI)"""
+    import argparse
+    
+    def date_argument(value):
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD입니다: {value}")
+    
+    parser = argparse.ArgumentParser(prog='ssl_checker_v3.py',
+                                     description='SSL 인증서 검사기 - 인자 없이 실행하면 GUI가 열립니다.')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    fullchain = subparsers.add_parser('fullchain', help='인증서를 중복 제거·정렬해 fullchain.pem으로 저장')
+    fullchain.add_argument('input', help='PEM/CRT/DER/PFX/키스토어 파일')
+    fullchain.add_argument('-o', '--output', default='fullchain.pem', help='출력 파일 (기본: fullchain.pem)')
+    fullchain.add_argument('--root', choices=['keep', 'drop', 'add'], default='keep',
+                           help='루트 인증서 처리: keep(그대로), drop(제외), add(AIA 미러에서 보완)')
+    fullchain.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    fullchain.add_argument('--aia-mirror', help=f'AIA 미러 폴더 (기본: {AiaMirror.DEFAULT_DIRECTORY})')
+    fullchain.add_argument('--fetch', action='store_true', help='미러에 없는 인증서를 AIA URL에서 내려받기 (네트워크 사용)')
+    
+    san_search = subparsers.add_parser('san-search', help='호스트명을 포함하는 인증서를 파일/폴더 전체에서 검색')
+    san_search.add_argument('hosts', nargs='+', help='찾을 호스트명 (*.example.com 형태도 가능)')
+    san_search.add_argument('-i', '--input', nargs='+', required=True, help='인증서 파일 또는 폴더')
+    san_search.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    add_isolation_arguments(san_search)
+    
+    verify_host = subparsers.add_parser('verify-host', help='리프 인증서가 호스트명을 포함하는지 확인 (실패 시 종료코드 1)')
+    verify_host.add_argument('input', help='PEM/CRT/DER/PFX/키스토어 파일')
+    verify_host.add_argument('hosts', nargs='*', help='확인할 호스트명')
+    verify_host.add_argument('--hosts-file', help='호스트명 목록 파일 (한 줄에 하나, #은 주석)')
+    verify_host.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    verify_host.add_argument('-q', '--quiet', action='store_true', help='실패한 호스트만 출력')
+    
+    dup_report = subparsers.add_parser('dup-report', help='인증서 중복 배포와 개인키(공개키) 재사용 보고')
+    dup_report.add_argument('input', nargs='+', help='인증서 파일 또는 폴더')
+    dup_report.add_argument('--min-locations', type=int, default=2, help='중복으로 볼 최소 배포 위치 수 (기본 2)')
+    dup_report.add_argument('--include-ca', action='store_true', help='CA 인증서도 집계')
+    dup_report.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    add_isolation_arguments(dup_report)
+    dup_report.add_argument('--json', help='보고서를 JSON 파일로도 저장')
+    
+    lint = subparsers.add_parser('lint', help='키 길이/곡선/서명 해시/유효기간/SAN/EKU 정책 점검 (error 위반 시 종료코드 1)')
+    lint.add_argument('input', nargs='+', help='인증서 파일/폴더 또는 inventory로 저장한 .ctab 파일')
+    lint.add_argument('--min-rsa-bits', type=int, default=2048, help='최소 RSA 키 길이 (기본 2048)')
+    lint.add_argument('--max-validity-days', type=int, default=398, help='리프 최대 유효기간 일수 (기본 398)')
+    lint.add_argument('--banned-curve', action='append', help='금지할 곡선 이름 (여러 번 지정 가능, 기본 secp192r1 등)')
+    lint.add_argument('--allow-sha1', action='store_true', help='SHA-1 서명 허용 (MD5는 항상 금지)')
+    lint.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    add_isolation_arguments(lint)
+    lint.add_argument('--limit', type=int, default=20, help='규칙별로 출력할 최대 위반 수 (기본 20)')
+    
+    forecast = subparsers.add_parser('forecast', help='기준일부터 주/월 단위 만료 예측과 체인별 가장 먼저 만료되는 인증서 (만료 인증서가 있으면 종료코드 1)')
+    forecast.add_argument('input', nargs='+', help='인증서 파일/폴더 또는 inventory로 저장한 .ctab 파일')
+    forecast.add_argument('--as-of', type=date_argument, help='판정 기준일 YYYY-MM-DD (UTC 자정, 기본: 현재)')
+    forecast.add_argument('--days', type=int, default=90, help='예측 기간 일수 (기본 90)')
+    forecast.add_argument('--bucket', choices=ExpiryForecast.BUCKETS, default='week', help='집계 구간 (기본 week)')
+    forecast.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    add_isolation_arguments(forecast)
+    forecast.add_argument('--limit', type=int, default=20, help='출력할 최대 체인 수 (기본 20)')
+    
+    diff = subparsers.add_parser('diff', help='두 스냅샷(.ctab)의 추가/제거/갱신/키 변경/체인 상태 변경을 NDJSON으로 출력 (변경이 있으면 종료코드 1)')
+    diff.add_argument('old', help='이전 스냅샷 .ctab (또는 인증서 폴더)')
+    diff.add_argument('new', help='새 스냅샷 .ctab 또는 지금 분석할 인증서 폴더')
+    diff.add_argument('-o', '--output', default='-', help='NDJSON 출력 파일 (기본: 표준 출력)')
+    diff.add_argument('--save', help='새 쪽 분석 결과를 다음 비교용 스냅샷(.ctab)으로 저장')
+    diff.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    add_isolation_arguments(diff)
+    
+    inventory = subparsers.add_parser('inventory', help='인증서 인벤토리를 열 지향 바이너리(.ctab) 또는 CSV로 저장')
+    inventory.add_argument('input', nargs='+', help='인증서 파일/폴더 또는 저장해 둔 .ctab 파일')
+    inventory.add_argument('-o', '--output', required=True, help='출력 파일 (.csv면 CSV, 그 외는 바이너리)')
+    inventory.add_argument('--password', default='', help='PFX/키스토어 비밀번호')
+    add_isolation_arguments(inventory)
+    
+    embedded = subparsers.add_parser('embedded', help='YAML/JSON/.env/Kubernetes Secret 등 설정 파일과 zip/tar 아카이브에 포함된 인증서 찾기')
+    embedded.add_argument('input', nargs='+', help='설정 파일, 아카이브 또는 폴더 (확장자와 무관하게 모든 파일 검사)')
+    embedded.add_argument('--max-depth', type=int, default=ArchiveScanner.MAX_DEPTH,
+                          help=f'중첩 아카이브 최대 깊이 (기본 {ArchiveScanner.MAX_DEPTH})')
+    embedded.add_argument('--max-member-size', type=int, default=ArchiveScanner.MAX_MEMBER_SIZE // (1024 * 1024),
+                          help=f'아카이브 멤버 최대 크기 MiB (기본 {ArchiveScanner.MAX_MEMBER_SIZE // (1024 * 1024)})')
+    embedded.add_argument('--password', default='', help='아카이브 안 PFX/키스토어 비밀번호')
+    embedded.add_argument('--json', help='결과를 JSON 파일로도 저장')
+    return parser
+
+
+def load_certificate_table(analyzer, paths):
+    """입력이 .ctab 파일 하나면 mmap으로 열고, 아니면 파일/폴더를 스트리밍 분석해 테이블 구성"""
+    if len(paths) == 1 and paths[0].lower().endswith('.ctab'):
+        return CertificateTable.load(paths[0])
+    table = CertificateTable()
+    try:
+        for result in analyzer.iter_analyze(analyzer.collect_certificate_files(paths)):
+            table.add_result(result)
+    finally:
+        analyzer.shutdown_pfx_pool()
+    return table
+
+
+def cli_inventory(args):
+    """inventory 하위 명령"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, file_timeout=args.timeout,
+                                   memory_limit_mb=args.memory_limit)
+    table = load_certificate_table(analyzer, args.input)
+    if args.output.lower().endswith('.csv'):
+        table.export_csv(args.output)
+    else:
+        table.save(args.output)
+    print(f"💾 인증서 {len(table)}개 (고유 문자열 {len(table.strings)}개) → {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KiB)")
+    return 0
+
+
+def cli_diff(args):
+    """diff 하위 명령 - 변경 레코드는 NDJSON으로, 요약은 표준 오류로 출력"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, file_timeout=args.timeout,
+                                   memory_limit_mb=args.memory_limit)
+    old = load_certificate_table(analyzer, [args.old])
+    new = load_certificate_table(analyzer, [args.new])
+    if args.save:
+        new.save(args.save)
+    
+    counts = dict.fromkeys(SnapshotDiff.CHANGES, 0)
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for record in SnapshotDiff(old, new).run():
+            counts[record['change']] += 1
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    print(f"🔀 인증서 {len(old)}개 → {len(new)}개: " + ', '.join(f"{change} {count}" for change, count in counts.items()),
+          file=sys.stderr)
+    if args.save:
+        print(f"💾 스냅샷 저장: {args.save}", file=sys.stderr)
+    return 1 if any(counts.values()) else 0
+
+
+def cli_embedded(args):
+    """embedded 하위 명령 - 만료되었거나 분석에 실패한 인증서가 있으면 종료 코드 1"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, pfx_workers=0)
+    archive_scanner = ArchiveScanner(args.max_depth, args.max_member_size * 1024 * 1024)
+    results = analyzer.analyze_embedded(args.input, archive_scanner=archive_scanner)
+    print(f"🔎 포함된 인증서 {len(results)}개 발견")
+    
+    problems = 0
+    report = []
+    for result in results:
+        location = result['file_path']
+        if result['embedded_offset'] is not None:
+            location += f":{result['embedded_offset']}"
+        if result.get('status') == 'error':
+            print(f"  ❌ {location}  {result.get('summary')}")
+            problems += 1
+            report.append({'location': location, 'error': result.get('summary')})
+            continue
+        # 함께 묶인 중간/루트 인증서가 먼저 만료되는 경우까지 체인 유효 만료로 판정
+        chain_info = result.get('chain_info', {})
+        expired = chain_info.get('expiry_color', result.get('validity_color')) == 'danger'
+        problems += expired
+        print(f"  {'❌' if expired else '✅'} {location}  [{result['embedded_encoding']}] "
+              f"{analyzer.extract_cn_from_subject(result.get('subject', ''))}  "
+              f"~{result['not_after']:%Y-%m-%d} ({result.get('validity_status')})  "
+              f"{chain_info.get('status', '')}")
+        if chain_info.get('expiry_before_leaf'):
+            print(f"      ⏳ 체인 유효기간 ~{chain_info['effective_not_after']:%Y-%m-%d} "
+                  f"({analyzer.extract_cn_from_subject(chain_info['expiry_subject'])}: {chain_info['expiry_status']})")
+        report.append({'location': location, 'encoding': result['embedded_encoding'],
+                       'subject': result.get('subject'), 'not_after': result['not_after'],
+                       'effective_not_after': chain_info.get('effective_not_after'),
+                       'validity_status': result.get('validity_status'),
+                       'fingerprint_sha256': result.get('fingerprint_sha256'),
+                       'chain_status': result.get('chain_info', {}).get('status')})
+    
+    if archive_scanner.skipped:
+        print(f"\n⏭️ 건너뛴 아카이브 멤버 {len(archive_scanner.skipped)}개")
+        for member_path, reason in archive_scanner.skipped:
+            print(f"  - {member_path}  ({reason})")
+            report.append({'location': member_path, 'skipped': reason})
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\n💾 JSON 저장: {args.json}")
+    return 1 if problems else 0
+
+
+def cli_lint(args):
+    """lint 하위 명령"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, file_timeout=args.timeout,
+                                   memory_limit_mb=args.memory_limit)
+    table = load_certificate_table(analyzer, args.input)
+    
+    options = {'min_rsa_bits': args.min_rsa_bits, 'max_validity_days': args.max_validity_days,
+               'banned_hashes': ('md5',) if args.allow_sha1 else ('md5', 'sha1')}
+    if args.banned_curve:
+        options['banned_curves'] = args.banned_curve
+    linter = CertificateLinter(**options)
+    findings = linter.run(table)
+    summary = linter.summarize(findings)
+    
+    print(f"🧹 인증서 {len(table)}개 정책 점검: 위반 규칙 {len(summary)}개")
+    for rule_id, severity, description, count in summary:
+        print(f"\n{'❌' if severity == 'error' else '⚠️'} [{rule_id}] {description}: {count}개")
+        for index in findings[rule_id][:args.limit]:
+            row = table.row(index)
+            print(f"    {row['file_path']}  {analyzer.extract_cn_from_subject(row['subject'])}  "
+                  f"({row['key_type']} {row['key_bits']}bit{' ' + row['curve'] if row['curve'] else ''}, "
+                  f"{row['signature_hash'] or '-'}, {row['validity_days']}일)")
+        if count > args.limit:
+            print(f"    ... 및 {count - args.limit}개 더")
+    return 1 if any(severity == 'error' for _, severity, _, _ in summary) else 0
+
+
+def cli_forecast(args):
+    """forecast 하위 명령"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, file_timeout=args.timeout,
+                                   memory_limit_mb=args.memory_limit, as_of=args.as_of)
+    table = load_certificate_table(analyzer, args.input)
+    report = ExpiryForecast(as_of=analyzer.evaluation_time(), horizon_days=args.days, bucket=args.bucket).run(table)
+    
+    print(f"📅 기준 {report['as_of']:%Y-%m-%d} • 향후 {report['horizon_days']}일 만료 예측 "
+          f"({'주' if report['bucket'] == 'week' else '월'} 단위, 인증서 {report['total']}개)")
+    label = report['label_format']
+    as_of_text, horizon_text = report['as_of'].strftime(label), report['horizon_end'].strftime(label)
+    print(f"   (~{as_of_text}: 이미 만료, {horizon_text}~: 예측 기간 이후)")
+    rows = [(f"~{as_of_text}", report['expired'])]
+    rows += [(f"{start.strftime(label)}~{end.strftime(label)}", count) for start, end, count in report['buckets']]
+    rows.append((f"{horizon_text}~", report['later']))
+    width = max(len(text) for text, _ in rows)
+    peak = max(count for _, count in rows) or 1
+    for text, count in rows:
+        print(f"  {text:<{width}} {count:>6}  {'█' * (count * 40 // peak if count else 0)}")
+    
+    horizon_end = int(report['horizon_end'].timestamp())
+    chains = [(not_after, index) for not_after, index in report['chains'] if not_after < horizon_end]
+    print(f"\n⛓️ 예측 기간 안에 만료되는 인증서가 있는 체인: {len(chains)}개 (전체 {len(report['chains'])}개)")
+    for not_after, index in chains[:args.limit]:
+        row = table.row(index)
+        mark = '❌' if row['not_after'] < report['as_of'] else '⚠️'
+        print(f"  {mark} {row['not_after']:%Y-%m-%d}  {analyzer.extract_cn_from_subject(row['subject'])}  "
+              f"({row['file_path']})")
+    if len(chains) > args.limit:
+        print(f"  ... 및 {len(chains) - args.limit}개 더")
+    return 1 if report['expired'] else 0
+
+
+def cli_dup_report(args):
+    """dup-report 하위 명령"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, file_timeout=args.timeout,
+                                   memory_limit_mb=args.memory_limit)
+    aggregator = FleetAggregator(include_ca=args.include_ca)
+    try:
+        for result in analyzer.iter_analyze(analyzer.collect_certificate_files(args.input)):
+            aggregator.add_result(result)
+    finally:
+        analyzer.shutdown_pfx_pool()
+    report = aggregator.report(args.min_locations)
+    
+    print(f"📚 파일 {report['files']}개 (실패 {report['errors']}개), 고유 인증서 {report['unique_certificates']}개")
+    print(f"\n📦 {args.min_locations}곳 이상에 배포된 인증서: {len(report['duplicates'])}개")
+    for entry in report['duplicates']:
+        print(f"  - {analyzer.extract_cn_from_subject(entry['subject'])}  "
+              f"SHA-256 {entry['fingerprint_sha256'][:16]}…  ({len(entry['locations'])}곳)")
+        for location in entry['locations']:
+            print(f"      {location}")
+    
+    print(f"\n🔁 같은 키를 쓰는 서로 다른 인증서(갱신 시 키 재사용 등): {len(report['key_reuse'])}건")
+    for group in report['key_reuse']:
+        print(f"  - SPKI {group['spki_sha256'][:16]}…  인증서 {len(group['certificates'])}개")
+        for entry in group['certificates']:
+            print(f"      {entry['not_before']:%Y-%m-%d} ~ {entry['not_after']:%Y-%m-%d}  "
+                  f"{analyzer.extract_cn_from_subject(entry['subject'])}  ({entry['locations'][0]} 외 {len(entry['locations']) - 1}곳)")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\n💾 JSON 저장: {args.json}")
+    return 0
+
+
+def cli_verify_host(args):
+    """verify-host 하위 명령 - 모든 호스트가 포함되면 0, 아니면 1, 분석 실패 시 2"""
+    hostnames = list(args.hosts)
+    if args.hosts_file:
+        with open(args.hosts_file, 'r', encoding='utf-8-sig') as f:
+            hostnames += [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    if not hostnames:
+        print("❌ 확인할 호스트명이 없습니다.", file=sys.stderr)
+        return 2
+    
+    analyzer = CertificateAnalyzer(pfx_password=args.password, pfx_workers=0)
+    result = analyzer.analyze_certificate(args.input)
+    if result.get('status') == 'error':
+        print(f"❌ {result.get('summary')}", file=sys.stderr)
+        return 2
+    try:
+        checks = analyzer.verify_hostnames(result, hostnames)
+    except ValueError as e:
+        print(f"❌ {str(e)}", file=sys.stderr)
+        return 2
+    
+    failed = [check for check in checks if not check['ok']]
+    for check in checks:
+        if check['ok'] and not args.quiet:
+            print(f"✅ {check['hostname']}  ({check['matched_by']})")
+        elif not check['ok']:
+            print(f"❌ {check['hostname']}  (일치하는 SAN 없음)")
+    print(f"{'✅' if not failed else '❌'} {len(checks) - len(failed)}/{len(checks)}개 호스트 확인")
+    return 1 if failed else 0
+
+
+def cli_san_search(args):
+    """san-search 하위 명령 - 포함하는 인증서가 없는 호스트가 있으면 종료 코드 1"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, file_timeout=args.timeout,
+                                   memory_limit_mb=args.memory_limit)
+    try:
+        results = analyzer.analyze_batch(analyzer.collect_certificate_files(args.input))
+    finally:
+        analyzer.shutdown_pfx_pool()
+    index = SanIndex.from_results(results)
+    print(f"📚 인증서 파일 {len(results)}개, SAN {index.name_count}개 색인")
+    
+    uncovered = 0
+    for hostname in args.hosts:
+        matches = index.lookup(hostname)
+        print(f"\n{'✅' if matches else '❌'} {hostname}: {len(matches)}개 인증서")
+        for match in matches:
+            entry = match['entry']
+            kind = '정확히 일치' if match['match'] == 'exact' else f"와일드카드 {match['san']}"
+            print(f"  - {entry['file_path']}  {analyzer.extract_cn_from_subject(entry['subject'])}  "
+                  f"[{kind}] {entry['validity_status']}")
+        uncovered += not matches
+    return 1 if uncovered else 0
+
+
+def cli_fullchain(args):
+    """fullchain 하위 명령"""
+    analyzer = CertificateAnalyzer(pfx_password=args.password, pfx_workers=0)
+    if args.root == 'add' or args.aia_mirror:
+        analyzer.aia_mirror = AiaMirror(args.aia_mirror, allow_fetch=args.fetch)
+    
+    result = analyzer.analyze_certificate(args.input)
+    if result.get('status') == 'error':
+        print(f"❌ {result.get('summary')}", file=sys.stderr)
+        return 2
+    
+    try:
+        report = analyzer.export_fullchain(result, args.output, args.root)
+    except Exception as e:
+        print(f"❌ 내보내기 실패: {str(e)}", file=sys.stderr)
+        return 2
+    
+    print(f"💾 {args.output} 저장 (인증서 {len(report['chain'])}개)")
+    for i, cert in enumerate(report['chain']):
+        print(f"  {i + 1}. {analyzer.format_name(cert.subject)}")
+    for note in report['notes']:
+        print(f"  - {note}")
+    return 0
+
+
+def run_cli(argv):
+    """명령줄 모드 실행 - 종료 코드 반환"""
+    args = build_arg_parser().parse_args(argv)
+    handlers = {
+        'fullchain': cli_fullchain,
+        'san-search': cli_san_search,
+        'verify-host': cli_verify_host,
+        'dup-report': cli_dup_report,
+        'lint': cli_lint,
+        'forecast': cli_forecast,
+        'inventory': cli_inventory,
+        'diff': cli_diff,
+        'embedded': cli_embedded,
+    }
+    handler = handlers.get(args.command)
+    if handler is None:
+        build_arg_parser().print_help()
+        return 1
+    return handler(args)
+
+
 def main():
     """메인 함수"""
+    # 하위 명령이 있으면 GUI 없이 명령줄 모드로 실행
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    
     # cryptography 라이브러리 확인
     try:
         import cryptography
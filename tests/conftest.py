@@ -0,0 +1,10 @@
+"""pytest 설정 - 저장소 루트를 import 경로에 추가"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTS = os.path.dirname(os.path.abspath(__file__))
+for path in (ROOT, TESTS):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,132 @@
+"""테스트용 인증서·CRL 생성 도우미 (cryptography 빌더 API, 오프라인)"""
+
+import hashlib
+import struct
+from datetime import datetime, timedelta, timezone
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import AuthorityInformationAccessOID, ExtendedKeyUsageOID, NameOID
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_key():
+    """빠른 테스트를 위해 P-256 키 사용"""
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def make_name(cn):
+    return x509.Name([
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, 'Test Org'),
+        x509.NameAttribute(NameOID.COMMON_NAME, cn),
+    ])
+
+
+def make_cert(cn, issuer=None, key=None, ca=False, days=365, san=None,
+              basic_constraints=True, ca_issuers_url=None, ocsp_url=None,
+              not_before=None, serial=None):
+    """인증서 생성 - issuer는 (인증서, 키) 튜플, 없으면 자체 서명
+
+    반환: (인증서, 키)
+    """
+    key = key or make_key()
+    issuer_cert, issuer_key = issuer if issuer else (None, key)
+    not_before = not_before or NOW - timedelta(days=1)
+    builder = (x509.CertificateBuilder()
+               .subject_name(make_name(cn))
+               .issuer_name(issuer_cert.subject if issuer_cert is not None else make_name(cn))
+               .public_key(key.public_key())
+               .serial_number(serial or x509.random_serial_number())
+               .not_valid_before(not_before)
+               .not_valid_after(not_before + timedelta(days=days)))
+    if basic_constraints:
+        builder = builder.add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+    if ca:
+        builder = builder.add_extension(x509.KeyUsage(
+            digital_signature=True, content_commitment=False, key_encipherment=False,
+            data_encipherment=False, key_agreement=False, key_cert_sign=True,
+            crl_sign=True, encipher_only=False, decipher_only=False), critical=True)
+    else:
+        builder = builder.add_extension(
+            x509.ExtendedKeyUsage([ExtendedKeyUsageOID.SERVER_AUTH]), critical=False)
+    if san:
+        builder = builder.add_extension(
+            x509.SubjectAlternativeName([x509.DNSName(name) for name in san]), critical=False)
+    access = []
+    if ocsp_url:
+        access.append(x509.AccessDescription(AuthorityInformationAccessOID.OCSP,
+                                             x509.UniformResourceIdentifier(ocsp_url)))
+    if ca_issuers_url:
+        access.append(x509.AccessDescription(AuthorityInformationAccessOID.CA_ISSUERS,
+                                             x509.UniformResourceIdentifier(ca_issuers_url)))
+    if access:
+        builder = builder.add_extension(x509.AuthorityInformationAccess(access), critical=False)
+    builder = builder.add_extension(
+        x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+    return builder.sign(issuer_key, hashes.SHA256()), key
+
+
+def make_chain(depth=3, days=365):
+    """리프 → 루트 순서의 [(인증서, 키)]"""
+    root = make_cert('Test Root CA', ca=True, days=days * 10)
+    chain = [root]
+    for level in range(depth - 2):
+        chain.append(make_cert(f'Test Intermediate CA {level + 1}', issuer=chain[-1], ca=True, days=days * 5))
+    chain.append(make_cert('leaf.example.com', issuer=chain[-1], days=days, san=['leaf.example.com']))
+    return list(reversed(chain))
+
+
+def to_pem(*certs):
+    return b''.join(cert.public_bytes(serialization.Encoding.PEM) for cert in certs)
+
+
+def make_crl(issuer, revoked_serials=(), next_update_days=7, signing_key=None):
+    """issuer=(인증서, 키)의 CRL 생성 - signing_key를 주면 다른 키로 서명 (위조 CRL)"""
+    issuer_cert, issuer_key = issuer
+    builder = (x509.CertificateRevocationListBuilder()
+               .issuer_name(issuer_cert.subject)
+               .last_update(NOW - timedelta(days=2))
+               .next_update(NOW + timedelta(days=next_update_days)))
+    for serial in revoked_serials:
+        builder = builder.add_revoked_certificate(
+            x509.RevokedCertificateBuilder()
+            .serial_number(serial)
+            .revocation_date(NOW - timedelta(days=1))
+            .build())
+    return builder.sign(signing_key or issuer_key, hashes.SHA256())
+
+
+def make_jks(entries, password='changeit'):
+    """JKS(v2) 키스토어 바이트 - entries: [(별칭, 'key' 또는 'trusted', [인증서])]
+
+    개인키 자리에는 임의 바이트를 넣습니다 (분석기는 인증서만 읽음).
+    """
+    def utf(text):
+        encoded = text.encode('utf-8')
+        return struct.pack('>H', len(encoded)) + encoded
+
+    out = struct.pack('>III', 0xFEEDFEED, 2, len(entries))
+    for alias, kind, certs in entries:
+        out += struct.pack('>I', 1 if kind == 'key' else 2) + utf(alias) + struct.pack('>Q', 0)
+        if kind == 'key':
+            out += struct.pack('>I', 5) + b'\x00' * 5 + struct.pack('>I', len(certs))
+        for cert in certs:
+            der = cert.public_bytes(serialization.Encoding.DER)
+            out += utf('X.509') + struct.pack('>I', len(der)) + der
+    return out + hashlib.sha1(password.encode('utf-16-be') + b'Mighty Aphrodite' + out).digest()
+
+
+def make_pfx(chain, password='changeit'):
+    """PKCS#12 바이트 - chain: make_chain() 결과 [(인증서, 키)] (리프 키 포함)"""
+    (leaf, key), *cas = chain
+    encryption = serialization.BestAvailableEncryption(password.encode('utf-8')) if password else serialization.NoEncryption()
+    return pkcs12.serialize_key_and_certificates(b'test', key, leaf, [cert for cert, _ in cas], encryption)
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
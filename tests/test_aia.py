@@ -0,0 +1,99 @@
+"""AiaMirror - 로컬 http.server에서 중간 인증서를 받아 미러에 저장하고 이후 오프라인으로 체인 보완"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+from helpers import make_cert, to_pem, write
+from ssl_checker_v3 import AiaMirror, CertificateAnalyzer
+
+
+class CaIssuersServer:
+    """경로 → (HTTP 상태, 본문) 을 돌려주는 caIssuers 서버"""
+
+    def __init__(self):
+        self.routes = {}
+        self.hits = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.hits.append(self.path)
+                status, body = server.routes.get(self.path, (404, b'not found'))
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    httpd = CaIssuersServer()
+    yield httpd
+    httpd.close()
+
+
+def analyze(tmp_path, mirror, leaf):
+    analyzer = CertificateAnalyzer(pfx_workers=0)
+    analyzer.aia_mirror = mirror
+    return analyzer.analyze_certificate(write(tmp_path / 'leaf.pem', to_pem(leaf)))
+
+
+def test_fetch_fills_mirror_then_works_offline(tmp_path, server):
+    root = make_cert('AIA Test Root', ca=True)
+    intermediate = make_cert('AIA Test Intermediate', issuer=root, ca=True,
+                             ca_issuers_url=server.base + '/root.der')
+    leaf = make_cert('aia.example.com', issuer=intermediate, san=['aia.example.com'],
+                     ca_issuers_url=server.base + '/intermediate.der')[0]
+    server.routes['/intermediate.der'] = (200, intermediate[0].public_bytes(serialization.Encoding.DER))
+    server.routes['/root.der'] = (200, root[0].public_bytes(serialization.Encoding.DER))
+    mirror_dir = str(tmp_path / 'mirror')
+    
+    result = analyze(tmp_path, AiaMirror(mirror_dir), leaf)
+    assert result['aia_added'] == 2
+    assert result['chain_info']['is_complete']
+    assert [info.get('source') for info in result['certificates']] == [None, 'aia', 'aia']
+    assert sorted(server.hits) == ['/intermediate.der', '/root.der']
+    assert os.path.exists(os.path.join(mirror_dir, 'index.json'))
+    
+    # 서버를 내린 뒤 새 미러 객체로 다시 실행 - 네트워크 없이 보완
+    server.close()
+    offline = AiaMirror(mirror_dir, allow_fetch=False)
+    result = analyze(tmp_path, offline, leaf)
+    assert result['aia_added'] == 2 and result['chain_info']['is_complete']
+    assert offline.http.round_trips == 0
+
+
+@pytest.mark.parametrize('route', [None, (200, b'<html>not a certificate</html>')], ids=['404', 'non-der'])
+def test_bad_ca_issuers_response_is_recorded(tmp_path, server, route):
+    root = make_cert('AIA Test Root', ca=True)
+    intermediate = make_cert('AIA Test Intermediate', issuer=root, ca=True)
+    url = server.base + '/intermediate.der'
+    leaf = make_cert('broken.example.com', issuer=intermediate, ca_issuers_url=url)[0]
+    if route:
+        server.routes['/intermediate.der'] = route
+    
+    mirror = AiaMirror(str(tmp_path / 'mirror'))
+    result = analyze(tmp_path, mirror, leaf)
+    assert 'aia_added' not in result
+    assert not result['chain_info']['is_complete']
+    assert url in mirror.failed_urls
+    assert mirror.index['urls'] == {}
+    
+    # 실패한 URL은 같은 실행에서 다시 요청하지 않음
+    analyze(tmp_path, mirror, leaf)
+    assert server.hits == ['/intermediate.der']
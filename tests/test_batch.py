@@ -0,0 +1,32 @@
+"""analyze_batch - PFX 두 단계 제출과 결과 순서"""
+
+from helpers import make_chain, make_pfx, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer
+
+
+def test_results_keep_input_order_across_pfx_waves(tmp_path):
+    paths = []
+    for directory in ('site_a', 'site_b'):
+        (tmp_path / directory).mkdir()
+        for i in range(3):
+            chain = make_chain(2)
+            # 디렉토리별 첫 PFX는 첫 단계, 나머지는 두 번째 단계로 제출되고 PEM은 그 사이에 처리
+            paths.append(write(tmp_path / directory / f'{i}.pfx', make_pfx(chain)))
+            paths.append(write(tmp_path / directory / f'{i}.pem', to_pem(chain[0][0])))
+    paths.append(str(tmp_path / 'missing.pfx'))
+    
+    analyzer = CertificateAnalyzer(pfx_password='changeit', pfx_workers=2)
+    try:
+        reported = []
+        results = analyzer.analyze_batch(paths, on_result=lambda index, result: reported.append((index, result)))
+    finally:
+        analyzer.shutdown_pfx_pool()
+    
+    assert [result['file_path'] for result in results] == paths
+    assert sorted(index for index, _ in reported) == list(range(len(paths)))
+    assert all(results[index] is result for index, result in reported)
+    assert [result.get('status') for result in results] == [None] * 12 + ['error']
+    assert [result['file_type'] for result in results[:12]] == ['.pfx', '.pem'] * 6
+    # 없는 파일은 제출 단계에서 바로 오류, PEM은 PFX 복호화를 기다리지 않고 그다음, PFX는 마지막에 보고됨
+    assert [paths[index][-4:] for index, _ in reported] == ['.pfx'] + ['.pem'] * 6 + ['.pfx'] * 6
+    assert reported[0][0] == len(paths) - 1
@@ -0,0 +1,29 @@
+"""체인 유효 만료 - 리프부터 발급 관계로 이어진 인증서만 계산"""
+
+from helpers import make_cert, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer
+
+
+def analyze(tmp_path, *certs):
+    return CertificateAnalyzer(pfx_workers=0).analyze_certificate(write(tmp_path / 'bundle.pem', to_pem(*certs)))
+
+
+def test_intermediate_expiring_first_limits_chain(tmp_path):
+    root = make_cert('Expiry Root', ca=True, days=3650)
+    intermediate = make_cert('Expiry Intermediate', issuer=root, ca=True, days=30)
+    leaf = make_cert('leaf.example.com', issuer=intermediate, days=365)
+    # 파일 순서와 관계없이 리프부터 체인을 이어 계산
+    chain_info = analyze(tmp_path, root[0], leaf[0], intermediate[0])['chain_info']
+    assert chain_info['effective_not_after'] == intermediate[0].not_valid_after_utc
+    assert chain_info['expiry_position'] == 1
+    assert chain_info['expiry_before_leaf']
+
+
+def test_unrelated_certificate_in_bundle_is_ignored(tmp_path):
+    root = make_cert('Expiry Root', ca=True, days=3650)
+    leaf = make_cert('leaf.example.com', issuer=root, days=365)
+    unrelated = make_cert('Unrelated Old CA', ca=True, days=10)
+    chain_info = analyze(tmp_path, leaf[0], root[0], unrelated[0])['chain_info']
+    assert chain_info['effective_not_after'] == leaf[0].not_valid_after_utc
+    assert chain_info['expiry_position'] == 0
+    assert not chain_info['expiry_before_leaf']
@@ -0,0 +1,88 @@
+"""CrlIndex - CRL 서명 검증 및 폐기 판정"""
+
+from helpers import make_chain, make_crl, make_key, to_pem, write
+from cryptography.hazmat.primitives import serialization
+
+from ssl_checker_v3 import AiaMirror, CertificateAnalyzer, CrlIndex
+
+
+def build(tmp_path, crl, ca_certs=()):
+    crl_dir = tmp_path / 'crl'
+    crl_dir.mkdir()
+    write(crl_dir / 'issuer.crl', crl.public_bytes(serialization.Encoding.DER))
+    for i, cert in enumerate(ca_certs):
+        write(crl_dir / f'ca{i}.crt', to_pem(cert))
+    index = CrlIndex()
+    parsed, _, errors = index.load_directory(str(crl_dir))
+    assert parsed == 1 and not errors
+    return index
+
+
+def analyze(tmp_path, index, certs, aia_mirror=None):
+    analyzer = CertificateAnalyzer(pfx_workers=0)
+    analyzer.crl_index = index
+    analyzer.aia_mirror = aia_mirror
+    return analyzer.analyze_certificate(write(tmp_path / 'chain.pem', to_pem(*certs)))
+
+
+def test_signed_crl_marks_leaf_revoked(tmp_path):
+    leaf, intermediate, root = make_chain(3)
+    index = build(tmp_path, make_crl(intermediate, [leaf[0].serial_number]))
+    result = analyze(tmp_path, index, [leaf[0], intermediate[0], root[0]])
+    leaf_info = result['certificates'][0]
+    assert leaf_info['revocation_status'] == 'revoked'
+    assert leaf_info['revocation']['crl_path'].endswith('issuer.crl')
+    assert result['chain_info']['status'].startswith('❌')
+
+
+def test_forged_crl_is_not_applied(tmp_path):
+    leaf, intermediate, root = make_chain(3)
+    forged = make_crl(intermediate, [leaf[0].serial_number], signing_key=make_key())
+    index = build(tmp_path, forged)
+    result = analyze(tmp_path, index, [leaf[0], intermediate[0], root[0]])
+    leaf_info = result['certificates'][0]
+    assert leaf_info['revocation_status'] == 'unverified'
+    assert leaf_info['revocation'] is None
+    assert not result['chain_info']['status'].startswith('❌')
+    assert 'CRL 미검증' in result['chain_info']['details']
+
+
+def test_crl_without_issuer_in_chain_is_unverified(tmp_path):
+    leaf, intermediate, _ = make_chain(3)
+    index = build(tmp_path, make_crl(intermediate, [leaf[0].serial_number]))
+    assert index.lookup(leaf[0])['status'] == 'unverified'
+    assert index.lookup(leaf[0], [intermediate[0]])['status'] == 'revoked'
+
+
+def test_stale_crl_is_flagged(tmp_path):
+    leaf, intermediate, root = make_chain(3)
+    index = build(tmp_path, make_crl(intermediate, next_update_days=-1))
+    status = index.lookup(leaf[0], [intermediate[0]])
+    assert status == {'status': 'good', 'stale': True}
+    result = analyze(tmp_path, index, [leaf[0], intermediate[0], root[0]])
+    assert 'nextUpdate' in result['chain_info']['details']
+
+
+def test_unrelated_issuer_has_no_crl(tmp_path):
+    leaf, intermediate, _ = make_chain(3)
+    other_leaf, other_intermediate, _ = make_chain(3)
+    index = build(tmp_path, make_crl(intermediate, [leaf[0].serial_number]))
+    # 같은 DN이라도 다른 키의 발급자 인증서로는 서명이 확인되지 않음
+    assert index.lookup(other_leaf[0], [other_intermediate[0]])['status'] == 'unverified'
+
+
+def test_leaf_only_file_verified_with_ca_next_to_crl(tmp_path):
+    leaf, intermediate, _ = make_chain(3)
+    index = build(tmp_path, make_crl(intermediate, [leaf[0].serial_number]), ca_certs=[intermediate[0]])
+    assert index.lookup(leaf[0])['status'] == 'revoked'
+    leaf_info = analyze(tmp_path, index, [leaf[0]])['certificates'][0]
+    assert leaf_info['revocation_status'] == 'revoked'
+
+
+def test_leaf_only_file_verified_with_aia_mirror_issuer(tmp_path):
+    leaf, intermediate, _ = make_chain(3)
+    index = build(tmp_path, make_crl(intermediate, [leaf[0].serial_number]))
+    mirror = AiaMirror(str(tmp_path / 'mirror'), allow_fetch=False)
+    mirror.store([intermediate[0]])
+    leaf_info = analyze(tmp_path, index, [leaf[0]], aia_mirror=mirror)['certificates'][0]
+    assert leaf_info['revocation_status'] == 'revoked'
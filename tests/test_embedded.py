@@ -0,0 +1,130 @@
+"""EmbeddedCertificateScanner / ArchiveScanner / analyze_embedded - 설정 파일과 아카이브에 포함된 인증서"""
+
+import base64
+import io
+import tarfile
+import textwrap
+import zipfile
+
+from cryptography.hazmat.primitives import serialization
+
+from helpers import make_chain, to_pem, write
+from ssl_checker_v3 import ArchiveScanner, CertificateAnalyzer, EmbeddedCertificateScanner
+
+
+def wrapped(data, indent='    ', width=76):
+    encoded = base64.b64encode(data).decode('ascii')
+    return '\n'.join(indent + encoded[i:i + width] for i in range(0, len(encoded), width))
+
+
+def test_yaml_block_scalar_wrapped_at_76_columns(tmp_path):
+    leaf, intermediate, _ = make_chain(3)
+    der = leaf[0].public_bytes(serialization.Encoding.DER)
+    pem_chain = to_pem(leaf[0], intermediate[0])
+    yaml = textwrap.dedent('''\
+        apiVersion: v1
+        kind: Secret
+        data:
+          ca.der: |
+        {der}
+          tls.crt: >-
+        {pem}
+          name: value
+        ''').format(der=wrapped(der), pem=wrapped(pem_chain))
+    path = write(tmp_path / 'secret.yaml', yaml.encode('ascii'))
+    
+    found = EmbeddedCertificateScanner().scan_file(path)
+    assert [e.encoding for e in found] == ['base64', 'base64']
+    assert found[0].data == der
+    assert found[1].data == pem_chain
+    assert found[0].offset == yaml.encode('ascii').index(b'MII')
+
+
+def test_unpadded_value_followed_by_another_line(tmp_path):
+    leaf = make_chain(2)[0][0]
+    der = leaf.public_bytes(serialization.Encoding.DER)
+    der += b'\x00' * (-len(der) % 3)  # 패딩 없는 base64가 되도록 길이를 3의 배수로 (뒤 바이트는 DER 밖)
+    text = f"cert: |\n{wrapped(der, '  ')}\n  trailing\n".encode('ascii')
+    found, = EmbeddedCertificateScanner().scan(text)
+    assert found.data == leaf.public_bytes(serialization.Encoding.DER)
+
+
+def test_unreadable_file_is_reported_as_error(tmp_path):
+    leaf = make_chain(2)[0][0]
+    good = write(tmp_path / 'good.env', b'CERT=' + base64.b64encode(leaf.public_bytes(serialization.Encoding.DER)))
+    missing = str(tmp_path / 'missing.yaml')
+    
+    results = CertificateAnalyzer(pfx_workers=0).analyze_embedded([good, missing])
+    assert [r.get('status') == 'error' for r in results] == [False, True]
+    error = results[1]
+    assert error['file_path'] == missing and error['embedded_offset'] is None
+    assert '파일 분석 실패' in error['summary']
+
+
+def zip_bytes(members, compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def tar_gz_bytes(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_nested_archive_members_are_scanned(tmp_path):
+    leaf = make_chain(2)[0][0]
+    der = leaf.public_bytes(serialization.Encoding.DER)
+    inner = zip_bytes([('WEB-INF/certs/leaf.der', der), ('config.yaml', b'key: value\n')])
+    path = write(tmp_path / 'app.tar.gz', tar_gz_bytes([('lib/app.jar', inner), ('tls/chain.pem', to_pem(leaf))]))
+    
+    scanner = ArchiveScanner()
+    found = list(scanner.scan_file(path))
+    assert [name[len(path):] for name, _ in found] == ['!/lib/app.jar!/WEB-INF/certs/leaf.der', '!/tls/chain.pem']
+    assert found[0][1].data == der and found[0][1].encoding == 'binary'
+    assert scanner.skipped == []
+
+
+def test_nesting_beyond_max_depth_is_skipped(tmp_path):
+    leaf = make_chain(2)[0][0]
+    innermost = zip_bytes([('leaf.pem', to_pem(leaf))])
+    path = write(tmp_path / 'outer.zip', zip_bytes([('middle.zip', zip_bytes([('inner.zip', innermost)]))]))
+    
+    scanner = ArchiveScanner(max_depth=2)
+    assert list(scanner.scan_file(path)) == []
+    assert scanner.skipped == [(f"{path}!/middle.zip!/inner.zip", "중첩 깊이 제한 (2단계)")]
+    assert len(list(ArchiveScanner(max_depth=3).scan_file(path))) == 1
+
+
+def test_member_over_size_cap_is_skipped(tmp_path):
+    leaf = make_chain(2)[0][0]
+    pem = to_pem(leaf)
+    path = write(tmp_path / 'certs.zip', zip_bytes([('big.pem', pem + b'#' * 4096), ('small.pem', pem)]))
+    
+    scanner = ArchiveScanner(max_member_size=len(pem) + 1)
+    assert [name for name, _ in scanner.scan_file(path)] == [f"{path}!/small.pem"]
+    assert [member for member, _ in scanner.skipped] == [f"{path}!/big.pem"]
+
+
+def test_corrupt_deflate_member_is_skipped_and_scan_continues(tmp_path):
+    leaf = make_chain(2)[0][0]
+    pem = to_pem(leaf)
+    data = bytearray(zip_bytes([('broken.pem', pem), ('good.pem', pem)]))
+    # 첫 멤버의 압축 데이터 시작(로컬 헤더 30바이트 + 이름)을 잘못된 deflate 블록 타입으로 덮어씀
+    data[30 + len('broken.pem')] = 0xFF
+    path = write(tmp_path / 'certs.zip', bytes(data))
+    
+    scanner = ArchiveScanner()
+    assert [name for name, _ in scanner.scan_file(path)] == [f"{path}!/good.pem"]
+    (member, reason), = scanner.skipped
+    assert member == f"{path}!/broken.pem" and reason.startswith('읽기 실패')
+    
+    results = CertificateAnalyzer(pfx_workers=0).analyze_embedded([path])
+    assert [result['file_path'] for result in results] == [f"{path}!/good.pem"]
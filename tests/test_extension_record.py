@@ -0,0 +1,22 @@
+"""확장 레코드 캐시 - 인증서마다 extract_certificate_info에서 한 번만 디코딩"""
+
+import ssl_checker_v3
+from helpers import make_chain, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer
+
+
+def test_extensions_decoded_once_per_certificate(tmp_path, monkeypatch):
+    chain = make_chain(3)
+    path = write(tmp_path / 'bundle.pem', to_pem(*(cert for cert, _ in chain)))
+    calls = []
+    decode = ssl_checker_v3.decode_extensions
+    monkeypatch.setattr(ssl_checker_v3, 'decode_extensions', lambda cert: calls.append(cert) or decode(cert))
+    
+    analyzer = CertificateAnalyzer(pfx_workers=0)
+    result = analyzer.analyze_certificate(path)
+    analyzer.verify_hostnames(result, ['leaf.example.com'])
+    data, report = analyzer.build_fullchain(result)
+    
+    assert result['chain_info']['is_complete']
+    assert report['chain'][0] == chain[0][0]
+    assert len(calls) == 3
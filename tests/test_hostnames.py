@@ -0,0 +1,63 @@
+"""SanIndex (SAN 트라이 색인)와 HostnameMatcher (RFC 6125 호스트명 검증)"""
+
+import ipaddress
+
+from ssl_checker_v3 import HostnameMatcher, SanIndex
+
+
+def result(path, *san_lists):
+    return {'file_path': path, 'certificates': [
+        {'subject': f'CN={names[0]}', 'serial': str(i), 'san_domains': list(names)}
+        for i, names in enumerate(san_lists)]}
+
+
+def test_san_index_exact_and_wildcard():
+    index = SanIndex.from_results([
+        result('a.pem', ['api.example.com', 'www.example.com']),
+        result('b.pem', ['*.example.com']),
+        result('c.pem', ['*.com']),
+    ])
+    assert index.name_count == 4
+    assert index.lookup('anything.com') == []  # 공용 접미사 와일드카드는 일치시키지 않음
+    
+    found = index.lookup('API.Example.com.')
+    assert [(m['entry']['file_path'], m['match'], m['san']) for m in found] == [
+        ('a.pem', 'exact', 'api.example.com'), ('b.pem', 'wildcard', '*.example.com')]
+    
+    # 와일드카드는 한 라벨만 대신함
+    assert index.lookup('a.b.example.com') == []
+    assert index.lookup('example.com') == []
+    assert [m['entry']['file_path'] for m in index.lookup('*.example.com')] == ['b.pem']
+
+
+def test_san_index_exact_match_not_counted_twice():
+    index = SanIndex.from_results([result('both.pem', ['*.example.com', 'api.example.com'])])
+    assert [m['match'] for m in index.lookup('api.example.com')] == ['exact']
+    assert [m['match'] for m in index.lookup('other.example.com')] == ['wildcard']
+
+
+def test_san_index_deduplicates_certificates_within_file():
+    same = {'file_path': 'dup.pem', 'certificates': [
+        {'subject': 'CN=x', 'serial': '1', 'san_domains': ['x.example.com']}] * 2}
+    assert len(SanIndex.from_results([same]).lookup('x.example.com')) == 1
+
+
+def test_hostname_matcher_rules():
+    matcher = HostnameMatcher(['www.example.com', '*.example.org', 'f*.example.net', '*.com', 'bücher.example'],
+                              [ipaddress.ip_address('192.0.2.10')])
+    assert matcher.match('WWW.example.com.') == 'www.example.com'
+    assert matcher.match('api.example.org') == '*.example.org'
+    assert matcher.match('a.b.example.org') is None
+    assert matcher.match('example.org') is None
+    assert matcher.match('foo.example.net') is None   # 부분 와일드카드 불가
+    assert matcher.match('anything.com') is None      # 라벨 하나뿐인 접미사
+    assert matcher.match('bücher.example') == 'xn--bcher-kva.example'
+    assert matcher.match('192.0.2.10') == '192.0.2.10'
+    assert matcher.match('192.0.2.11') is None
+    assert matcher.match_many(['www.example.com', 'nope.example.com']) == [
+        ('www.example.com', 'www.example.com'), ('nope.example.com', None)]
+
+
+def test_hostname_matcher_ip_not_matched_by_dns_wildcard():
+    matcher = HostnameMatcher(['*.0.2.10'])
+    assert matcher.match('192.0.2.10') is None
@@ -0,0 +1,39 @@
+"""match_key_pairs - 디렉토리의 개인키/인증서 짝 검사"""
+
+from cryptography.hazmat.primitives import serialization
+
+from helpers import make_cert, make_key, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer
+
+
+def key_pem(key):
+    return key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                             serialization.NoEncryption())
+
+
+def unsupported_key_der():
+    """알 수 없는 알고리즘 OID(1.2.3.4)의 PKCS#8 - cryptography가 UnsupportedAlgorithm을 냄"""
+    algorithm = b'\x30\x05\x06\x03\x2a\x03\x04'
+    body = b'\x02\x01\x00' + algorithm + b'\x04\x02\x04\x00'
+    return b'\x30' + bytes([len(body)]) + body
+
+
+def test_mismatch_unmatched_and_unsupported_keys(tmp_path):
+    good_cert, good_key = make_cert('good.example.com')
+    site_cert = make_cert('site.example.com')[0]
+    orphan_key = make_key()
+    write(tmp_path / 'good.crt', to_pem(good_cert))
+    write(tmp_path / 'good.key', key_pem(good_key))
+    write(tmp_path / 'site.crt', to_pem(site_cert))
+    write(tmp_path / 'site.key', key_pem(make_key()))            # 이름은 짝인데 키가 다름
+    write(tmp_path / 'orphan.key', key_pem(orphan_key) * 2)      # 같은 키가 두 번 들어 있음
+    write(tmp_path / 'unsupported.der', unsupported_key_der())
+    
+    report = CertificateAnalyzer(pfx_workers=0).match_key_pairs(str(tmp_path))
+    assert [pair['certificates'][0]['path'] for pair in report['matched']] == [str(tmp_path / 'good.crt')]
+    assert [entry['name'] for entry in report['mismatched']] == [str(tmp_path / 'site')]
+    # 불일치 짝의 키/인증서는 짝 없는 목록에 다시 나오지 않고, 같은 파일의 같은 키는 한 번만
+    assert [entry['path'] for entry in report['unmatched_keys']] == [str(tmp_path / 'orphan.key')]
+    assert report['unmatched_certs'] == []
+    assert [error['path'] for error in report['errors']] == [str(tmp_path / 'unsupported.der')]
+    assert 'Unknown key type' in report['errors'][0]['error']
@@ -0,0 +1,199 @@
+"""OcspClient - 로컬 OCSP 응답자(http.server)로 캐시·일괄 요청·단건 전환 확인"""
+
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509 import ocsp
+
+from helpers import NOW, make_cert, make_key, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer, OcspClient, _der_read, _der_sequence
+
+ECDSA_SHA256 = bytes.fromhex('300a06082a8648ce3d040302')
+OCSP_BASIC = bytes.fromhex('06092b0601050507300101')
+
+
+def tlv(tag, content):
+    length = len(content)
+    if length < 0x80:
+        header = bytes([length])
+    else:
+        raw = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+        header = bytes([0x80 | len(raw)]) + raw
+    return bytes([tag]) + header + content
+
+
+def children(data, start, end):
+    """DER 구간 안의 TLV 목록 [(태그, 전체 바이트, 내용 시작, 끝)]"""
+    items = []
+    while start < end:
+        content, item_end = _der_read(data, start)
+        items.append((data[start], data[start:item_end], content, item_end))
+        start = item_end
+    return items
+
+
+class Responder:
+    """다중 요청을 처리하는(또는 MALFORMED_REQUEST로 거부하는) 테스트용 OCSP 응답자"""
+
+    def __init__(self, issuer, single_only=False):
+        self.issuer_cert, self.issuer_key = issuer
+        self.signing_key = self.issuer_key
+        self.single_only = single_only
+        self.revoked = set()
+        self.batches = []          # 받은 요청별 인증서 수
+        self.lock_held = []        # 요청 처리 중 클라이언트 잠금 상태
+        self.client = None
+        responder = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                data = responder.respond(body)
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/ocsp-response')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/ocsp'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def split_requests(der):
+        tbs_offset, _ = _der_read(der, 0)           # OCSPRequest → TBSRequest
+        list_offset, _ = _der_read(der, tbs_offset)  # TBSRequest → requestList
+        list_start, list_end = _der_read(der, list_offset)
+        return [ocsp.load_der_ocsp_request(_der_sequence(_der_sequence(_der_sequence(item))))
+                for _, item, _, _ in children(der, list_start, list_end)]
+
+    def single_response(self, request):
+        revoked = request.serial_number in self.revoked
+        builder = ocsp.OCSPResponseBuilder().add_response_by_hash(
+            request.issuer_name_hash, request.issuer_key_hash, request.serial_number, hashes.SHA1(),
+            ocsp.OCSPCertStatus.REVOKED if revoked else ocsp.OCSPCertStatus.GOOD,
+            NOW, NOW + timedelta(hours=1), NOW - timedelta(hours=1) if revoked else None, None)
+        return builder.responder_id(ocsp.OCSPResponderEncoding.HASH, self.issuer_cert).sign(
+            self.issuer_key, hashes.SHA256())
+
+    def respond(self, body):
+        if self.client is not None:
+            self.lock_held.append(self.client.lock.locked())
+        requests = self.split_requests(body)
+        self.batches.append(len(requests))
+        if len(requests) > 1 and self.single_only:
+            return ocsp.OCSPResponseBuilder.build_unsuccessful(
+                ocsp.OCSPResponseStatus.MALFORMED_REQUEST).public_bytes(serialization.Encoding.DER)
+        
+        # 단건 응답들의 SingleResponse를 모아 ResponseData 하나로 합친 뒤 signing_key로 다시 서명
+        header, singles = b'', b''
+        for response in (self.single_response(request) for request in requests):
+            tbs = response.tbs_response_bytes
+            start, end = _der_read(tbs, 0)
+            for tag, item, content, item_end in children(tbs, start, end):
+                if tag == 0x30:
+                    singles += b''.join(child[1] for child in children(tbs, content, item_end))
+                elif not singles:
+                    header += item  # responderID, producedAt (첫 응답 기준)
+        tbs = _der_sequence(header + _der_sequence(singles))
+        signature = self.signing_key.sign(tbs, ec.ECDSA(hashes.SHA256()))
+        basic = _der_sequence(tbs + ECDSA_SHA256 + tlv(0x03, b'\x00' + signature))
+        return _der_sequence(b'\x0a\x01\x00' + tlv(0xa0, _der_sequence(OCSP_BASIC + tlv(0x04, basic))))
+
+
+@pytest.fixture
+def issuer():
+    root = make_cert('OCSP Test Root', ca=True)
+    return make_cert('OCSP Test Intermediate', issuer=root, ca=True)
+
+
+def leaves(issuer, count):
+    return [make_cert(f'host{i}.example.com', issuer=issuer)[0] for i in range(count)]
+
+
+@pytest.fixture
+def responder(issuer):
+    server = Responder(issuer)
+    yield server
+    server.close()
+
+
+def test_batched_request_and_cached_repeat(issuer, responder):
+    client = OcspClient(responder_url=responder.url)
+    responder.client = client
+    certs = leaves(issuer, 3)
+    responder.revoked.add(certs[1].serial_number)
+    
+    statuses = client.check([(cert, issuer[0]) for cert in certs])
+    assert [s['status'] for s in statuses] == ['good', 'revoked', 'good']
+    assert all(s['verified'] for s in statuses)
+    assert responder.batches == [3] and client.round_trips == 1
+    assert responder.lock_held == [False]  # HTTP 왕복 중에는 캐시 잠금을 잡지 않음
+    
+    again = client.check([(cert, issuer[0]) for cert in certs])
+    assert [s['status'] for s in again] == ['good', 'revoked', 'good']
+    assert responder.batches == [3] and client.round_trips == 1
+    client.close()
+
+
+def test_malformed_request_falls_back_to_single(issuer):
+    responder = Responder(issuer, single_only=True)
+    try:
+        client = OcspClient(responder_url=responder.url)
+        statuses = client.check([(cert, issuer[0]) for cert in leaves(issuer, 3)])
+        assert [s['status'] for s in statuses] == ['good'] * 3
+        assert responder.batches == [3, 1, 1, 1]
+        assert responder.url in client.single_only
+        
+        # 이후 요청은 처음부터 단건으로 전송
+        client.check([(cert, issuer[0]) for cert in leaves(issuer, 2)])
+        assert responder.batches[4:] == [1, 1]
+        client.close()
+    finally:
+        responder.close()
+
+
+def test_unverified_revoked_response_does_not_break_chain(tmp_path, issuer, responder):
+    leaf = make_cert('forged.example.com', issuer=issuer)[0]
+    responder.revoked.add(leaf.serial_number)
+    responder.signing_key = make_key()  # 발급자와 무관한 키로 서명된 응답
+    
+    analyzer = CertificateAnalyzer(pfx_workers=0)
+    analyzer.ocsp_client = OcspClient(responder_url=responder.url)
+    result = analyzer.analyze_certificate(write(tmp_path / 'chain.pem', to_pem(leaf, issuer[0])))
+    status_before = result['chain_info']['status']
+    analyzer.apply_ocsp_checks([result])
+    
+    ocsp_status = result['certificates'][0]['ocsp']
+    assert ocsp_status['status'] == 'unverified' and not ocsp_status['verified']
+    assert result['chain_info']['status'] == status_before
+    assert 'OCSP 폐기 응답 서명 확인 불가' in result['chain_info']['details']
+    # 서명이 확인되지 않은 응답은 캐시하지 않음
+    assert not analyzer.ocsp_client.cache
+
+
+def test_unverified_good_response_is_not_reported_good(tmp_path, issuer, responder):
+    leaf = make_cert('forged-good.example.com', issuer=issuer)[0]
+    responder.signing_key = make_key()  # 발급자와 무관한 키로 서명된 good 응답
+    
+    analyzer = CertificateAnalyzer(pfx_workers=0)
+    analyzer.ocsp_client = OcspClient(responder_url=responder.url)
+    result = analyzer.analyze_certificate(write(tmp_path / 'chain.pem', to_pem(leaf, issuer[0])))
+    analyzer.apply_ocsp_checks([result])
+    
+    ocsp_status = result['certificates'][0]['ocsp']
+    assert ocsp_status['status'] == 'unverified' and ocsp_status['reported_status'] == 'good'
+    assert 'OCSP good 응답 서명 확인 불가 (적용 안 함)' in result['chain_info']['details']
+    assert not analyzer.ocsp_client.cache
@@ -0,0 +1,63 @@
+"""SupervisedWorkerPool - 작업 프로세스 멈춤/비정상 종료 처리와 결과 직렬화"""
+
+import multiprocessing
+import os
+import pickle
+import time
+
+import pytest
+from cryptography import x509
+
+from helpers import make_chain, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer, _pack_result, _unpack_result
+
+
+def test_pack_unpack_round_trip(tmp_path):
+    chain = [cert for cert, _ in make_chain(3)]
+    path = write(tmp_path / 'chain.pem', to_pem(*chain))
+    result = CertificateAnalyzer(pfx_workers=0).analyze_file_format(path)
+    
+    packed = pickle.loads(pickle.dumps(_pack_result(result)))
+    assert not any(isinstance(info['cert_object'], x509.Certificate) for info in packed['certificates'])
+    assert all(block._parsed is None for block in packed['pem_blocks'])
+    
+    unpacked = _unpack_result(packed)
+    assert [info['cert_object'] for info in unpacked['certificates']] == chain
+    # 같은 인증서(결과의 리프와 certificates[0])는 한 번만 파싱해 같은 객체로 복원
+    assert unpacked['cert_object'] is unpacked['certificates'][0]['cert_object']
+    assert unpacked['subject'] == result['subject'] and unpacked['not_after'] == result['not_after']
+    assert unpacked['pem_blocks'][0].parse() == chain[0]
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='작업 프로세스가 테스트의 analyze_file_format 대체를 물려받으려면 fork 필요')
+def test_hung_and_crashed_workers_become_error_results(tmp_path, monkeypatch):
+    chain = [cert for cert, _ in make_chain(2)]
+    paths = [write(tmp_path / name, to_pem(*chain)) for name in ('a.pem', 'hang.pem', 'crash.pem', 'b.pem')]
+    original = CertificateAnalyzer.analyze_file_format
+    
+    def analyze_file_format(self, filepath):
+        if filepath.endswith('hang.pem'):
+            time.sleep(60)
+        if filepath.endswith('crash.pem'):
+            os._exit(3)
+        return original(self, filepath)
+    
+    monkeypatch.setattr(CertificateAnalyzer, 'analyze_file_format', analyze_file_format)
+    analyzer = CertificateAnalyzer(pfx_workers=0, file_timeout=1)
+    try:
+        reported = []
+        results = analyzer.analyze_batch(paths, on_result=lambda index, result: reported.append(index))
+        assert [result['file_path'] for result in results] == paths
+        assert sorted(reported) == [0, 1, 2, 3]
+        assert [result.get('status') for result in results] == [None, 'error', 'error', None]
+        assert '시간 초과' in results[1]['summary']
+        assert '비정상 종료 (종료 코드 3)' in results[2]['summary']
+        assert results[3]['certificates'][0]['cert_object'] == chain[0]
+        assert analyzer.supervised_pool.restarts == 2
+        
+        # 다시 띄운 작업 프로세스로 다음 배치도 계속 처리
+        again = analyzer.analyze_batch([paths[0], paths[3]])
+        assert [result.get('status') for result in again] == [None, None]
+    finally:
+        analyzer.supervised_pool.close()
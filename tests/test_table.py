@@ -0,0 +1,181 @@
+"""CertificateTable 저장/불러오기, SnapshotDiff, ExpiryForecast, CertificateLinter"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from helpers import make_cert, make_chain, to_pem, write
+from ssl_checker_v3 import CertificateAnalyzer, CertificateLinter, CertificateTable, ExpiryForecast, SnapshotDiff
+
+
+def scan(directory):
+    analyzer = CertificateAnalyzer(pfx_workers=0)
+    table = CertificateTable()
+    analyzer.analyze_batch(sorted(str(path) for path in directory.iterdir()),
+                           on_result=lambda index, result: table.add_result(result))
+    return table
+
+
+def test_save_load_round_trip(tmp_path):
+    chain = [cert for cert, _ in make_chain(3)]
+    pem_dir = tmp_path / 'certs'
+    pem_dir.mkdir()
+    write(pem_dir / 'chain.pem', to_pem(*chain))
+    table = scan(pem_dir)
+    assert len(table) == 3
+    
+    path = str(tmp_path / 'snapshot.ctab')
+    table.save(path)
+    loaded = CertificateTable.load(path)
+    assert len(loaded) == 3
+    assert [loaded.row(i) for i in range(3)] == [table.row(i) for i in range(3)]
+    assert loaded.row(0)['san_domains'] == ['leaf.example.com']
+    assert [loaded.row(i)['is_ca'] for i in range(3)] == [False, True, True]
+    assert loaded.code('leaf.example.com') is not None and loaded.code('missing') is None
+    
+    # mmap 테이블에 행을 추가하면 메모리로 복사한 뒤 계속 사용
+    loaded.append(table.row(0), 'extra.pem')
+    assert len(loaded) == 4 and loaded.row(3)['file_path'] == 'extra.pem'
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = write(tmp_path / 'bogus.ctab', b'NOTATABLE' + bytes(64))
+    with pytest.raises(ValueError):
+        CertificateTable.load(path)
+
+
+def test_snapshot_diff_renewed_key_changed_added_removed(tmp_path):
+    issuer = make_cert('Diff Test CA', ca=True)
+    kept, kept_key = make_cert('kept.example.com', issuer=issuer)
+    renewed, renewed_key = make_cert('renew.example.com', issuer=issuer)
+    rekeyed = make_cert('rekey.example.com', issuer=issuer)[0]
+    gone = make_cert('gone.example.com', issuer=issuer)[0]
+    
+    certs = tmp_path / 'certs'
+    certs.mkdir()
+    for name, cert in [('kept', kept), ('renew', renewed), ('rekey', rekeyed), ('gone', gone)]:
+        write(certs / f'{name}.pem', to_pem(cert, issuer[0]))
+    old = scan(certs)
+    
+    (certs / 'gone.pem').unlink()
+    write(certs / 'renew.pem', to_pem(make_cert('renew.example.com', issuer=issuer, key=renewed_key)[0], issuer[0]))
+    write(certs / 'rekey.pem', to_pem(make_cert('rekey.example.com', issuer=issuer)[0], issuer[0]))
+    write(certs / 'new.pem', to_pem(make_cert('new.example.com', issuer=issuer)[0], issuer[0]))
+    new = scan(certs)
+    
+    changes = sorted((c['change'], c['file_path'].rsplit('/', 1)[-1], (c.get('new') or c['old'])['subject'])
+                     for c in SnapshotDiff(old, new).run())
+    # 추가/제거된 파일은 함께 묶인 CA 인증서 행도 추가/제거로 보고됨
+    assert changes == [('added', 'new.pem', 'O=Test Org, CN=Diff Test CA'),
+                       ('added', 'new.pem', 'O=Test Org, CN=new.example.com'),
+                       ('key_changed', 'rekey.pem', 'O=Test Org, CN=rekey.example.com'),
+                       ('removed', 'gone.pem', 'O=Test Org, CN=Diff Test CA'),
+                       ('removed', 'gone.pem', 'O=Test Org, CN=gone.example.com'),
+                       ('renewed', 'renew.pem', 'O=Test Org, CN=renew.example.com')]
+
+
+def forecast_table(as_of, offsets_days):
+    """file0/file1 두 체인 - 값은 오름차순으로 주므로 앞의 두 행이 각 체인의 유효 만료 인증서"""
+    table = CertificateTable()
+    for i, days in enumerate(offsets_days):
+        table.append({'not_before': as_of - timedelta(days=400),
+                      'not_after': as_of + timedelta(days=days)}, f'file{i % 2}.pem', chain_expiry=i < 2)
+    return table
+
+
+def test_expiry_forecast_weekly_buckets():
+    as_of = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    table = forecast_table(as_of, [-3, 1, 6, 8, 20, 27, 200])
+    report = ExpiryForecast(as_of=as_of, horizon_days=28).run(table)
+    assert report['expired'] == 1 and report['later'] == 1
+    assert [count for _, _, count in report['buckets']] == [2, 1, 1, 1]
+    assert report['buckets'][0][0] == as_of and report['horizon_end'] == as_of + timedelta(days=28)
+    assert report['label_format'] == '%m-%d'
+    # 파일별 가장 먼저 만료되는 행, 만료 순
+    assert [index for _, index in report['chains']] == [0, 1]
+
+
+def test_expiry_forecast_chains_follow_linked_chain_expiry(tmp_path):
+    root = make_cert('Forecast Root', ca=True, days=3650)
+    intermediate = make_cert('Forecast Intermediate', issuer=root, ca=True, days=30)
+    leaf = make_cert('leaf.example.com', issuer=intermediate, days=365)
+    unrelated = make_cert('Unrelated Old CA', ca=True, days=10)
+    certs = tmp_path / 'certs'
+    certs.mkdir()
+    write(certs / 'bundle.pem', to_pem(leaf[0], intermediate[0], root[0], unrelated[0]))
+    table = scan(certs)
+    
+    report = ExpiryForecast(horizon_days=90).run(table)
+    # 같은 파일의 연결되지 않은 CA(10일)가 아니라 체인 유효 만료를 정한 중간 CA(30일)
+    (_, index), = report['chains']
+    assert table.row(index)['subject'].endswith('CN=Forecast Intermediate')
+    
+    # 이전 형식(chain_expiry 열 없음) 테이블은 파일별 가장 이른 not_after로 대체
+    table.missing_columns.add('chain_expiry')
+    (_, index), = ExpiryForecast(horizon_days=90).run(table)['chains']
+    assert table.row(index)['subject'].endswith('CN=Unrelated Old CA')
+
+
+def test_expiry_forecast_month_buckets_split_on_calendar_months():
+    as_of = datetime(2026, 11, 15, tzinfo=timezone.utc)
+    table = forecast_table(as_of, [5, 20, 50, 80])
+    report = ExpiryForecast(as_of=as_of, horizon_days=90, bucket='month').run(table)
+    assert [start.strftime('%Y-%m-%d') for start, _, _ in report['buckets']] == [
+        '2026-11-15', '2026-12-01', '2027-01-01', '2027-02-01']
+    assert [count for _, _, count in report['buckets']] == [1, 1, 1, 1]
+    # 예측 기간이 해를 넘기면 구간 표시에 연도 포함
+    assert report['buckets'][2][0].strftime(report['label_format']) == '27-01-01'
+
+
+def test_expiry_forecast_rejects_unknown_bucket():
+    with pytest.raises(ValueError):
+        ExpiryForecast(bucket='day')
+
+
+def test_snapshot_diff_chain_broken_when_intermediate_removed(tmp_path):
+    ca = make_cert('Diff Chain CA', ca=True)
+    leaf = make_cert('chain.example.com', issuer=ca)[0]
+    certs = tmp_path / 'certs'
+    certs.mkdir()
+    write(certs / 'chain.pem', to_pem(leaf, ca[0]))
+    old = scan(certs)
+    assert old.row(0)['chain_complete']
+    
+    write(certs / 'chain.pem', to_pem(leaf))
+    new = scan(certs)
+    changes = list(SnapshotDiff(old, new).run())
+    assert [c['change'] for c in changes] == ['removed', 'chain_broken']
+    broken = changes[-1]
+    assert broken['old']['chain_complete'] and not broken['new']['chain_complete']
+    
+    # 되돌리면 복구로 보고
+    assert [c['change'] for c in SnapshotDiff(new, old).run()] == ['added', 'chain_repaired']
+
+
+def test_snapshot_without_chain_column_skips_chain_changes(tmp_path):
+    ca = make_cert('Diff Chain CA', ca=True)
+    leaf = make_cert('chain.example.com', issuer=ca)[0]
+    certs = tmp_path / 'certs'
+    certs.mkdir()
+    write(certs / 'chain.pem', to_pem(leaf, ca[0]))
+    old = scan(certs)
+    old.missing_columns = {'chain_complete'}  # 열이 생기기 전 형식으로 저장
+    old.save(str(tmp_path / 'old.ctab'))
+    old = CertificateTable.load(str(tmp_path / 'old.ctab'))
+    assert old.missing_columns == {'chain_complete'}
+    assert len(old.columns['chain_complete']) == len(old)
+    
+    write(certs / 'chain.pem', to_pem(leaf))
+    assert [c['change'] for c in SnapshotDiff(old, scan(certs)).run()] == ['removed']
+
+
+def test_self_signed_leaf_without_basic_constraints_is_linted_as_leaf(tmp_path):
+    leaf = make_cert('selfsigned.example.com', basic_constraints=False, days=825)[0]
+    certs = tmp_path / 'certs'
+    certs.mkdir()
+    write(certs / 'selfsigned.pem', to_pem(leaf))
+    table = scan(certs)
+    assert table.row(0)['is_ca'] is False
+    findings = CertificateLinter().run(table)
+    assert findings['validity_too_long'] == [0]
+    assert findings['missing_san'] == [0]